@@ -8,13 +8,16 @@ Inspired by MetaGPT's Environment class. Provides:
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import uuid
 
 from backend.engine.role import Role, Message
 
+# Rounds a broadcast waits for watchers that have not fetched it yet
+BROADCAST_TTL_ROUNDS = 2
+
 
 @dataclass
 class Artifact:
@@ -41,6 +44,11 @@ class Artifact:
         }
 
 
+def _accepts(role: Role, msg: Message) -> bool:
+    """Whether a broadcast is relevant to role (no watch list = everything)."""
+    return not role.rc.watch or msg.cause_by in role.rc.watch
+
+
 class Environment:
     """
     Shared environment for multi-agent collaboration.
@@ -53,6 +61,9 @@ class Environment:
         self.roles: Dict[str, Role] = {}
         self.memory: List[Message] = []
         self.message_queue: List[Message] = []
+        self.round = 0
+        # Broadcast id -> (round published, accepting roles yet to fetch it)
+        self._awaiting: Dict[str, Tuple[int, Set[str]]] = {}
         self.artifacts: Dict[str, Artifact] = {}
         self.blackboard: Dict[str, Any] = {}  # Shared state
         
@@ -78,11 +89,29 @@ class Environment:
         """
         Publish a message to the environment.
         
-        Messages are stored in memory and queued for delivery.
+        Messages are stored in memory and queued for delivery. A broadcast
+        is queued only if some hired role accepts it.
         """
         self.memory.append(message)
+        if not message.sent_to:
+            watchers = {r.name for r in self.roles.values() if _accepts(r, message)}
+            if not watchers:
+                return
+            self._awaiting[message.id] = (self.round, watchers)
         self.message_queue.append(message)
     
+    def advance_round(self) -> None:
+        """Start a new round, dropping broadcasts older than BROADCAST_TTL_ROUNDS."""
+        self.round += 1
+        expired = {
+            msg_id for msg_id, (published, _) in self._awaiting.items()
+            if self.round - published >= BROADCAST_TTL_ROUNDS
+        }
+        if expired:
+            for msg_id in expired:
+                del self._awaiting[msg_id]
+            self.message_queue = [m for m in self.message_queue if m.id not in expired]
+    
     def get_messages_for_role(self, role: Role) -> List[Message]:
         """
         Get messages that a role should process.
@@ -91,6 +120,10 @@ class Environment:
         - Direct messages (sent_to matches role)
         - Watched actions (cause_by in role's watch set)
         - Broadcasts (no sent_to)
+        
+        Each message is returned to a role at most once. A broadcast stays
+        queued until every role that accepted it at publish time has
+        fetched it, or until advance_round expires it.
         """
         messages = []
         remaining = []
@@ -99,13 +132,23 @@ class Environment:
             # Direct message to this role
             if msg.sent_to == role.name:
                 messages.append(msg)
-            # Broadcast that matches watch list
-            elif not msg.sent_to and (not role.rc.watch or msg.cause_by in role.rc.watch):
+                continue
+            if msg.sent_to:
+                remaining.append(msg)
+                continue
+            
+            # Broadcast that this role still has to fetch
+            waiting = self._awaiting[msg.id][1]
+            if role.name in waiting:
+                waiting.discard(role.name)
                 messages.append(msg)
-            else:
+            
+            if waiting:
                 remaining.append(msg)
+            else:
+                del self._awaiting[msg.id]  # Every watcher has it
         
-        # Remove delivered messages from queue
+        # Remove fully delivered messages from queue
         self.message_queue = remaining
         return messages
     
@@ -17,7 +17,11 @@ from typing import Any, Dict, Optional
 
 LOG_DIR = Path("run_logs")
 AGENT_STATS_FILE = LOG_DIR / "agent_stats.json"
-_LOCK = threading.Lock()
+_LOCKS: Dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+_WRITE_LOCK = threading.Lock()
+_STATS: Dict[str, Any] | None = None
+_WRITE_PENDING = False  # Stats changed since the last snapshot was taken for disk
 
 
 def _utc_now() -> str:
@@ -28,6 +32,12 @@ def _ensure_log_dir() -> None:
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _lock_for(agent: str) -> threading.Lock:
+    """Return the stripe lock guarding a single agent's stats entry."""
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(agent, threading.Lock())
+
+
 @dataclass
 class AgentMetrics:
     agent: str
@@ -79,13 +89,20 @@ def _load_agent_stats() -> Dict[str, Any]:
         return {"updated_at": _utc_now(), "agents": {}}
 
 
-def _update_agent_stats(metrics: AgentMetrics) -> None:
-    with _LOCK:
-        _ensure_log_dir()
-        stats = _load_agent_stats()
-        agents = stats.setdefault("agents", {})
-        agent = agents.setdefault(
-            metrics.agent,
+def _stats_cache() -> Dict[str, Any]:
+    """Load agent stats from disk once and keep them in memory."""
+    global _STATS
+    with _LOCKS_GUARD:
+        if _STATS is None:
+            _STATS = _load_agent_stats()
+            _STATS.setdefault("agents", {})
+        return _STATS
+
+
+def _agent_entry(stats: Dict[str, Any], agent: str) -> Dict[str, Any]:
+    with _LOCKS_GUARD:
+        return stats["agents"].setdefault(
+            agent,
             {
                 "runs": 0,
                 "failures": 0,
@@ -98,6 +115,55 @@ def _update_agent_stats(metrics: AgentMetrics) -> None:
             },
         )
 
+
+def _snapshot_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    with _LOCKS_GUARD:
+        agents = list(stats["agents"].items())
+        updated_at = stats.get("updated_at")
+    copies = {}
+    for name, entry in agents:
+        # Writers update an entry under its stripe lock, so copy it under that too
+        with _lock_for(name):
+            copies[name] = dict(entry)
+    return {"updated_at": updated_at, "agents": copies}
+
+
+def _persist_stats(stats: Dict[str, Any]) -> None:
+    """
+    Write stats to disk without making updaters queue behind the file I/O.
+    
+    Only one thread writes at a time. A thread that finds a write in
+    progress leaves its change to that writer, which re-snapshots after
+    finishing whenever more updates came in meanwhile.
+    """
+    global _WRITE_PENDING
+    with _LOCKS_GUARD:
+        _WRITE_PENDING = True
+    while True:
+        # Checked after every release: a thread that failed to get the lock
+        # set the flag while it was held and relies on us to write for it
+        with _LOCKS_GUARD:
+            if not _WRITE_PENDING:
+                return
+        if not _WRITE_LOCK.acquire(blocking=False):
+            return
+        try:
+            with _LOCKS_GUARD:
+                pending, _WRITE_PENDING = _WRITE_PENDING, False
+            if pending:
+                _ensure_log_dir()
+                AGENT_STATS_FILE.write_text(
+                    json.dumps(_snapshot_stats(stats), indent=2), encoding="utf-8"
+                )
+        finally:
+            _WRITE_LOCK.release()
+
+
+def _update_agent_stats(metrics: AgentMetrics) -> None:
+    stats = _stats_cache()
+    with _lock_for(metrics.agent):
+        agent = _agent_entry(stats, metrics.agent)
+
         agent["runs"] += 1
         if metrics.status != "success":
             agent["failures"] += 1
@@ -113,11 +179,10 @@ def _update_agent_stats(metrics: AgentMetrics) -> None:
         agent["last_status"] = metrics.status
         agent["last_updated"] = _utc_now()
 
-        stats["updated_at"] = _utc_now()
-        AGENT_STATS_FILE.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+    stats["updated_at"] = _utc_now()
+    _persist_stats(stats)
 
 
 def get_agent_stats() -> Dict[str, Any]:
     """Return aggregate agent observability stats."""
-    with _LOCK:
-        return _load_agent_stats()
+    return _snapshot_stats(_stats_cache())
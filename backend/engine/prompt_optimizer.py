@@ -17,27 +17,167 @@ Usage:
     suggestion = optimizer.suggest_improvement("engineer")
 """
 
+import atexit
+import hashlib
 import json
 import os
+import queue
+import threading
 import time
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+import weakref
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from backend.engine.llm_gateway import llm_call_simple, extract_json
 from backend.engine.events import get_event_emitter, EngineEventType
 
+# Try to import xxhash, fallback to stdlib blake2b if not available
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Try to import orjson for fast compact serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import numpy for vectorized outcome statistics
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba to JIT the reduction kernel (requires numpy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # ─── Constants ──────────────────────────────────────────────────────────────
 
 MIN_SAMPLES_FOR_OPTIMIZATION = 5  # Minimum outcomes before suggesting
 IMPROVEMENT_CONFIDENCE_THRESHOLD = 0.7  # Only suggest if confident
+MAX_OUTCOMES_PER_AGENT = 100  # Older outcomes are dropped
+RECENT_OUTCOMES_WINDOW = 10  # Outcomes shown to the LLM analysis
+MAX_PERSISTED_IMPROVEMENTS = 50
+COMPACT_EVERY = 100  # Log lines appended before the snapshot is rewritten
+WRITE_BATCH_SIZE = 64  # Max log lines written per writer wake-up
+PROMPT_HASH_CACHE_SIZE = 256  # Distinct prompts whose hash is memoized
+STATE_FILE = "optimizer_state.json"
+LOG_FILE = "optimizer_log.jsonl"
+
+
+@lru_cache(maxsize=PROMPT_HASH_CACHE_SIZE)
+def _hash_prompt(prompt: str) -> str:
+    """
+    Short non-cryptographic identifier for a prompt (12 hex chars).
+    
+    Memoized: the same system prompt is usually recorded with every outcome,
+    so it is encoded and hashed once rather than per record.
+    """
+    data = prompt.encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64(data).hexdigest()[:12]
+    return hashlib.blake2b(data, digest_size=6).hexdigest()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes. Dataclasses are encoded field-by-field."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)  # Native dataclass support, no asdict() copy
+    return json.dumps(obj, separators=(",", ":"), default=asdict).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _stats_kernel(quality, qa, cost) -> Tuple[float, float, float]:
+    """Single-pass mean of quality, QA pass rate and cost over SoA arrays."""
+    n = quality.size
+    sum_quality = 0.0
+    sum_cost = 0.0
+    passed = 0
+    for i in range(n):
+        sum_quality += quality[i]
+        sum_cost += cost[i]
+        passed += qa[i]
+    return sum_quality / n, passed / n, sum_cost / n
+
+
+if NUMBA_AVAILABLE:
+    _stats_kernel = njit(cache=True, fastmath=True)(_stats_kernel)
+
+
+def _summarize(outcomes: Sequence["OutcomeRecord"]) -> Tuple[float, float, float]:
+    """
+    Compute (avg_quality, qa_pass_rate, avg_cost) over outcomes.
+
+    Materializes struct-of-arrays buffers and reduces them with NumPy
+    (or the numba-compiled kernel) when available.
+    """
+    n = len(outcomes)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    if NUMPY_AVAILABLE:
+        quality = np.fromiter((o.quality_score for o in outcomes), dtype=np.float64, count=n)
+        qa = np.fromiter((o.qa_passed for o in outcomes), dtype=np.bool_, count=n)
+        cost = np.fromiter((o.token_cost for o in outcomes), dtype=np.float64, count=n)
+        if NUMBA_AVAILABLE:
+            avg_quality, qa_pass_rate, avg_cost = _stats_kernel(quality, qa, cost)
+            return float(avg_quality), float(qa_pass_rate), float(avg_cost)
+        return float(quality.mean()), float(qa.mean()), float(cost.mean())
+    sum_quality = 0.0
+    sum_cost = 0.0
+    passed = 0
+    for o in outcomes:
+        sum_quality += o.quality_score
+        sum_cost += o.token_cost
+        passed += o.qa_passed
+    return sum_quality / n, passed / n, sum_cost / n
+
+
+# Static body is built once; only the small dynamic fields are %-formatted per call
+_ANALYSIS_TEMPLATE = """Analyze this agent's performance and suggest a prompt improvement.
+
+Agent: %s
+Current Average Quality: %.2f
+QA Pass Rate: %.1f%%
+Average Cost: $%.4f
+
+Recent Outcomes:
+%s
+
+Current System Prompt (first 500 chars):
+%s
+
+Suggest a specific, targeted improvement to the agent's system prompt.
+Respond in JSON:
+{
+    "improved_prompt_addition": "Text to add/modify in the prompt",
+    "reasoning": "Why this will help",
+    "confidence": 0.8,
+    "expected_improvement": "What should improve"
+}"""
 
 
 # ─── Outcome Record ────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class OutcomeRecord:
     """Record of an agent's performance on a task."""
     agent_name: str
@@ -49,23 +189,98 @@ class OutcomeRecord:
     judge_score: Optional[float]
     hitl_feedback: str
     timestamp: float
+    _summary_line: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _timestamp_iso: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Format once at creation instead of on every serialization
+        self._timestamp_iso = datetime.fromtimestamp(self.timestamp).isoformat()
+    
+    def summary_line(self) -> str:
+        """One-line summary for LLM analysis, formatted once per record."""
+        if self._summary_line is None:
+            self._summary_line = (
+                f"- Quality: {self.quality_score:.2f}, QA: {'PASS' if self.qa_passed else 'FAIL'}, "
+                f"Cost: ${self.token_cost:.4f}, Feedback: {self.hitl_feedback or 'none'}"
+            )
+        return self._summary_line
     
     def to_dict(self) -> dict:
+        """Persistence form; raw floats (display rounding happens in get_stats)."""
         return {
             "agent_name": self.agent_name,
+            "prompt_hash": self.prompt_hash,
             "prompt_summary": self.prompt_summary,
-            "quality_score": round(self.quality_score, 3),
-            "token_cost": round(self.token_cost, 6),
+            "quality_score": self.quality_score,
+            "token_cost": self.token_cost,
             "qa_passed": self.qa_passed,
             "judge_score": self.judge_score,
             "hitl_feedback": self.hitl_feedback,
-            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "timestamp": self._timestamp_iso,
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "OutcomeRecord":
+        return cls(
+            agent_name=data["agent_name"],
+            prompt_hash=data.get("prompt_hash", ""),
+            prompt_summary=data.get("prompt_summary", ""),
+            quality_score=data.get("quality_score", 0.0),
+            token_cost=data.get("token_cost", 0.0),
+            qa_passed=data.get("qa_passed", True),
+            judge_score=data.get("judge_score"),
+            hitl_feedback=data.get("hitl_feedback", ""),
+            timestamp=datetime.fromisoformat(data["timestamp"]).timestamp(),
+        )
 
 
-# ─── Prompt Improvement ────────────────────────────────────────────────────
+# ─── Rolling Stats ─────────────────────────────────────────────────────────
 
 @dataclass
+class AgentStats:
+    """Running aggregates over an agent's retained outcomes."""
+    samples: int = 0
+    sum_quality: float = 0.0
+    sum_cost: float = 0.0
+    qa_passed: int = 0
+    evictions: int = 0  # Outcomes dropped since the last exact resync
+    
+    def add(self, record: OutcomeRecord) -> None:
+        self.samples += 1
+        self.sum_quality += record.quality_score
+        self.sum_cost += record.token_cost
+        self.qa_passed += record.qa_passed
+    
+    def remove(self, record: OutcomeRecord) -> None:
+        self.samples -= 1
+        self.sum_quality -= record.quality_score
+        self.sum_cost -= record.token_cost
+        self.qa_passed -= record.qa_passed
+        self.evictions += 1
+    
+    def averages(self) -> Tuple[float, float, float]:
+        """Return (avg_quality, qa_pass_rate, avg_cost)."""
+        if self.samples == 0:
+            return 0.0, 0.0, 0.0
+        n = self.samples
+        return self.sum_quality / n, self.qa_passed / n, self.sum_cost / n
+    
+    @classmethod
+    def from_outcomes(cls, outcomes: Sequence[OutcomeRecord]) -> "AgentStats":
+        """Recompute aggregates exactly (clears floating-point drift)."""
+        n = len(outcomes)
+        avg_quality, qa_pass_rate, avg_cost = _summarize(outcomes)
+        return cls(
+            samples=n,
+            sum_quality=avg_quality * n,
+            sum_cost=avg_cost * n,
+            qa_passed=round(qa_pass_rate * n),
+        )
+
+
+# ─── Prompt Improvement ────────────────────────────────────────────────────
+
+@dataclass(slots=True)
 class PromptImprovement:
     """A suggested improvement to an agent's prompt."""
     agent_name: str
@@ -90,6 +305,16 @@ class PromptImprovement:
 
 # ─── Prompt Optimizer ──────────────────────────────────────────────────────
 
+_INSTANCES: "weakref.WeakSet[PromptOptimizer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all() -> None:
+    """Drain and compact every live optimizer before the interpreter exits."""
+    for optimizer in list(_INSTANCES):
+        optimizer.close()
+
+
 class PromptOptimizer:
     """
     Analyzes agent performance and suggests prompt improvements.
@@ -108,13 +333,26 @@ class PromptOptimizer:
     
     def __init__(self, data_path: str = "optimizer_data"):
         self.data_path = data_path
-        self._outcomes: Dict[str, List[OutcomeRecord]] = {}  # agent -> outcomes
+        self._outcomes: Dict[str, Deque[OutcomeRecord]] = {}  # agent -> last N outcomes
+        self._stats: Dict[str, AgentStats] = {}  # agent -> running aggregates
         self._improvements: List[PromptImprovement] = []
         self._original_prompts: Dict[str, str] = {}  # agent -> original prompt
         self.events = get_event_emitter()
+        self._log_handle = None  # Append-only log, opened lazily (writer thread only)
+        self._log_lines = 0  # Lines appended since last compaction
+        self._lock = threading.Lock()  # Guards outcomes/improvements vs. compaction
+        self._write_queue: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._closing = threading.Event()
         
         # Load persisted data if exists
         self._load_data()
+        
+        # Persistence runs on a background writer so record_outcome never blocks on disk
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="prompt_optimizer_writer", daemon=True
+        )
+        self._writer_thread.start()
+        _INSTANCES.add(self)
     
     def record_outcome(
         self,
@@ -138,8 +376,7 @@ class PromptOptimizer:
             judge_score: Score from judge agent
             hitl_feedback: User feedback from HITL
         """
-        import hashlib
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:12]
+        prompt_hash = _hash_prompt(prompt)
         
         record = OutcomeRecord(
             agent_name=agent_name,
@@ -153,16 +390,27 @@ class PromptOptimizer:
             timestamp=time.time(),
         )
         
-        if agent_name not in self._outcomes:
-            self._outcomes[agent_name] = []
-        self._outcomes[agent_name].append(record)
+        with self._lock:
+            if agent_name not in self._outcomes:
+                self._outcomes[agent_name] = deque(maxlen=MAX_OUTCOMES_PER_AGENT)
+                self._stats[agent_name] = AgentStats()
+            outcomes = self._outcomes[agent_name]
+            stats = self._stats[agent_name]
+            
+            # Keep aggregates in step with the deque's eviction
+            if len(outcomes) == outcomes.maxlen:
+                stats.remove(outcomes[0])
+            outcomes.append(record)
+            stats.add(record)
+            if stats.evictions >= MAX_OUTCOMES_PER_AGENT:
+                self._stats[agent_name] = AgentStats.from_outcomes(outcomes)
+            
+            # Persist (queued under the lock so compaction sees a consistent log)
+            self._append_log("outcome", record.to_dict())
         
         # Store original prompt for comparison
         if agent_name not in self._original_prompts:
             self._original_prompts[agent_name] = prompt
-        
-        # Persist
-        self._save_data()
     
     def suggest_improvement(self, agent_name: str) -> Optional[PromptImprovement]:
         """
@@ -174,51 +422,31 @@ class PromptOptimizer:
         Returns:
             PromptImprovement or None if insufficient data
         """
-        outcomes = self._outcomes.get(agent_name, [])
-        
-        if len(outcomes) < MIN_SAMPLES_FOR_OPTIMIZATION:
-            return None
-        
-        # Calculate stats
-        avg_quality = sum(o.quality_score for o in outcomes) / len(outcomes)
-        qa_pass_rate = sum(1 for o in outcomes if o.qa_passed) / len(outcomes)
-        avg_cost = sum(o.token_cost for o in outcomes) / len(outcomes)
+        # Snapshot under the lock; record_outcome mutates the deque and stats
+        with self._lock:
+            outcomes = self._outcomes.get(agent_name, ())
+            if len(outcomes) < MIN_SAMPLES_FOR_OPTIMIZATION:
+                return None
+            avg_quality, qa_pass_rate, avg_cost = self._stats[agent_name].averages()
+            recent = list(islice(outcomes, max(0, len(outcomes) - RECENT_OUTCOMES_WINDOW), None))
         
         # Only suggest if performance is below threshold
         if avg_quality > 0.85 and qa_pass_rate > 0.9:
             return None  # Already performing well
         
         # Build analysis prompt
-        recent = outcomes[-10:]  # Last 10 outcomes
-        outcome_summary = "\n".join([
-            f"- Quality: {o.quality_score:.2f}, QA: {'PASS' if o.qa_passed else 'FAIL'}, "
-            f"Cost: ${o.token_cost:.4f}, Feedback: {o.hitl_feedback or 'none'}"
-            for o in recent
-        ])
+        outcome_summary = "\n".join(o.summary_line() for o in recent)
         
         original_prompt = self._original_prompts.get(agent_name, "Unknown")
         
-        analysis_prompt = f"""Analyze this agent's performance and suggest a prompt improvement.
-
-Agent: {agent_name}
-Current Average Quality: {avg_quality:.2f}
-QA Pass Rate: {qa_pass_rate:.1%}
-Average Cost: ${avg_cost:.4f}
-
-Recent Outcomes:
-{outcome_summary}
-
-Current System Prompt (first 500 chars):
-{original_prompt[:500]}
-
-Suggest a specific, targeted improvement to the agent's system prompt.
-Respond in JSON:
-{{
-    "improved_prompt_addition": "Text to add/modify in the prompt",
-    "reasoning": "Why this will help",
-    "confidence": 0.8,
-    "expected_improvement": "What should improve"
-}}"""
+        analysis_prompt = _ANALYSIS_TEMPLATE % (
+            agent_name,
+            avg_quality,
+            qa_pass_rate * 100,
+            avg_cost,
+            outcome_summary,
+            original_prompt[:500],
+        )
 
         response = llm_call_simple(
             agent_name="prompt_optimizer",
@@ -249,7 +477,9 @@ Respond in JSON:
             created_at=datetime.utcnow().isoformat(),
         )
         
-        self._improvements.append(improvement)
+        with self._lock:
+            self._improvements.append(improvement)
+            self._append_log("improvement", improvement)
         
         self.events.emit(EngineEventType.AGENT_STATUS, {
             "agent": "prompt_optimizer",
@@ -264,15 +494,16 @@ Respond in JSON:
     def get_stats(self, agent_name: Optional[str] = None) -> Dict[str, Any]:
         """Get optimization statistics."""
         if agent_name:
-            outcomes = self._outcomes.get(agent_name, [])
-            if not outcomes:
+            stats = self._stats.get(agent_name)
+            if not stats or not stats.samples:
                 return {"agent": agent_name, "samples": 0}
+            avg_quality, qa_pass_rate, avg_cost = stats.averages()
             return {
                 "agent": agent_name,
-                "samples": len(outcomes),
-                "avg_quality": round(sum(o.quality_score for o in outcomes) / len(outcomes), 3),
-                "qa_pass_rate": round(sum(1 for o in outcomes if o.qa_passed) / len(outcomes), 3),
-                "avg_cost": round(sum(o.token_cost for o in outcomes) / len(outcomes), 6),
+                "samples": stats.samples,
+                "avg_quality": round(avg_quality, 3),
+                "qa_pass_rate": round(qa_pass_rate, 3),
+                "avg_cost": round(avg_cost, 6),
                 "improvements_suggested": sum(1 for i in self._improvements if i.agent_name == agent_name),
             }
         
@@ -286,33 +517,144 @@ Respond in JSON:
         """Get all suggested improvements."""
         return [i.to_dict() for i in self._improvements]
     
+    def close(self) -> None:
+        """Drain pending writes, compact the log into the snapshot, and stop the writer."""
+        if self._writer_thread.is_alive():
+            self._closing.set()
+            self._write_queue.put(None)  # Wake the writer
+            self._writer_thread.join()
+        if self._log_lines:
+            self._save_data()
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
+    
+    def _append_log(self, kind: str, payload: Any) -> None:
+        """Queue one log record for the background writer. Caller holds self._lock."""
+        try:
+            self._write_queue.put(_dumps({"kind": kind, "data": payload}) + b"\n")
+        except Exception:
+            pass  # Don't crash on persistence failure
+    
+    def _writer_loop(self) -> None:
+        """Drain queued log lines in batches; compact every COMPACT_EVERY lines."""
+        while True:
+            batch = []
+            line = self._write_queue.get()
+            while True:
+                if line is not None:
+                    batch.append(line)
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    break
+                try:
+                    line = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                self._write_batch(batch)
+            if self._closing.is_set() and self._write_queue.empty():
+                return
+    
+    def _write_batch(self, batch: List[bytes]) -> None:
+        try:
+            if self._log_handle is None:
+                os.makedirs(self.data_path, exist_ok=True)
+                self._log_handle = open(os.path.join(self.data_path, LOG_FILE), 'ab')
+            self._log_handle.write(b"".join(batch))
+            self._log_handle.flush()
+            self._log_lines += len(batch)
+            if self._log_lines >= COMPACT_EVERY:
+                self._save_data()
+        except Exception:
+            pass  # Don't crash on persistence failure
+    
     def _save_data(self) -> None:
-        """Persist optimizer data."""
+        """
+        Compact optimizer state into the snapshot and truncate the log.
+        
+        Called from the writer thread, or from close() once it has stopped.
+        """
         try:
             os.makedirs(self.data_path, exist_ok=True)
+            with self._lock:
+                outcomes = {agent: list(records) for agent, records in self._outcomes.items()}
+                improvements = self._improvements[-MAX_PERSISTED_IMPROVEMENTS:]
+                # Lines still queued describe state already in this snapshot
+                while True:
+                    try:
+                        self._write_queue.get_nowait()
+                    except queue.Empty:
+                        break
             data = {
                 "outcomes": {
-                    agent: [o.to_dict() for o in outcomes[-100:]]  # Keep last 100
-                    for agent, outcomes in self._outcomes.items()
+                    agent: [o.to_dict() for o in records]  # Already capped
+                    for agent, records in outcomes.items()
                 },
-                "improvements": [i.to_dict() for i in self._improvements[-50:]],
+                "improvements": improvements,
             }
-            filepath = os.path.join(self.data_path, "optimizer_state.json")
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            filepath = os.path.join(self.data_path, STATE_FILE)
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(data))
+            os.replace(tmp_path, filepath)
+            
+            if self._log_handle is not None:
+                self._log_handle.truncate(0)
+            else:
+                open(os.path.join(self.data_path, LOG_FILE), 'wb').close()
+            self._log_lines = 0
         except Exception:
             pass  # Don't crash on persistence failure
     
     def _load_data(self) -> None:
-        """Load persisted optimizer data."""
-        filepath = os.path.join(self.data_path, "optimizer_state.json")
+        """Load the persisted snapshot, then replay the append-only log."""
+        outcomes: Dict[str, List[dict]] = {}
+        improvements: List[dict] = []
+        
+        filepath = os.path.join(self.data_path, STATE_FILE)
         if os.path.exists(filepath):
             try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                # We only load stats, not full records (they're already summarized)
+                with open(filepath, 'rb') as f:
+                    data = _loads(f.read())
+                outcomes = data.get("outcomes", {})
+                improvements = data.get("improvements", [])
+            except Exception:
+                pass
+        
+        log_path = os.path.join(self.data_path, LOG_FILE)
+        if os.path.exists(log_path):
+            try:
+                with open(log_path, 'rb') as f:
+                    for line in f:
+                        try:
+                            entry = _loads(line)
+                        except ValueError:
+                            continue  # Torn write at the tail
+                        self._log_lines += 1
+                        if entry["kind"] == "outcome":
+                            outcomes.setdefault(entry["data"]["agent_name"], []).append(entry["data"])
+                        elif entry["kind"] == "improvement":
+                            improvements.append(entry["data"])
             except Exception:
                 pass
+        
+        for agent_name, records in outcomes.items():
+            try:
+                restored = deque(
+                    (OutcomeRecord.from_dict(r) for r in records),
+                    maxlen=MAX_OUTCOMES_PER_AGENT,
+                )
+            except Exception:
+                continue
+            self._outcomes[agent_name] = restored
+            self._stats[agent_name] = AgentStats.from_outcomes(restored)
+        
+        for item in improvements[-MAX_PERSISTED_IMPROVEMENTS:]:
+            try:
+                self._improvements.append(PromptImprovement(**item))
+            except TypeError:
+                continue
 
 
 # ─── Global Instance ────────────────────────────────────────────────────────
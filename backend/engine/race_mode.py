@@ -12,10 +12,12 @@ Usage:
 """
 
 import asyncio
+import concurrent.futures
+import time
 import uuid
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
 from backend.engine.events import get_event_emitter, EngineEventType
 from backend.engine.sandbox import get_sandbox_manager
@@ -23,9 +25,35 @@ from backend.engine.atoms_engine import AtomsEngine
 from backend.agents.judge_agent import JudgeAgent, Solution, JudgeVerdict
 
 
+def _iso(ts: Optional[float]) -> Optional[str]:
+    """Format an epoch timestamp as UTC ISO-8601 (only when serialized)."""
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+# ─── Process Worker ──────────────────────────────────────────────────────────
+
+def _run_engine(run_id: str, prompt: str) -> Dict[str, Any]:
+    """
+    Run a team's pipeline inside a worker process.
+    
+    Engines aren't picklable, so the worker builds its own and only
+    serializable dicts cross the process boundary: {"result", "cost"} on
+    success, {"error", "cost"} on failure. The cost summary comes back
+    either way, since the parent has no engine of its own to ask.
+    """
+    engine = AtomsEngine(run_id=run_id)
+    try:
+        result = engine.run(prompt)
+    except Exception as e:
+        return {"error": str(e), "cost": engine.get_cost_summary()}
+    return {"result": result, "cost": engine.get_cost_summary()}
+
+
 # ─── Race Result ─────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class RaceResult:
     """Result from a race mode execution."""
     race_id: str
@@ -48,17 +76,29 @@ class RaceResult:
 
 # ─── Race Team ───────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class RaceTeam:
     """A team competing in race mode."""
     team_id: str
-    engine: AtomsEngine
+    run_id: str
+    engine: Optional[AtomsEngine] = None  # None when the team runs in a worker process
     sandbox_id: str = ""
     status: str = "pending"  # pending, running, completed, failed
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
+    started_at_ts: Optional[float] = None  # Epoch seconds
+    completed_at_ts: Optional[float] = None
+    cost: Dict[str, Any] = field(default_factory=dict)  # Engine cost summary once finished
+    
+    def to_dict(self) -> dict:
+        return {
+            "team_id": self.team_id,
+            "sandbox_id": self.sandbox_id,
+            "status": self.status,
+            "error": self.error,
+            "started_at": _iso(self.started_at_ts),
+            "completed_at": _iso(self.completed_at_ts),
+        }
 
 
 # ─── Race Mode ───────────────────────────────────────────────────────────────
@@ -72,18 +112,34 @@ class RaceMode:
     A JudgeAgent evaluates all results and picks a winner.
     """
     
-    def __init__(self, num_teams: int = 2):
+    def __init__(self, num_teams: int = 2, use_processes: bool = False):
         """
         Initialize race mode.
         
         Args:
             num_teams: Number of competing teams (2-5)
+            use_processes: Run each team in its own worker process to
+                bypass the GIL. Engine events are emitted inside the worker
+                and do not reach this process's event stream.
         """
         self.num_teams = max(2, min(num_teams, 5))
         self.judge = JudgeAgent()
         self.events = get_event_emitter()
         self.sandbox_mgr = get_sandbox_manager()
         self._history: List[RaceResult] = []
+        # Dedicated pool sized to the race so teams don't contend on the default executor
+        self.use_processes = False
+        self._pool: concurrent.futures.Executor
+        if use_processes:
+            try:
+                self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.num_teams)
+                self.use_processes = True
+            except (NotImplementedError, OSError):
+                pass  # No multiprocessing support here, fall back to threads
+        if not self.use_processes:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.num_teams, thread_name_prefix="race"
+            )
     
     async def race(self, prompt: str) -> RaceResult:
         """
@@ -96,7 +152,7 @@ class RaceMode:
             RaceResult with winner, verdict, and all solutions
         """
         race_id = f"race_{uuid.uuid4().hex[:8]}"
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         
         self._emit_event("RACE_STARTED", {
             "race_id": race_id,
@@ -104,17 +160,22 @@ class RaceMode:
             "prompt": prompt[:200],
         })
         
-        # Create teams
-        teams = []
-        for i in range(self.num_teams):
-            team_id = f"team_{chr(65 + i)}"  # team_A, team_B, etc.
-            engine = AtomsEngine(run_id=f"{race_id}_{team_id}")
-            sandbox = self.sandbox_mgr.create_sandbox(f"{race_id}_{team_id}")
-            teams.append(RaceTeam(
+        # Create teams (sandbox setup touches disk, so do it concurrently)
+        team_ids = [f"team_{chr(65 + i)}" for i in range(self.num_teams)]  # team_A, team_B, etc.
+        sandboxes = await asyncio.gather(*(
+            self.sandbox_mgr.acreate_sandbox(f"{race_id}_{team_id}")
+            for team_id in team_ids
+        ))
+        teams = [
+            RaceTeam(
                 team_id=team_id,
-                engine=engine,
+                run_id=f"{race_id}_{team_id}",
+                # Process-mode teams build their engine inside the worker
+                engine=None if self.use_processes else AtomsEngine(run_id=f"{race_id}_{team_id}"),
                 sandbox_id=sandbox.id,
-            ))
+            )
+            for team_id, sandbox in zip(team_ids, sandboxes)
+        ]
         
         # Run all teams in parallel
         tasks = [
@@ -143,7 +204,7 @@ class RaceMode:
                     token_cost=cost,
                 ))
             else:
-                total_cost += team.engine.get_cost_summary().get("total_cost_usd", 0)
+                total_cost += team.cost.get("total_cost_usd", 0)
         
         # Judge evaluates
         self._emit_event("RACE_JUDGING", {
@@ -163,7 +224,7 @@ class RaceMode:
             verdict = self.judge.evaluate(solutions)
         
         # Calculate duration
-        duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+        duration_ms = (time.monotonic_ns() - start_ns) / 1e6
         
         result = RaceResult(
             race_id=race_id,
@@ -177,15 +238,18 @@ class RaceMode:
         self._history.append(result)
         
         # Cleanup sandboxes
-        for team in teams:
-            if team.sandbox_id:
-                self.sandbox_mgr.destroy_sandbox(team.sandbox_id)
+        await asyncio.gather(*(
+            self.sandbox_mgr.adestroy_sandbox(team.sandbox_id)
+            for team in teams
+            if team.sandbox_id
+        ), return_exceptions=True)
         
         self._emit_event("RACE_COMPLETED", {
             "race_id": race_id,
             "winner": verdict.winner_team_id,
             "duration_ms": duration_ms,
             "total_cost": total_cost,
+            "teams": [team.to_dict() for team in teams],
         })
         
         return result
@@ -193,18 +257,30 @@ class RaceMode:
     async def _run_team(self, team: RaceTeam, prompt: str) -> None:
         """Run a single team's pipeline."""
         team.status = "running"
-        team.started_at = datetime.utcnow().isoformat()
+        team.started_at_ts = time.time()
         
         self._emit_event("TEAM_STARTED", {
             "team_id": team.team_id,
         })
         
         try:
-            # Run the engine pipeline in a thread pool (it's sync)
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, team.engine.run, prompt
-            )
+            # Run the engine pipeline in the worker pool (it's sync)
+            loop = asyncio.get_running_loop()
+            if self.use_processes:
+                outcome = await loop.run_in_executor(
+                    self._pool, _run_engine, team.run_id, prompt
+                )
+                team.cost = outcome["cost"]
+                if "error" in outcome:
+                    raise RuntimeError(outcome["error"])
+                result = outcome["result"]
+            else:
+                try:
+                    result = await loop.run_in_executor(
+                        self._pool, team.engine.run, prompt
+                    )
+                finally:
+                    team.cost = team.engine.get_cost_summary()
             
             team.result = result
             team.status = "completed"
@@ -218,7 +294,11 @@ class RaceMode:
                 "error": str(e)[:500],
             })
         
-        team.completed_at = datetime.utcnow().isoformat()
+        team.completed_at_ts = time.time()
+    
+    def close(self) -> None:
+        """Release the team worker pool."""
+        self._pool.shutdown(wait=False)
     
     def get_history(self) -> List[dict]:
         """Get race history."""
@@ -238,9 +318,9 @@ class RaceMode:
 _race_mode: Optional[RaceMode] = None
 
 
-def get_race_mode(num_teams: int = 2) -> RaceMode:
+def get_race_mode(num_teams: int = 2, use_processes: bool = False) -> RaceMode:
     """Get global race mode instance."""
     global _race_mode
     if _race_mode is None:
-        _race_mode = RaceMode(num_teams=num_teams)
+        _race_mode = RaceMode(num_teams=num_teams, use_processes=use_processes)
     return _race_mode
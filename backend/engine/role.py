@@ -23,6 +23,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Type, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+import itertools
+import os
 import uuid
 import json
 
@@ -40,30 +42,47 @@ class RoleState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# Message IDs: random per-process prefix + monotonic counter (cheaper than uuid4)
+_MESSAGE_ID_PREFIX = os.urandom(4).hex()
+_message_counter = itertools.count()
+
+
+def _next_message_id() -> str:
+    return f"{_MESSAGE_ID_PREFIX}-{next(_message_counter):x}"
+
+
+@dataclass(slots=True)
 class Message:
     """Message passed between agents."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_message_id)
     content: str = ""
     role: str = ""  # sender role name
     cause_by: str = ""  # action that caused this message
     sent_to: str = ""  # recipient role name (empty = broadcast)
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "content": self.content,
-            "role": self.role,
-            "cause_by": self.cause_by,
-            "sent_to": self.sent_to,
-            "timestamp": self.timestamp.isoformat(),
-            "metadata": self.metadata,
-        }
+        """
+        Serialize to a fresh dict the caller may modify.
+        
+        The fixed fields are formatted once (messages are not modified after
+        they are sent); metadata is copied on every call.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "content": self.content,
+                "role": self.role,
+                "cause_by": self.cause_by,
+                "sent_to": self.sent_to,
+                "timestamp": self.timestamp.isoformat(),
+            }
+        return {**self._dict_cache, "metadata": dict(self.metadata)}
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleContext:
     """Runtime context for a role."""
     env: Any = None  # Environment reference
@@ -73,6 +92,7 @@ class RoleContext:
     todo: Any = None  # Current action to execute
     news: List[Message] = field(default_factory=list)  # New messages to process
     watch: Set[str] = field(default_factory=set)  # Actions to watch for
+    _watched_memory: List[Message] = field(default_factory=list, init=False, repr=False)
     
     @property
     def history(self) -> List[Message]:
@@ -82,7 +102,12 @@ class RoleContext:
     @property
     def important_memory(self) -> List[Message]:
         """Get messages that match watched actions."""
-        return [m for m in self.memory if m.cause_by in self.watch]
+        return self._watched_memory
+    
+    def set_watch(self, watch: Set[str]) -> None:
+        """Replace the watch set and rebuild the watched-memory index."""
+        self.watch = watch
+        self._watched_memory = [m for m in self.memory if m.cause_by in watch]
 
 
 class Action(ABC):
@@ -143,7 +168,7 @@ class Role(ABC):
     
     def _watch(self, actions: List[Type[Action]]) -> None:
         """Subscribe to messages caused by these actions."""
-        self.rc.watch = {a.name if hasattr(a, 'name') else a.__name__ for a in actions}
+        self.rc.set_watch({a.name if hasattr(a, 'name') else a.__name__ for a in actions})
     
     def set_env(self, env: Any) -> None:
         """Set the environment reference."""
@@ -181,8 +206,13 @@ class Role(ABC):
         news = self.rc.news
         self.rc.news = []
         
-        # Filter to watched messages only
-        relevant = [m for m in news if m.cause_by in self.rc.watch or not self.rc.watch]
+        # Filter to watched messages only (no watch list = everything is relevant)
+        watch = self.rc.watch
+        if watch:
+            relevant = [m for m in news if m.cause_by in watch]
+            self.rc._watched_memory.extend(relevant)
+        else:
+            relevant = news  # Already detached from the buffer, no copy needed
         
         # Add to memory
         self.rc.memory.extend(relevant)
@@ -5,7 +5,7 @@ MetaGPT-style roles for the software development team.
 Each role has specific responsibilities and actions.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 from backend.engine.role import Role, Action, Message, RoleState, UserRequirement
 
 
@@ -260,20 +260,31 @@ ROLE_REGISTRY = {
 }
 
 
-def get_all_roles() -> List[Role]:
-    """Create instances of all roles."""
-    return [cls() for cls in ROLE_REGISTRY.values()]
+def get_all_roles(names: Optional[Iterable[str]] = None) -> List[Role]:
+    """
+    Create fresh role instances.
+    
+    Roles carry their own memory and state, so instances are never shared.
+    Pass names to build only the roles you need (unknown names raise KeyError).
+    """
+    if names is None:
+        return [cls() for cls in ROLE_REGISTRY.values()]
+    return [ROLE_REGISTRY[name]() for name in names]
+
+
+# Role metadata is static class data, so the projection is built once at import
+_ROLE_INFO: List[Dict[str, Any]] = [
+    {
+        "name": cls.name,
+        "profile": cls.profile,
+        "goal": cls.goal,
+        "icon": cls.icon,
+        "color": cls.color,
+    }
+    for cls in ROLE_REGISTRY.values()
+]
 
 
 def get_role_info() -> List[Dict[str, Any]]:
-    """Get info about all available roles."""
-    return [
-        {
-            "name": cls.name,
-            "profile": cls.profile,
-            "goal": cls.goal,
-            "icon": cls.icon,
-            "color": cls.color,
-        }
-        for cls in ROLE_REGISTRY.values()
-    ]
+    """Get info about all available roles (shared list; treat as read-only)."""
+    return _ROLE_INFO
@@ -22,35 +22,69 @@ Usage:
         print(result.stdout)
 """
 
+import asyncio
+import atexit
+import fnmatch
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import uuid
+import weakref
 import shlex
 import re
-from typing import Any, Dict, List, Optional, Union
+import select
+import signal
+import sys
+import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 from backend.engine.events import get_event_emitter, EngineEventType
 
+# fcntl is POSIX-only; used for copy-on-write reflinks where supported
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 # ─── Constants ───────────────────────────────────────────────────────────────
 
 DEFAULT_TIMEOUT = 60  # seconds
 MAX_OUTPUT_SIZE = 50000  # characters
+MAX_OUTPUT_BYTES = MAX_OUTPUT_SIZE * 4  # Enough bytes for MAX_OUTPUT_SIZE UTF-8 chars
+PARALLEL_COPY_THRESHOLD = 16  # Files before copy_from_project fans out to threads
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PREWARM_POOL_SIZE = 4  # Empty sandbox dirs kept ready for create_sandbox
+EVENT_FLUSH_INTERVAL = 0.05  # seconds; sandbox events are emitted in batches
+MAX_COLLECT_FILE_BYTES = 1024 * 1024  # collect_results skips larger files
+MIN_SHM_FREE_BYTES = 512 * 1024 * 1024  # /dev/shm must have this free to host sandboxes
+MAX_HISTORY = 1000  # Destroyed-sandbox records kept by SandboxManager
+
+# Build artifacts / media that collect_results never returns as text
+_BINARY_SUFFIXES = (
+    '.pyc', '.pyo', '.so', '.dll', '.dylib', '.o', '.a', '.exe', '.class', '.jar',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico', '.pdf', '.zip', '.gz', '.tar',
+    '.db', '.sqlite',
+)
 
 # Security: Whitelist of allowed commands
-ALLOWED_COMMANDS = {
+# (matched against the first token only, so entries must be single words)
+ALLOWED_COMMANDS = frozenset({
     'python', 'python3', 'pip', 'pip3', 'node', 'npm', 'yarn',
     'cargo', 'rustc', 'go', 'javac', 'java', 'ruby', 'gem',
-    'php', 'composer', 'dotnet', 'dotnet', 'make', 'cmake',
+    'php', 'composer', 'dotnet', 'make', 'cmake',
     'gcc', 'g++', 'clang', 'clang++', 'git', 'docker', 'docker-compose',
-    'pytest', 'mocha', 'jest', 'cargo test', 'go test', 'unittest',
-}
+    'pytest', 'mocha', 'jest',
+})
 
 # Security: Dangerous patterns that should be rejected
 DANGEROUS_PATTERNS = [
@@ -65,11 +99,521 @@ DANGEROUS_PATTERNS = [
     r'exec\s*\(',
     r'system\s*\(',
 ]
+# All patterns as one alternation so a command is scanned once, not per pattern
+_DANGER_RE = re.compile('|'.join(f'(?:{p})' for p in DANGEROUS_PATTERNS), re.IGNORECASE)
+# Every pattern except 'base64 -d' needs one of these characters to match, so
+# plain commands (the common case) are only checked against that one pattern.
+# Keep both in sync when adding patterns.
+_DANGER_TRIGGERS = frozenset(';&|`$<>(')
+_UNTRIGGERED_DANGER_RE = re.compile(r'base64\s+-d', re.IGNORECASE)
+
+
+# Characters that only mean something to a shell (pipes, redirects, globs, expansion)
+_SHELL_METACHARS = frozenset('|&;<>()$`\\*?[]{}~!#\n')
+
+
+def _needs_shell(command: str) -> bool:
+    """True if the command uses shell syntax and can't be exec'd directly."""
+    return not _SHELL_METACHARS.isdisjoint(command)
+
+
+@lru_cache(maxsize=256)
+def _split_cached(command: str) -> Tuple[str, ...]:
+    """shlex.split for repeated command strings (tuple so cached values stay immutable)."""
+    return tuple(shlex.split(command))
+
+
+@lru_cache(maxsize=1024)
+def _validate_command_cached(command: str) -> tuple[bool, str]:
+    """
+    Validate a shell command (memoized; patterns and whitelist are static).
+    
+    Returns:
+        (is_valid, error_message)
+    """
+    # Check for dangerous patterns
+    if _DANGER_TRIGGERS.isdisjoint(command):
+        danger_re = _UNTRIGGERED_DANGER_RE
+    else:
+        danger_re = _DANGER_RE
+    if danger_re.search(command):
+        return False, f"Security violation: Dangerous pattern detected"
+    
+    # Parse command to get the base command
+    try:
+        # Use shlex to safely parse the command
+        args = shlex.split(command)
+        if not args:
+            return False, "Empty command"
+        
+        base_cmd = args[0]
+        
+        # Allow if it's in whitelist OR it's a path to an executable
+        if '/' in base_cmd or '\\' in base_cmd:
+            # It's a path - extract the command name
+            cmd_name = os.path.basename(base_cmd)
+        else:
+            cmd_name = base_cmd
+        
+        # Check if command is in whitelist
+        if cmd_name not in ALLOWED_COMMANDS:
+            return False, f"Command '{cmd_name}' not in allowed list"
+        
+        return True, ""
+        
+    except ValueError as e:
+        return False, f"Invalid command syntax: {e}"
+
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path with raw fd syscalls (no buffered text-IO stack)."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+_FICLONE = 0x40049409  # Linux ioctl: reflink dst to src's extents (btrfs/XFS)
+
+
+def _copy_in_kernel(src_fd: int, dst_fd: int) -> bool:
+    """Try a reflink, then copy_file_range. Returns False if neither applies."""
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return True
+        except OSError:
+            pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    # Early EOF (source shrank, or procfs/overlay/FUSE); the
+                    # userspace copy reopens dst and starts over
+                    return False
+                remaining -= copied
+            return True
+        except OSError:
+            pass
+    return False
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """copy2 equivalent that avoids userspace copying when the kernel can do it."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = _copy_in_kernel(fsrc.fileno(), fdst.fileno())
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _safe_copy(src: str, dst: str) -> int:
+    """Copy one file; returns 1 on success, 0 if it couldn't be copied."""
+    try:
+        _fast_copy(src, dst)
+        return 1
+    except (PermissionError, OSError):
+        return 0
+
+
+def _iter_files(root: str, exclude_names: frozenset = frozenset()) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (rel_dir, name, abs_path) for every file under root.
+    
+    Iterative scandir DFS: DirEntry type checks reuse the directory read
+    instead of a stat per entry. rel_dir is '' at the root and otherwise
+    ends with '/'. Directories named in exclude_names are pruned.
+    """
+    stack = [(root, "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_names:
+                            stack.append((entry.path, f"{rel_dir}{entry.name}/"))
+                    elif entry.is_file():
+                        yield rel_dir, entry.name, entry.path
+        except OSError:
+            continue
+
+
+_RM = shutil.which("rm") if os.name == "posix" else None
+
+
+def _remove_tree(path: str) -> None:
+    """
+    Delete a directory tree, ignoring errors.
+    
+    On POSIX this hands the recursion to `rm -rf` (one process, no Python
+    frame per entry); shutil.rmtree is the fallback.
+    """
+    if _RM is not None:
+        try:
+            subprocess.run([_RM, "-rf", "--", path], check=False,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+        if not os.path.lexists(path):
+            return
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _empty_dir(path: str) -> None:
+    """Delete everything inside path but keep the directory itself."""
+    with os.scandir(path) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
+_GLOB_CHARS = frozenset('*?[')
+
+
+def _partition_exclude(exclude: List[str]) -> tuple[frozenset, tuple, Optional[re.Pattern]]:
+    """
+    Split exclude patterns into exact names, "*.ext" suffixes and a single
+    compiled regex for any other glob (None if there are none).
+    """
+    exact, suffixes, globs = [], [], []
+    for pattern in exclude:
+        if _GLOB_CHARS.isdisjoint(pattern):
+            exact.append(pattern)
+        elif pattern.startswith("*.") and _GLOB_CHARS.isdisjoint(pattern[1:]):
+            suffixes.append(pattern[1:])
+        else:
+            globs.append(fnmatch.translate(pattern))
+    glob_re = re.compile('|'.join(globs)) if globs else None
+    return frozenset(exact), tuple(suffixes), glob_re
+
+
+# Default copy_from_project exclusions, already split for _iter_files/endswith
+_DEFAULT_EXCLUDE_EXACT, _DEFAULT_EXCLUDE_SUFFIXES, _ = _partition_exclude([
+    "__pycache__", "node_modules", ".git", ".venv",
+    "*.pyc", ".env", "*.db",
+])
+
+
+class OutputLimitExceeded(subprocess.SubprocessError):
+    """A command printed more than MAX_OUTPUT_BYTES on one stream and was killed."""
+    
+    def __init__(self, cmd, limit: int, output: bytes = b"", stderr: bytes = b""):
+        self.cmd = cmd
+        self.limit = limit
+        self.output = output
+        self.stderr = stderr
+    
+    @property
+    def stdout(self) -> bytes:
+        return self.output
+    
+    def __str__(self) -> str:
+        return f"Output exceeded {self.limit} bytes; command killed"
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    """SIGKILL proc and everything it spawned (its own session on POSIX)."""
+    if os.name == "posix":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass  # Group already gone
+    try:
+        proc.kill()
+    except OSError:
+        pass
+
+
+def _drain_pipe(stream, sink: bytearray, limit: int, on_overflow) -> None:
+    """Read a pipe to EOF into sink; calls on_overflow and stops once it passes limit bytes."""
+    try:
+        for chunk in iter(lambda: stream.read(65536), b""):
+            room = limit - len(sink)
+            if len(chunk) > room:
+                sink += chunk[:room]
+                on_overflow()
+                break
+            sink += chunk
+    except (OSError, ValueError):
+        pass
+    finally:
+        stream.close()
+
+
+def _run_capped(
+    args: Union[str, List[str]],
+    shell: bool,
+    cwd: str,
+    env: Dict[str, str],
+    timeout: int,
+    process_groups: Optional[set] = None,
+) -> Tuple[int, bytes, bytes]:
+    """
+    subprocess.run(capture_output=True) with bounded output buffers.
+    
+    Both pipes are drained by reader threads that keep at most
+    MAX_OUTPUT_BYTES each, so peak memory stays fixed however much a
+    command prints. The command runs in its own session, and the whole
+    group is killed when a stream passes the cap (OutputLimitExceeded) or
+    when the deadline passes, including while background grandchildren
+    still hold the pipes open (subprocess.TimeoutExpired). Both carry the
+    partial output. The command's process group id is added to
+    process_groups when given.
+    """
+    deadline = time.monotonic() + timeout
+    proc = subprocess.Popen(
+        args,
+        shell=shell,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+        start_new_session=os.name == "posix",
+    )
+    if process_groups is not None:
+        process_groups.add(proc.pid)
+    overflowed = threading.Event()
+    
+    def on_overflow() -> None:
+        overflowed.set()
+        _kill_group(proc)
+    
+    stdout, stderr = bytearray(), bytearray()
+    readers = [
+        threading.Thread(target=_drain_pipe, args=(proc.stdout, stdout, MAX_OUTPUT_BYTES, on_overflow), daemon=True),
+        threading.Thread(target=_drain_pipe, args=(proc.stderr, stderr, MAX_OUTPUT_BYTES, on_overflow), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    
+    try:
+        returncode = proc.wait(timeout=timeout)
+        # The pipes close only once every holder exits, so the readers get
+        # whatever is left of the deadline, not an open-ended join
+        for reader in readers:
+            reader.join(timeout=max(0.0, deadline - time.monotonic()))
+        timed_out = any(reader.is_alive() for reader in readers)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+    except BaseException:
+        # Interrupted while waiting: don't leave the child (or its pipes) behind
+        _kill_group(proc)
+        proc.wait()
+        raise
+    
+    if timed_out:
+        _kill_group(proc)
+        proc.wait()
+        for reader in readers:
+            reader.join(timeout=1)
+        raise subprocess.TimeoutExpired(args, timeout, output=bytes(stdout), stderr=bytes(stderr))
+    if overflowed.is_set():
+        raise OutputLimitExceeded(args, MAX_OUTPUT_BYTES, output=bytes(stdout), stderr=bytes(stderr))
+    return returncode, bytes(stdout), bytes(stderr)
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured output like text mode would, capped at MAX_OUTPUT_SIZE chars."""
+    text = data.decode('utf-8', errors='replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text[:MAX_OUTPUT_SIZE]
+
+
+def _default_base_dir() -> str:
+    """
+    Pick where sandbox directories live.
+    
+    VIBECODER_SANDBOX_BASE wins if set. Otherwise Linux uses /dev/shm so
+    sandbox file I/O stays in RAM; sandbox contents then count against
+    memory, so /dev/shm is only used when it has at least MIN_SHM_FREE_BYTES
+    free (containers often cap it at 64MB). Point the override at disk for
+    large projects. Elsewhere falls back to the system temp dir.
+    """
+    override = os.getenv("VIBECODER_SANDBOX_BASE", "").strip()
+    if override:
+        return override
+    if sys.platform == "linux" and os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        try:
+            if shutil.disk_usage("/dev/shm").free >= MIN_SHM_FREE_BYTES:
+                return "/dev/shm"
+        except OSError:
+            pass
+    return tempfile.gettempdir()
+
+
+# Shared worker for filesystem chores kept off the create/destroy path
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sandbox-fs")
+_PENDING_CLEANUPS: Set[Future] = set()  # Unfinished jobs; done ones remove themselves
+_PENDING_LOCK = threading.Lock()
+
+
+def _submit_cleanup(fn: Callable[..., Any], *args: Any) -> None:
+    """Run fn on the background pool and track it until it finishes."""
+    future = _BACKGROUND_POOL.submit(fn, *args)
+    with _PENDING_LOCK:
+        _PENDING_CLEANUPS.add(future)
+    future.add_done_callback(_forget_cleanup)
+
+
+def _forget_cleanup(future: Future) -> None:
+    with _PENDING_LOCK:
+        _PENDING_CLEANUPS.discard(future)
+
+
+@atexit.register
+def _drain_cleanups() -> None:
+    """Let queued rmtree calls finish before the interpreter exits."""
+    waited: Set[Future] = set()
+    while True:
+        # Jobs can queue more jobs (dispose -> recycle), so re-check until quiet
+        with _PENDING_LOCK:
+            pending = _PENDING_CLEANUPS - waited
+        if not pending:
+            return
+        for future in pending:
+            waited.add(future)
+            try:
+                future.result(timeout=30)
+            except Exception:
+                pass
+
+
+# ─── Warm Python Worker ─────────────────────────────────────────────────────
+
+# Fork server: the interpreter starts once, then forks a fresh child per
+# script so runs never see each other's imports or globals.
+_WARM_WORKER_SOURCE = r"""
+import json, os, runpy, sys, traceback
+for line in iter(sys.stdin.readline, ""):
+    job = json.loads(line)
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            null = os.open(os.devnull, os.O_RDONLY)
+            out = os.open(job["stdout"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            err = os.open(job["stderr"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.dup2(null, 0)
+            os.dup2(out, 1)
+            os.dup2(err, 2)
+            sys.argv = [job["path"]]
+            sys.path[0] = os.path.dirname(os.path.abspath(job["path"]))
+            try:
+                runpy.run_path(job["path"], run_name="__main__")
+                code = 0
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+            except BaseException:
+                traceback.print_exc()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    sys.stdout.write(json.dumps({"exit_code": os.waitstatus_to_exitcode(status)}) + "\n")
+    sys.stdout.flush()
+"""
+
+
+class _WarmPython:
+    """
+    Long-lived Python fork server bound to one sandbox.
+    
+    Saves interpreter startup + site import on every execute_python call.
+    Output goes through per-job files outside the sandbox so it never
+    shows up in list_files/collect_results.
+    """
+    
+    __slots__ = ("_io_dir", "_proc")
+    
+    def __init__(self, cwd: str, env: Dict[str, str]):
+        self._io_dir = tempfile.mkdtemp(prefix="vibecoder_worker_")
+        self._proc = subprocess.Popen(
+            [sys.executable, "-c", _WARM_WORKER_SOURCE],
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+            start_new_session=True,  # Own process group, so a timeout kills the job too
+        )
+    
+    @property
+    def pid(self) -> int:
+        return self._proc.pid
+    
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+    
+    def run(self, path: str, timeout: int) -> Tuple[int, bytes, bytes]:
+        """Run one script; raises subprocess.TimeoutExpired like _run_capped."""
+        out_path = os.path.join(self._io_dir, "stdout")
+        err_path = os.path.join(self._io_dir, "stderr")
+        job = json.dumps({"path": path, "stdout": out_path, "stderr": err_path})
+        self._proc.stdin.write(job.encode() + b"\n")
+        
+        reply = b""
+        deadline = time.monotonic() + timeout
+        while not reply.endswith(b"\n"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._proc.stdout], [], [], remaining)[0]:
+                self.close()
+                raise subprocess.TimeoutExpired(path, timeout)
+            chunk = self._proc.stdout.read(4096)
+            if not chunk:
+                raise RuntimeError("Python worker exited unexpectedly")
+            reply += chunk
+        
+        returncode = json.loads(reply)["exit_code"]
+        return returncode, self._read_capped(out_path), self._read_capped(err_path)
+    
+    @staticmethod
+    def _read_capped(path: str) -> bytes:
+        try:
+            with open(path, 'rb') as f:
+                return f.read(MAX_OUTPUT_BYTES)
+        except OSError:
+            return b""
+    
+    def close(self) -> None:
+        if self.alive():
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        self._proc.wait()
+        for stream in (self._proc.stdin, self._proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        shutil.rmtree(self._io_dir, ignore_errors=True)
 
 
 # ─── Execution Result ───────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result from a sandboxed execution."""
     success: bool
@@ -101,12 +645,25 @@ class Sandbox:
     No changes leak to the host filesystem.
     """
     
-    def __init__(self, sandbox_id: str, base_path: str):
+    __slots__ = (
+        "id", "path", "created_at", "_base_env", "_files_written",
+        "_executions", "_dirs_created", "_python_worker", "_file_count",
+        "_process_groups",
+    )
+    
+    def __init__(self, sandbox_id: str, base_path: str, base_env: Optional[Dict[str, str]] = None):
         self.id = sandbox_id
         self.path = base_path
+        # Environment snapshot shared with the manager; later os.environ
+        # changes are not seen by commands run here
+        self._base_env = {**(os.environ if base_env is None else base_env), "SANDBOX_ID": sandbox_id}
         self.created_at = datetime.utcnow().isoformat()
-        self._files_written: List[str] = []
+        self._files_written: set[str] = set()  # Unique relative paths
         self._executions: List[ExecutionResult] = []
+        self._dirs_created: set[str] = {base_path}
+        self._python_worker: Optional[_WarmPython] = None
+        self._file_count: Optional[int] = 0  # None = unknown, recount on next status
+        self._process_groups: set[int] = set()  # Group ids of commands run here
     
     def write_file(self, relative_path: str, content: str) -> str:
         """
@@ -120,30 +677,45 @@ class Sandbox:
             Absolute path of written file
         """
         abs_path = os.path.join(self.path, relative_path)
-        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+        dirname = os.path.dirname(abs_path)
+        if dirname not in self._dirs_created:
+            os.makedirs(dirname, exist_ok=True)
+            self._dirs_created.add(dirname)
         
-        with open(abs_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if (
+            self._file_count is not None
+            and relative_path not in self._files_written
+            and not os.path.exists(abs_path)
+        ):
+            self._file_count += 1
         
-        self._files_written.append(relative_path)
+        data = content.encode('utf-8')
+        try:
+            _write_bytes(abs_path, data)
+        except FileNotFoundError:
+            # Directory was removed behind our back (e.g. by an executed command)
+            os.makedirs(dirname, exist_ok=True)
+            _write_bytes(abs_path, data)
+        
+        self._files_written.add(relative_path)
         return abs_path
     
     def read_file(self, relative_path: str) -> Optional[str]:
         """Read a file from the sandbox."""
-        abs_path = os.path.join(self.path, relative_path)
-        if os.path.exists(abs_path):
-            with open(abs_path, 'r', encoding='utf-8', errors='replace') as f:
+        try:
+            with open(os.path.join(self.path, relative_path), 'r', encoding='utf-8', errors='replace') as f:
                 return f.read()
-        return None
+        except FileNotFoundError:
+            return None
+    
+    def iter_files(self) -> Iterator[str]:
+        """Yield sandbox-relative paths of all files, lazily."""
+        for rel_dir, name, _ in _iter_files(self.path):
+            yield rel_dir + name
     
     def list_files(self) -> List[str]:
         """List all files in the sandbox."""
-        files = []
-        for root, _, filenames in os.walk(self.path):
-            for filename in filenames:
-                rel = os.path.relpath(os.path.join(root, filename), self.path)
-                files.append(rel.replace('\\', '/'))
-        return files
+        return list(self.iter_files())
     
     def copy_from_project(self, project_path: str, exclude: Optional[List[str]] = None) -> int:
         """
@@ -156,40 +728,36 @@ class Sandbox:
         Returns:
             Number of files copied
         """
-        exclude = exclude or [
-            "__pycache__", "node_modules", ".git", ".venv",
-            "*.pyc", ".env", "*.db",
-        ]
-        
-        count = 0
-        for root, dirs, files in os.walk(project_path):
-            # Filter directories
-            dirs[:] = [d for d in dirs if d not in exclude]
+        if exclude:
+            exact_names, suffixes, glob_re = _partition_exclude(exclude)
+        else:
+            exact_names, suffixes, glob_re = _DEFAULT_EXCLUDE_EXACT, _DEFAULT_EXCLUDE_SUFFIXES, None
+        
+        pairs = []
+        dst_dirs: Dict[str, str] = {}
+        for rel_dir, filename, src in _iter_files(project_path, exact_names):
+            # Check file exclusions
+            if filename in exact_names or filename.endswith(suffixes):
+                continue
+            if glob_re is not None and glob_re.match(filename):
+                continue
             
-            for filename in files:
-                # Check file exclusions
-                skip = False
-                for pattern in exclude:
-                    if pattern.startswith("*.") and filename.endswith(pattern[1:]):
-                        skip = True
-                        break
-                    if filename == pattern:
-                        skip = True
-                        break
-                if skip:
-                    continue
-                
-                src = os.path.join(root, filename)
-                rel = os.path.relpath(src, project_path)
-                dst = os.path.join(self.path, rel)
-                
-                os.makedirs(os.path.dirname(dst), exist_ok=True)
-                try:
-                    shutil.copy2(src, dst)
-                    count += 1
-                except (PermissionError, OSError):
-                    pass
+            dst_dir = dst_dirs.get(rel_dir)
+            if dst_dir is None:
+                # Create destination dirs up front so copy workers never race on makedirs
+                dst_dir = os.path.normpath(os.path.join(self.path, rel_dir))
+                os.makedirs(dst_dir, exist_ok=True)
+                self._dirs_created.add(dst_dir)
+                dst_dirs[rel_dir] = dst_dir
+            pairs.append((src, os.path.join(dst_dir, filename)))
+        
+        if len(pairs) < PARALLEL_COPY_THRESHOLD:
+            count = sum(_safe_copy(src, dst) for src, dst in pairs)
+        else:
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS, thread_name_prefix="sandbox_copy") as pool:
+                count = sum(pool.map(lambda pair: _safe_copy(*pair), pairs))
         
+        self._file_count = None
         return count
     
     def _validate_command(self, command: str) -> tuple[bool, str]:
@@ -199,35 +767,7 @@ class Sandbox:
         Returns:
             (is_valid, error_message)
         """
-        # Check for dangerous patterns
-        for pattern in DANGEROUS_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                return False, f"Security violation: Dangerous pattern detected"
-        
-        # Parse command to get the base command
-        try:
-            # Use shlex to safely parse the command
-            args = shlex.split(command)
-            if not args:
-                return False, "Empty command"
-            
-            base_cmd = args[0]
-            
-            # Allow if it's in whitelist OR it's a path to an executable
-            if '/' in base_cmd or '\\' in base_cmd:
-                # It's a path - extract the command name
-                cmd_name = os.path.basename(base_cmd)
-            else:
-                cmd_name = base_cmd
-            
-            # Check if command is in whitelist
-            if cmd_name not in ALLOWED_COMMANDS:
-                return False, f"Command '{cmd_name}' not in allowed list"
-            
-            return True, ""
-            
-        except ValueError as e:
-            return False, f"Invalid command syntax: {e}"
+        return _validate_command_cached(command)
 
     def execute(
         self,
@@ -251,12 +791,10 @@ class Sandbox:
         Returns:
             ExecutionResult with stdout, stderr, exit code
         """
-        run_env = os.environ.copy()
+        # Base env already carries SANDBOX_ID; only copy when overrides are given
+        run_env = self._base_env
         if env:
-            run_env.update(env)
-        
-        # Restrict PATH-like vars to sandbox
-        run_env["SANDBOX_ID"] = self.id
+            run_env = {**run_env, **env, "SANDBOX_ID": self.id}
         
         # Convert list to string for logging
         if isinstance(command, list):
@@ -264,7 +802,7 @@ class Sandbox:
         else:
             command_str = command
         
-        start = datetime.utcnow()
+        start = time.perf_counter_ns()
         
         # SECURITY: Validate command if using shell
         if shell and isinstance(command, str):
@@ -281,49 +819,38 @@ class Sandbox:
                 )
         
         try:
-            if shell and isinstance(command, str):
-                # Use shell=True only after validation
-                proc = subprocess.run(
-                    command,
-                    shell=True,
-                    cwd=self.path,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    env=run_env,
+            if shell and isinstance(command, str) and _needs_shell(command):
+                # Use shell=True only after validation, and only for real shell syntax
+                returncode, stdout, stderr = _run_capped(
+                    command, True, self.path, run_env, timeout, self._process_groups
                 )
             else:
-                # Safe: shell=False with list or validated string
+                # Safe: shell=False with list or validated string (plain
+                # commands skip the extra /bin/sh fork even when shell=True)
                 if isinstance(command, str):
-                    command = shlex.split(command)
+                    command = list(_split_cached(command))
                 
-                proc = subprocess.run(
-                    command,
-                    shell=False,
-                    cwd=self.path,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    env=run_env,
+                returncode, stdout, stderr = _run_capped(
+                    command, False, self.path, run_env, timeout, self._process_groups
                 )
             
-            duration = (datetime.utcnow() - start).total_seconds() * 1000
+            duration = (time.perf_counter_ns() - start) / 1e6
             
             result = ExecutionResult(
-                success=proc.returncode == 0,
-                exit_code=proc.returncode,
-                stdout=proc.stdout[:MAX_OUTPUT_SIZE],
-                stderr=proc.stderr[:MAX_OUTPUT_SIZE],
+                success=returncode == 0,
+                exit_code=returncode,
+                stdout=_decode_output(stdout),
+                stderr=_decode_output(stderr),
                 duration_ms=duration,
                 command=command_str,
                 sandbox_path=self.path,
             )
             
         except subprocess.TimeoutExpired as e:
-            duration = timeout * 1000
+            duration = (time.perf_counter_ns() - start) / 1e6
             # Try to capture partial output
-            stdout = e.stdout.decode('utf-8', errors='replace')[:MAX_OUTPUT_SIZE] if e.stdout else ""
-            stderr = e.stderr.decode('utf-8', errors='replace')[:MAX_OUTPUT_SIZE] if e.stderr else f"Command timed out after {timeout}s"
+            stdout = _decode_output(e.stdout) if e.stdout else ""
+            stderr = _decode_output(e.stderr) if e.stderr else f"Command timed out after {timeout}s"
             
             result = ExecutionResult(
                 success=False,
@@ -334,8 +861,20 @@ class Sandbox:
                 command=command_str,
                 sandbox_path=self.path,
             )
+        except OutputLimitExceeded as e:
+            duration = (time.perf_counter_ns() - start) / 1e6
+            stderr = _decode_output(e.stderr)
+            result = ExecutionResult(
+                success=False,
+                exit_code=-1,
+                stdout=_decode_output(e.stdout),
+                stderr=f"{stderr}\n{e}" if stderr else str(e),
+                duration_ms=duration,
+                command=command_str,
+                sandbox_path=self.path,
+            )
         except Exception as e:
-            duration = (datetime.utcnow() - start).total_seconds() * 1000
+            duration = (time.perf_counter_ns() - start) / 1e6
             result = ExecutionResult(
                 success=False,
                 exit_code=-1,
@@ -346,25 +885,154 @@ class Sandbox:
                 sandbox_path=self.path,
             )
         
+        self._file_count = None  # Commands may create or delete files
+        self._executions.append(result)
+        return result
+    
+    def execute_python(self, relative_path: str, timeout: int = DEFAULT_TIMEOUT) -> ExecutionResult:
+        """
+        Run a Python script through the sandbox's warm interpreter.
+        
+        The worker is started on first use and reused until cleanup, so
+        repeated test runs skip interpreter startup. Each script still runs
+        in a freshly forked process. Falls back to execute() where fork
+        is unavailable.
+        
+        Args:
+            relative_path: Script path relative to sandbox root
+            timeout: Hard timeout in seconds
+            
+        Returns:
+            ExecutionResult with stdout, stderr, exit code
+        """
+        command_str = f"python {shlex.quote(relative_path)}"
+        if not hasattr(os, "fork"):
+            return self.execute([sys.executable, relative_path], timeout=timeout)
+        
+        start = time.perf_counter_ns()
+        try:
+            if self._python_worker is None or not self._python_worker.alive():
+                self._python_worker = _WarmPython(self.path, self._base_env)
+                self._process_groups.add(self._python_worker.pid)
+            returncode, stdout, stderr = self._python_worker.run(relative_path, timeout)
+            result = ExecutionResult(
+                success=returncode == 0,
+                exit_code=returncode,
+                stdout=_decode_output(stdout),
+                stderr=_decode_output(stderr),
+                duration_ms=(time.perf_counter_ns() - start) / 1e6,
+                command=command_str,
+                sandbox_path=self.path,
+            )
+        except subprocess.TimeoutExpired:
+            self._python_worker = None
+            result = ExecutionResult(
+                success=False,
+                exit_code=-1,
+                stdout="",
+                stderr=f"Command timed out after {timeout}s",
+                duration_ms=(time.perf_counter_ns() - start) / 1e6,
+                command=command_str,
+                sandbox_path=self.path,
+            )
+        except Exception as e:
+            self._stop_python_worker()
+            result = ExecutionResult(
+                success=False,
+                exit_code=-1,
+                stdout="",
+                stderr=str(e),
+                duration_ms=(time.perf_counter_ns() - start) / 1e6,
+                command=command_str,
+                sandbox_path=self.path,
+            )
+        
+        self._file_count = None
         self._executions.append(result)
         return result
     
+    def processes_exited(self) -> bool:
+        """
+        True once no process started by this sandbox is still running.
+        
+        Every command runs as its own process group, so a group with no
+        members left means the command and anything it spawned are gone.
+        Where groups can't be probed (non-POSIX) any execution counts as
+        possibly still running.
+        """
+        if not self._process_groups:
+            return True
+        if os.name != "posix":
+            return False
+        for pgid in list(self._process_groups):
+            try:
+                os.killpg(pgid, 0)
+            except ProcessLookupError:
+                self._process_groups.discard(pgid)
+            except OSError:
+                return False  # Exists but not ours to signal
+            else:
+                return False
+        return True
+    
+    def _stop_python_worker(self) -> None:
+        if self._python_worker is not None:
+            self._python_worker.close()
+            self._python_worker = None
+    
     def collect_results(self) -> Dict[str, str]:
-        """Collect all files from sandbox for extraction."""
+        """
+        Collect all text files from sandbox for extraction.
+        
+        Single scandir pass. Binary artifacts (by suffix or NUL bytes) and
+        files over MAX_COLLECT_FILE_BYTES are skipped.
+        """
         results = {}
-        for filepath in self.list_files():
-            content = self.read_file(filepath)
-            if content is not None:
-                results[filepath] = content
+        for rel_dir, filename, abs_path in _iter_files(self.path):
+            if filename.lower().endswith(_BINARY_SUFFIXES):
+                continue
+            try:
+                with open(abs_path, 'rb') as f:
+                    data = f.read(MAX_COLLECT_FILE_BYTES + 1)
+            except OSError:
+                continue
+            if len(data) > MAX_COLLECT_FILE_BYTES or b'\0' in data[:8192]:
+                continue
+            text = data.decode('utf-8', errors='replace')
+            if '\r' in text:
+                # Match text-mode universal newlines used by read_file
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            results[rel_dir + filename] = text
         return results
     
-    def cleanup(self) -> None:
-        """Remove the sandbox directory."""
+    def cleanup(self, blocking: bool = False) -> None:
+        """
+        Remove the sandbox directory.
+        
+        The directory is renamed aside at once (so the path is free on
+        return) and deleted on a background thread unless blocking=True.
+        """
+        self._stop_python_worker()
+        if not blocking:
+            trash = f"{self.path}.trash_{uuid.uuid4().hex[:8]}"
+            try:
+                os.rename(self.path, trash)
+            except OSError:
+                pass  # Fall back to deleting in place
+            else:
+                _submit_cleanup(_remove_tree, trash)
+                return
         try:
             shutil.rmtree(self.path, ignore_errors=True)
         except Exception:
             pass
     
+    def _count_files(self) -> int:
+        """File count, kept incrementally by write_file and re-walked only when stale."""
+        if self._file_count is None:
+            self._file_count = sum(1 for _ in self.iter_files())
+        return self._file_count
+    
     def get_status(self) -> dict:
         """Get sandbox status."""
         return {
@@ -373,7 +1041,7 @@ class Sandbox:
             "created_at": self.created_at,
             "files_written": len(self._files_written),
             "executions": len(self._executions),
-            "total_files": len(self.list_files()),
+            "total_files": self._count_files(),
         }
 
 
@@ -388,10 +1056,18 @@ class SandboxManager:
     """
     
     def __init__(self, base_dir: str = ""):
-        self.base_dir = base_dir or tempfile.gettempdir()
+        self.base_dir = base_dir or _default_base_dir()
         self._active: Dict[str, Sandbox] = {}
-        self._history: List[Dict[str, Any]] = []
+        self._history: deque = deque(maxlen=MAX_HISTORY)
         self.events = get_event_emitter()
+        self._prewarm: deque[str] = deque()
+        self._prewarm_lock = threading.Lock()
+        self._refilling = False
+        self._base_env = dict(os.environ)  # Snapshot handed to every sandbox
+        self._pending_events: deque = deque(maxlen=1024)
+        self._flush_timer: Optional[threading.Timer] = None
+        self._events_lock = threading.Lock()
+        _MANAGERS.add(self)  # Spare dirs are removed at exit without pinning the manager
     
     @contextmanager
     def create(self, label: str = ""):
@@ -409,6 +1085,21 @@ class SandboxManager:
         finally:
             self.destroy_sandbox(sandbox.id)
     
+    @asynccontextmanager
+    async def acreate(self, label: str = ""):
+        """
+        Async variant of create() for use inside event loops.
+        
+        Usage:
+            async with sandbox_mgr.acreate("test_run") as sandbox:
+                ...
+        """
+        sandbox = await self.acreate_sandbox(label)
+        try:
+            yield sandbox
+        finally:
+            await self.adestroy_sandbox(sandbox.id)
+    
     def create_sandbox(self, label: str = "") -> Sandbox:
         """
         Create a new sandbox.
@@ -419,11 +1110,22 @@ class SandboxManager:
         Returns:
             Sandbox instance
         """
+        sandbox_id, sandbox_path = self._new_location(label)
+        self._claim_dir(sandbox_path)
+        return self._register(sandbox_id, sandbox_path)
+    
+    async def acreate_sandbox(self, label: str = "") -> Sandbox:
+        """Create a sandbox without blocking the event loop on filesystem work."""
+        sandbox_id, sandbox_path = self._new_location(label)
+        await asyncio.to_thread(self._claim_dir, sandbox_path)
+        return self._register(sandbox_id, sandbox_path)
+    
+    def _new_location(self, label: str) -> Tuple[str, str]:
         sandbox_id = f"{label}_{uuid.uuid4().hex[:8]}" if label else uuid.uuid4().hex[:12]
-        sandbox_path = os.path.join(self.base_dir, f"vibecoder_sandbox_{sandbox_id}")
-        os.makedirs(sandbox_path, exist_ok=True)
-        
-        sandbox = Sandbox(sandbox_id, sandbox_path)
+        return sandbox_id, os.path.join(self.base_dir, f"vibecoder_sandbox_{sandbox_id}")
+    
+    def _register(self, sandbox_id: str, sandbox_path: str) -> Sandbox:
+        sandbox = Sandbox(sandbox_id, sandbox_path, self._base_env)
         self._active[sandbox_id] = sandbox
         
         self._emit_event("SANDBOX_CREATED", {
@@ -433,11 +1135,121 @@ class SandboxManager:
         
         return sandbox
     
-    def destroy_sandbox(self, sandbox_id: str) -> bool:
-        """Destroy a sandbox and clean up files."""
-        if sandbox_id in self._active:
-            sandbox = self._active.pop(sandbox_id)
-            
+    def _claim_dir(self, sandbox_path: str) -> None:
+        """Rename a pre-created empty dir into place, or mkdir if none is ready."""
+        try:
+            os.rename(self._prewarm.popleft(), sandbox_path)
+        except (IndexError, OSError):
+            os.makedirs(sandbox_path, exist_ok=True)
+        self._schedule_refill()
+    
+    def _schedule_refill(self) -> None:
+        with self._prewarm_lock:
+            if self._refilling or len(self._prewarm) >= PREWARM_POOL_SIZE:
+                return
+            self._refilling = True
+        _submit_cleanup(self._refill_prewarm)
+    
+    def _refill_prewarm(self) -> None:
+        """Top the pool back up to PREWARM_POOL_SIZE (runs off the hot path)."""
+        try:
+            while True:
+                with self._prewarm_lock:
+                    if len(self._prewarm) >= PREWARM_POOL_SIZE:
+                        break
+                path = os.path.join(self.base_dir, f"vibecoder_prewarm_{uuid.uuid4().hex[:12]}")
+                os.makedirs(path, exist_ok=True)
+                if not self._offer_prewarm(path):
+                    os.rmdir(path)  # A recycled dir filled the last slot
+                    break
+        except OSError:
+            pass
+        finally:
+            with self._prewarm_lock:
+                self._refilling = False
+    
+    def _offer_prewarm(self, path: str) -> bool:
+        """Add an empty dir to the pool unless it is already full."""
+        with self._prewarm_lock:
+            if len(self._prewarm) >= PREWARM_POOL_SIZE:
+                return False
+            self._prewarm.append(path)
+            return True
+    
+    def _discard_prewarm(self) -> None:
+        """Remove spare pre-created dirs (run for every live manager at exit)."""
+        _drain_cleanups()  # Recycled dirs may still be on their way into the pool
+        while self._prewarm:
+            try:
+                os.rmdir(self._prewarm.popleft())
+            except (IndexError, OSError):
+                pass
+    
+    def destroy_sandbox(self, sandbox_id: str, blocking: bool = False) -> bool:
+        """Destroy a sandbox and clean up files (in the background unless blocking)."""
+        sandbox = self._retire(sandbox_id)
+        if sandbox is None:
+            return False
+        
+        self._dispose(sandbox, blocking)
+        
+        self._emit_event("SANDBOX_DESTROYED", {
+            "sandbox_id": sandbox_id,
+        })
+        return True
+    
+    async def adestroy_sandbox(self, sandbox_id: str, blocking: bool = False) -> bool:
+        """Async variant of destroy_sandbox(); cleanup runs in a worker thread."""
+        sandbox = self._retire(sandbox_id)
+        if sandbox is None:
+            return False
+        
+        await asyncio.to_thread(self._dispose, sandbox, blocking)
+        
+        self._emit_event("SANDBOX_DESTROYED", {
+            "sandbox_id": sandbox_id,
+        })
+        return True
+    
+    def _dispose(self, sandbox: Sandbox, blocking: bool) -> None:
+        """
+        Release a retired sandbox's directory.
+        
+        While the prewarm pool has room the directory is recycled: renamed
+        aside, emptied in the background and handed to the next
+        create_sandbox. A sandbox with processes still running is never
+        recycled, since they could keep writing into the next sandbox; it
+        is deleted like when the pool is full (or when blocking).
+        """
+        if blocking or len(self._prewarm) >= PREWARM_POOL_SIZE:
+            sandbox.cleanup(blocking=blocking)
+            return
+        
+        sandbox._stop_python_worker()
+        if not sandbox.processes_exited():
+            sandbox.cleanup()
+            return
+        spare = os.path.join(self.base_dir, f"vibecoder_prewarm_{uuid.uuid4().hex[:12]}")
+        try:
+            os.rename(sandbox.path, spare)
+        except OSError:
+            sandbox.cleanup()
+            return
+        _submit_cleanup(self._recycle_dir, spare)
+    
+    def _recycle_dir(self, spare: str) -> None:
+        try:
+            _empty_dir(spare)
+        except OSError:
+            shutil.rmtree(spare, ignore_errors=True)
+            return
+        if not self._offer_prewarm(spare):
+            os.rmdir(spare)  # Pool filled up while the dir was being emptied
+    
+    def _retire(self, sandbox_id: str) -> Optional[Sandbox]:
+        """Drop a sandbox from the active map and record it in history."""
+        sandbox = self._active.pop(sandbox_id, None)
+        if sandbox is not None:
             self._history.append({
                 "sandbox_id": sandbox_id,
                 "created_at": sandbox.created_at,
@@ -445,14 +1257,7 @@ class SandboxManager:
                 "files": len(sandbox._files_written),
                 "executions": len(sandbox._executions),
             })
-            
-            sandbox.cleanup()
-            
-            self._emit_event("SANDBOX_DESTROYED", {
-                "sandbox_id": sandbox_id,
-            })
-            return True
-        return False
+        return sandbox
     
     def get_sandbox(self, sandbox_id: str) -> Optional[Sandbox]:
         """Get active sandbox by ID."""
@@ -460,32 +1265,71 @@ class SandboxManager:
     
     def list_active(self) -> List[Dict[str, Any]]:
         """List all active sandboxes."""
+        self._flush_events()
         return [s.get_status() for s in self._active.values()]
     
     def cleanup_all(self) -> int:
-        """Destroy all active sandboxes."""
-        count = len(self._active)
+        """Destroy all active sandboxes (reported as a single event)."""
+        destroyed = []
         for sandbox_id in list(self._active.keys()):
-            self.destroy_sandbox(sandbox_id)
-        return count
+            sandbox = self._retire(sandbox_id)
+            if sandbox is not None:
+                self._dispose(sandbox, blocking=False)
+                destroyed.append(sandbox_id)
+        if destroyed:
+            self._emit_event("SANDBOXES_DESTROYED", {
+                "sandbox_ids": destroyed,
+            })
+        return len(destroyed)
     
     def _emit_event(self, event_type: str, payload: Dict[str, Any]) -> None:
-        """Emit sandbox event."""
-        self.events.emit(EngineEventType.AGENT_STATUS, {
-            "agent": "sandbox_manager",
-            "event": event_type,
-            **payload,
-        })
+        """Queue a sandbox event; queued events go out together every EVENT_FLUSH_INTERVAL."""
+        self._pending_events.append({"event": event_type, "ts": time.time(), **payload})
+        with self._events_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(EVENT_FLUSH_INTERVAL, self._flush_events)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_events(self) -> None:
+        """Emit all queued sandbox events as a single batch."""
+        with self._events_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch = []
+            while self._pending_events:
+                batch.append(self._pending_events.popleft())
+        if batch:
+            self.events.emit(EngineEventType.AGENT_STATUS, {
+                "agent": "sandbox_manager",
+                "event": "SANDBOX_BATCH",
+                "batch": batch,
+            })
+
+
+_MANAGERS: "weakref.WeakSet[SandboxManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _discard_all_prewarm() -> None:
+    """Remove the spare dirs of every manager still alive at exit."""
+    for manager in list(_MANAGERS):
+        manager._discard_prewarm()
 
 
 # ─── Global Instance ────────────────────────────────────────────────────────
 
 _sandbox_manager: Optional[SandboxManager] = None
+_sandbox_manager_lock = threading.Lock()
 
 
 def get_sandbox_manager() -> SandboxManager:
     """Get the global sandbox manager instance."""
     global _sandbox_manager
     if _sandbox_manager is None:
-        _sandbox_manager = SandboxManager()
+        # Double-checked so concurrent first calls can't build two managers
+        with _sandbox_manager_lock:
+            if _sandbox_manager is None:
+                _sandbox_manager = SandboxManager()
     return _sandbox_manager
@@ -22,24 +22,77 @@ Usage:
     healer.start()  # Starts background monitoring
 """
 
+import os
+import re
 import time
+import queue
 import asyncio
+import logging
 import threading
-from typing import Optional, Dict, Any, List, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
 
 from backend.engine.events import get_event_emitter, EngineEventType
 from backend.engine.circuit_breaker import get_circuit_breaker, CircuitOpenError
 
+logger = logging.getLogger("self_healer")
+
 
 # ─── Constants ───────────────────────────────────────────────────────────────
 
 MAX_RETRIES = 2  # Escalate after 2 failed fix attempts
-MONITOR_INTERVAL = 30  # Seconds between health checks
+MONITOR_INTERVAL = 60  # Max seconds between health checks once stable
+RECOVERY_INTERVAL = 1.0  # Base interval; doubles with each healthy check up to MONITOR_INTERVAL
+FAILURE_RECHECK_INTERVAL = 0.2  # Seconds before re-probing a first failed check
+FAILURES_TO_CONFIRM = 2  # Consecutive failed checks before an outage is declared
+HEAL_RETRY_INTERVAL = 30  # Seconds before re-healing the same outage; doubles per attempt
+MAX_HEAL_RETRY_INTERVAL = 300  # Cap on the heal retry backoff
 HEALTH_TIMEOUT = 5  # Seconds to wait for health response
 LOG_TAIL_SIZE = 5000  # Characters of logs to capture
+LOG_COLLECT_TIMEOUT = 2  # Seconds to wait for log collection during a failure
+ANOMALY_CONTEXT_LINES = 2  # Lines kept after each error line in the fix prompt
+FIX_TIMEOUT = 120  # Seconds allowed for the Engineer agent to produce a fix
+QA_TIMEOUT = 300  # Seconds allowed for the QA run on a fix
+MAX_FAILURE_HISTORY = 100  # Failure records kept (each carries a log tail)
+EVENT_QUEUE_SIZE = 1000  # Pending healer events before new ones are dropped
+
+# Log lines worth sending to the fix agent (errors and stack frames)
+_ANOMALY_RE = re.compile(r'\b(?:ERROR|CRITICAL|FATAL|EXCEPTION)\b|^\s+File "|^\s+at ')
+
+
+def _extract_anomalies(tail: str) -> str:
+    """
+    Reduce a raw log tail to error lines and stack traces.
+    
+    Keeps each matching line plus ANOMALY_CONTEXT_LINES after it, and whole
+    Python tracebacks (through the final exception line). Returns the tail
+    unchanged if nothing matches, so the fix agent never gets less context.
+    """
+    lines = tail.splitlines()
+    keep = [False] * len(lines)
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if "Traceback (most recent call last)" in line:
+            end = i + 1
+            while end < len(lines) and (not lines[end] or lines[end][0].isspace()):
+                end += 1
+            end = min(end + 1, len(lines))  # Include the exception line
+        elif _ANOMALY_RE.search(line):
+            end = min(i + 1 + ANOMALY_CONTEXT_LINES, len(lines))
+        else:
+            i += 1
+            continue
+        keep[i:end] = [True] * (end - i)
+        i = end
+    
+    anomalies = [line for line, kept in zip(lines, keep) if kept]
+    return "\n".join(anomalies) if anomalies else tail
 
 
 # ─── Healer State ────────────────────────────────────────────────────────────
@@ -97,12 +150,30 @@ class SelfHealer:
         self.log_path = log_path
         
         self.state = HealerState.IDLE
-        self.failures: List[FailureRecord] = []
+        self.failures: deque[FailureRecord] = deque(maxlen=MAX_FAILURE_HISTORY)
         self.retry_count = 0
         self.events = get_event_emitter()
         
         self._monitor_thread: Optional[threading.Thread] = None
+        self._healthy_streak = 0
+        self._failure_streak = 0  # Consecutive failed checks (the current outage)
+        self._heal_attempts = 0  # Heals started during the current outage
+        self._next_heal_at = 0.0  # Monotonic time before which the outage isn't re-healed
+        self._logs_future: Optional[Future] = None
         self._stop_flag = threading.Event()
+        # Set by report_failure() (e.g. from 5xx middleware) to wake the monitor early
+        self._failure_signal = threading.Event()
+        self._start_workers()
+        
+        # One pooled keep-alive connection for health probes (no per-probe handshake)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        
+        # Fix/QA agents, built on first heal attempt and reused until reset()
+        self._engineer: Optional[Any] = None
+        self._qa: Optional[Any] = None
         
         # Callbacks for external integrations
         self._on_escalate: Optional[Callable[[FailureRecord], None]] = None
@@ -115,6 +186,22 @@ class SelfHealer:
             reset_timeout=120.0,
         )
     
+    def _start_workers(self) -> None:
+        """Create the worker pools and the event emitter thread (released by stop())."""
+        # The time-boxed fix/QA calls run here
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="self_healer")
+        # Log reads get their own worker, so a hung read (e.g. a stalled
+        # network mount) can't take a slot the fix/QA calls need
+        self._log_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="self_healer_logs")
+        
+        # Events are emitted from their own thread so slow subscribers
+        # (e.g. WebSocket pushes) never delay the next health probe
+        self._event_q: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._event_thread = threading.Thread(
+            target=self._drain_events, name="self_healer_events", daemon=True
+        )
+        self._event_thread.start()
+    
     # ─── Public API ──────────────────────────────────────────────────────────
     
     def start(self) -> None:
@@ -122,9 +209,14 @@ class SelfHealer:
         if self._monitor_thread and self._monitor_thread.is_alive():
             return
         
+        if not self._event_thread.is_alive():
+            self._start_workers()  # Restarted after stop()
         self._stop_flag.clear()
+        self._failure_signal.clear()
         self.state = HealerState.MONITORING
-        self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_loop, name="self_healer_monitor", daemon=True
+        )
         self._monitor_thread.start()
         
         self._emit_event("SELF_HEALER_STARTED", {
@@ -133,10 +225,26 @@ class SelfHealer:
         })
     
     def stop(self) -> None:
-        """Stop health monitoring."""
+        """Stop health monitoring and release the worker threads."""
         self._stop_flag.set()
+        self._failure_signal.set()  # Wake the monitor so it exits promptly
+        self._http.close()
         self.state = HealerState.STOPPED
         self._emit_event("SELF_HEALER_STOPPED", {})
+        self._event_q.put(None)  # Emitter exits after delivering what's queued
+        # A heal still in flight sees its submit fail and returns an error
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._log_pool.shutdown(wait=False, cancel_futures=True)
+        self._logs_future = None
+    
+    def report_failure(self) -> None:
+        """
+        Signal an observed production failure (e.g. a 5xx seen by middleware).
+        
+        Wakes the monitor loop to confirm with a health check right away
+        instead of waiting out the poll interval. Safe to call from any thread.
+        """
+        self._failure_signal.set()
     
     def check_health(self) -> Dict[str, Any]:
         """
@@ -146,7 +254,7 @@ class SelfHealer:
             {"healthy": bool, "status_code": int, "error": str}
         """
         try:
-            response = requests.get(self.health_url, timeout=HEALTH_TIMEOUT)
+            response = self._http.get(self.health_url, timeout=HEALTH_TIMEOUT)
             return {
                 "healthy": response.status_code < 500,
                 "status_code": response.status_code,
@@ -205,17 +313,67 @@ class SelfHealer:
             try:
                 health = self.check_health()
                 
-                if not health["healthy"]:
-                    self._handle_failure(health)
+                if health["healthy"]:
+                    self._healthy_streak += 1
+                    self._failure_streak = 0
+                    self._heal_attempts = 0
+                else:
+                    self._healthy_streak = 0
+                    self._failure_streak += 1
+                    if self._should_heal():
+                        self._heal_attempts += 1
+                        self._next_heal_at = time.monotonic() + min(
+                            MAX_HEAL_RETRY_INTERVAL,
+                            HEAL_RETRY_INTERVAL * 2 ** (self._heal_attempts - 1),
+                        )
+                        self._handle_failure(health)
                     
             except Exception as e:
+                self._healthy_streak = max(self._healthy_streak, 1)  # Don't spin on monitor errors
                 self._handle_exception(e)
             
-            # Wait for next check or stop signal
-            self._stop_flag.wait(timeout=MONITOR_INTERVAL)
+            # Wait for next check, a reported failure, or stop signal
+            self._failure_signal.wait(timeout=self._next_interval())
+            self._failure_signal.clear()
+    
+    def _should_heal(self) -> bool:
+        """
+        Whether the current failed check should start a heal attempt.
+        
+        A single failure is only re-probed; healing starts once
+        FAILURES_TO_CONFIRM checks in a row fail. Within one outage it is
+        retried no sooner than the backoff set by the previous attempt,
+        and not at all while an escalation waits for a human.
+        """
+        if self._failure_streak < FAILURES_TO_CONFIRM:
+            return False
+        if self.state == HealerState.AWAITING_HUMAN:
+            return False
+        return self._heal_attempts == 0 or time.monotonic() >= self._next_heal_at
+    
+    def _next_interval(self) -> float:
+        """
+        Adaptive poll interval: re-probe quickly to confirm a first failure,
+        then back off exponentially both while checks stay healthy and
+        while an outage persists.
+        """
+        if self._healthy_streak == 0:
+            if 0 < self._failure_streak < FAILURES_TO_CONFIRM:
+                return FAILURE_RECHECK_INTERVAL
+            streak = max(0, self._failure_streak - FAILURES_TO_CONFIRM)
+        else:
+            streak = self._healthy_streak
+        return min(MONITOR_INTERVAL, RECOVERY_INTERVAL * 2 ** min(streak, 6))
     
     def _handle_failure(self, health: Dict[str, Any]) -> None:
         """Handle detected health check failure."""
+        # Start collecting logs for context while the record is built and announced.
+        # A read still stuck from an earlier failure is waited on again rather
+        # than queueing another one behind it.
+        if self._logs_future is None or self._logs_future.done():
+            self._logs_future = self._log_pool.submit(self._collect_logs)
+        logs_future = self._logs_future
+        
         record = FailureRecord(
             timestamp=time.time(),
             error_type="http_5xx" if health["status_code"] >= 500 else "connection_error",
@@ -228,9 +386,10 @@ class SelfHealer:
             "error": health.get("error"),
         })
         
-        # Collect logs for context
-        logs = self._collect_logs()
-        record.stack_trace = logs
+        try:
+            record.stack_trace = logs_future.result(timeout=LOG_COLLECT_TIMEOUT)
+        except FutureTimeout:
+            record.stack_trace = "Log collection timed out"
         
         self.failures.append(record)
         try:
@@ -326,7 +485,7 @@ Status Code: {failure.status_code}
 Error: {failure.error_message}
 
 STACK TRACE / LOGS:
-{failure.stack_trace}
+{_extract_anomalies(failure.stack_trace)}
 
 FIX REQUIREMENTS:
 - Identify the root cause
@@ -336,14 +495,23 @@ FIX REQUIREMENTS:
 """
         
         try:
-            engineer = EngineerAgent(self.engine.prd, self.engine.roadmap)
+            if self._engineer is None:
+                self._engineer = EngineerAgent(self.engine.prd, self.engine.roadmap)
+            engineer = self._engineer
             
             # Use fix mode if available
             fix_prompt = f"Fix this production error:\n{context}"
-            fix_code = engineer.generate_file_with_memory("fix_patch.py") if hasattr(engineer, 'generate_file_with_memory') else None
+            fix_code = None
+            if hasattr(engineer, 'generate_file_with_memory'):
+                # Bounded so a wedged LLM call can't hold the healer indefinitely
+                future = self._pool.submit(engineer.generate_file_with_memory, "fix_patch.py")
+                fix_code = future.result(timeout=FIX_TIMEOUT)
             
             return {"success": True, "fix": fix_code}
             
+        except FutureTimeout:
+            self._emit_event("SELF_HEALING_FIX_TIMEOUT", {"stage": "fix", "timeout": FIX_TIMEOUT})
+            return {"success": False, "error": f"Fix generation timed out after {FIX_TIMEOUT}s"}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
@@ -352,8 +520,12 @@ FIX REQUIREMENTS:
         from backend.agents.qa_tester import QATesterAgent
         
         try:
-            qa = QATesterAgent(prd=self.engine.prd, project_path=self.project_path)
-            return qa.run()
+            if self._qa is None:
+                self._qa = QATesterAgent(prd=self.engine.prd, project_path=self.project_path)
+            return self._pool.submit(self._qa.run).result(timeout=QA_TIMEOUT)
+        except FutureTimeout:
+            self._emit_event("SELF_HEALING_FIX_TIMEOUT", {"stage": "qa", "timeout": QA_TIMEOUT})
+            return {"status": "timeout", "errors": [f"QA timed out after {QA_TIMEOUT}s"]}
         except Exception as e:
             return {"status": "error", "errors": [str(e)]}
     
@@ -399,10 +571,15 @@ FIX REQUIREMENTS:
     # ─── Helpers ─────────────────────────────────────────────────────────────
     
     def _collect_logs(self) -> str:
-        """Collect recent production logs."""
+        """Collect recent production logs (reads only the tail of the file)."""
         try:
-            with open(self.log_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with open(self.log_path, "rb") as f:
+                # 4 bytes per char covers any UTF-8 sequence in the tail
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - LOG_TAIL_SIZE * 4))
+                content = f.read().decode("utf-8", errors="replace")
+                if "\r" in content:
+                    content = content.replace("\r\n", "\n").replace("\r", "\n")
                 return content[-LOG_TAIL_SIZE:]
         except FileNotFoundError:
             return "No logs found"
@@ -410,18 +587,36 @@ FIX REQUIREMENTS:
             return f"Log collection failed: {e}"
     
     def _emit_event(self, event_name: str, payload: Dict[str, Any]) -> None:
-        """Emit a healer event."""
+        """Queue a healer event for the emitter thread."""
         # Use AGENT_STATUS for healer events
-        self.events.emit(EngineEventType.AGENT_STATUS, {
-            "agent": "self_healer",
-            "event": event_name,
-            **payload,
-        })
+        try:
+            self._event_q.put_nowait({
+                "agent": "self_healer",
+                "event": event_name,
+                **payload,
+            })
+        except queue.Full:
+            logger.warning("Event queue full, dropping %s", event_name)
+    
+    def _drain_events(self) -> None:
+        """Emitter thread: deliver queued events in order."""
+        while True:
+            payload = self._event_q.get()
+            if payload is None:
+                return  # stop()
+            try:
+                self.events.emit(EngineEventType.AGENT_STATUS, payload)
+            except Exception:
+                logger.exception("Failed to emit %s", payload.get("event"))
     
     def reset(self) -> None:
         """Reset healer state."""
         self.retry_count = 0
-        self.failures = []
+        self._failure_streak = 0
+        self._heal_attempts = 0
+        self.failures.clear()
+        self._engineer = None  # Rebuilt from the engine's current PRD/roadmap
+        self._qa = None
         self.state = HealerState.IDLE
 
 
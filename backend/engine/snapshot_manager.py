@@ -20,23 +20,118 @@ Usage:
     mgr.restore_snapshot(snapshot_id)
 """
 
+import hashlib
 import json
 import os
 import shutil
+import threading
+import time
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from backend.engine.events import get_event_emitter, EngineEventType
 
+# Try to import orjson for fast metadata serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ─── Constants ──────────────────────────────────────────────────────────────
 
 MAX_SNAPSHOTS = 50  # Maximum snapshots to keep
 SNAPSHOT_DIR = "snapshots"
+RESTORE_CHUNK_SIZE = 1024 * 1024  # Bytes per read when extracting archive members
+HASH_CHUNK_SIZE = 1024 * 1024  # Bytes per read when hashing project files
+MAX_SNAPSHOT_FILE_BYTES = 5_000_000  # Files larger than this are left out
+OBJECTS_DIR = "objects"  # Content-addressed blob store under the snapshot dir
+STORE_WORKERS = 4  # Threads hashing and storing project files
+FILE_CACHE_NAME = ".cache.json"  # {project_path: {rel_path: [mtime_ns, size, hash]}}
+RACY_WINDOW_NS = 2_000_000_000  # Files modified this close to a snapshot are re-hashed next time
+
+# Left out of snapshots
+EXCLUDE_DIRS = frozenset({"__pycache__", "node_modules", ".git", ".venv", ".env", "snapshots"})
+EXCLUDE_EXTS = (".pyc", ".db", ".sqlite", ".sqlite3")  # Name suffixes, so ".db" itself matches
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _scan_files(path: str, prefix: str = ""):
+    """
+    Yield (rel_path, path, stat_result) for every file under path not excluded
+    by EXCLUDE_DIRS / EXCLUDE_EXTS.
+    
+    DirEntry caches its type and stat result, so each file costs at most
+    one stat call and no path re-joining.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDE_DIRS:
+                    yield from _scan_files(entry.path, prefix + entry.name + os.sep)
+            elif entry.is_file():
+                if entry.name.endswith(EXCLUDE_EXTS):
+                    continue
+                yield prefix + entry.name, entry.path, entry.stat()
+        except OSError:
+            continue
+
+
+def _place_file(src: str, dst: str, link: bool) -> bool:
+    """
+    Put a copy or hard link of src at dst.
+    
+    Goes through a temp name and a rename, so an existing dst (possibly
+    itself a link to a blob) is replaced rather than written into.
+    
+    Returns:
+        Whether linking is still worth trying for later files
+    """
+    tmp = f"{dst}.{uuid.uuid4().hex[:8]}.tmp"
+    if link:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            link = False  # Different filesystem or no link support: copy from here on
+        else:
+            os.replace(tmp, dst)
+            return True
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+    return link
+
+
+def _hash_file(path: str) -> str:
+    """Content hash of a file, read in HASH_CHUNK_SIZE chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 # ─── Snapshot Metadata ──────────────────────────────────────────────────────
@@ -52,6 +147,8 @@ class SnapshotMeta:
     engine_state: str
     token_cost: float
     archive_path: str
+    manifest: Dict[str, str] = field(default_factory=dict)  # rel_path -> blob hash
+    status: str = "ready"  # pending, ready, failed
     
     def to_dict(self) -> dict:
         return {
@@ -62,6 +159,7 @@ class SnapshotMeta:
             "total_size_bytes": self.total_size_bytes,
             "engine_state": self.engine_state,
             "token_cost": round(self.token_cost, 6),
+            "status": self.status,
         }
 
 
@@ -78,15 +176,23 @@ class SnapshotManager:
     - Semantic index stats
     - Agent configuration
     
-    Storage: ZIP archive + JSON metadata
+    Storage: content-addressed file blobs shared by all snapshots,
+    a JSON metadata file holding each snapshot's manifest, and a ZIP
+    archive with the engine state
     """
     
     def __init__(self, storage_path: str = SNAPSHOT_DIR):
         self.storage_path = storage_path
-        self._snapshots: Dict[str, SnapshotMeta] = {}
+        self.objects_path = os.path.join(storage_path, OBJECTS_DIR)
+        self._meta_paths: Dict[str, str] = {}  # Every snapshot on disk
+        self._snapshots: Dict[str, SnapshotMeta] = {}  # Metadata parsed so far
+        self._ready: Dict[str, threading.Event] = {}  # Set once a snapshot's write finishes
+        self._file_cache: Optional[Dict[str, Dict[str, list]]] = None  # Writer-only, loaded on first write
+        # Single writer: snapshot writes, pruning and blob GC never overlap
+        self._writer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot_writer")
         self.events = get_event_emitter()
         
-        os.makedirs(storage_path, exist_ok=True)
+        os.makedirs(self.objects_path, exist_ok=True)
         self._load_index()
     
     def create_snapshot(
@@ -95,6 +201,7 @@ class SnapshotManager:
         engine_state: str = "idle",
         token_summary: Optional[Dict[str, Any]] = None,
         label: str = "",
+        background: bool = False,
     ) -> str:
         """
         Create a full system snapshot.
@@ -104,103 +211,232 @@ class SnapshotManager:
             engine_state: Current engine state
             token_summary: Token ledger summary dict
             label: Human-readable label
+            background: Return as soon as the snapshot is registered and let
+                the writer thread store it; its status goes from "pending" to
+                "ready" (or "failed"). Files are read when the writer reaches
+                them, so use wait_ready() before changing the project if the
+                snapshot must capture its current state.
             
         Returns:
             Snapshot ID
         """
         snapshot_id = f"snap_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
-        archive_path = os.path.join(self.storage_path, f"{snapshot_id}.zip")
-        meta_path = os.path.join(self.storage_path, f"{snapshot_id}.json")
-        
-        file_count = 0
-        total_size = 0
-        
-        # Create ZIP archive of project files
-        exclude_dirs = {"__pycache__", "node_modules", ".git", ".venv", ".env", "snapshots"}
-        exclude_exts = {".pyc", ".db", ".sqlite", ".sqlite3"}
         
-        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            if os.path.isdir(project_path):
-                for root, dirs, files in os.walk(project_path):
-                    # Skip excluded directories
-                    dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                    
-                    for filename in files:
-                        if any(filename.endswith(ext) for ext in exclude_exts):
-                            continue
-                        
-                        filepath = os.path.join(root, filename)
-                        rel_path = os.path.relpath(filepath, project_path)
-                        
-                        try:
-                            file_size = os.path.getsize(filepath)
-                            if file_size > 5_000_000:  # Skip files > 5MB
-                                continue
-                            
-                            zf.write(filepath, f"files/{rel_path}")
-                            file_count += 1
-                            total_size += file_size
-                        except (PermissionError, OSError):
-                            pass
-            
-            # Store engine state as JSON inside the ZIP
-            state_data = {
-                "engine_state": engine_state,
-                "token_summary": token_summary or {},
-                "snapshot_time": datetime.utcnow().isoformat(),
-            }
-            zf.writestr("state.json", json.dumps(state_data, indent=2))
-        
-        # Create metadata
         meta = SnapshotMeta(
             id=snapshot_id,
-            label=label or f"Snapshot {len(self._snapshots) + 1}",
+            label=label or f"Snapshot {len(self._meta_paths) + 1}",
             created_at=datetime.utcnow().isoformat(),
-            file_count=file_count,
-            total_size_bytes=total_size,
+            file_count=0,
+            total_size_bytes=0,
             engine_state=engine_state,
             token_cost=token_summary.get("total_cost_usd", 0) if token_summary else 0,
-            archive_path=archive_path,
+            archive_path=os.path.join(self.storage_path, f"{snapshot_id}.zip"),
+            status="pending",
         )
         
-        # Save metadata
-        with open(meta_path, 'w') as f:
-            json.dump(meta.to_dict(), f, indent=2)
-        
+        self._ready[snapshot_id] = threading.Event()
+        self._meta_paths[snapshot_id] = os.path.join(self.storage_path, f"{snapshot_id}.json")
         self._snapshots[snapshot_id] = meta
+        future = self._writer_pool.submit(self._write_snapshot, meta, project_path, token_summary)
+        if not background:
+            future.result()  # Re-raises a failed write
+        
+        return snapshot_id
+    
+    def wait_ready(self, snapshot_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a snapshot has been written.
+        
+        Returns:
+            True if the snapshot exists and is ready
+        """
+        ready = self._ready.get(snapshot_id)
+        if ready is not None:
+            ready.wait(timeout)
+        meta = self._load_meta(snapshot_id)
+        return meta is not None and meta.status == "ready"
+    
+    def close(self) -> None:
+        """Finish queued snapshot writes and stop the writer."""
+        self._writer_pool.shutdown(wait=True)
+    
+    def _write_snapshot(
+        self,
+        meta: SnapshotMeta,
+        project_path: str,
+        token_summary: Optional[Dict[str, Any]],
+    ) -> None:
+        """Writer thread: store a pending snapshot's files, state and metadata."""
+        try:
+            started_ns = time.time_ns()
+            
+            # Files whose mtime and size match the last snapshot of this
+            # project reuse its hash; the rest are hashed into the object store
+            cache_key = os.path.abspath(project_path)
+            cached = self._get_file_cache().get(cache_key, {})
+            
+            def store(member: tuple) -> tuple:
+                rel_path, filepath, st = member
+                hit = cached.get(rel_path)
+                if (hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size
+                        and os.path.exists(self._blob_path(hit[2]))):
+                    return rel_path, st, (hit[2], st.st_size)
+                return rel_path, st, self._store_blob(filepath)
+            
+            # Files are handed to the pool as the scan finds them, so walking
+            # the tree overlaps with hashing; blobs are streamed in chunks,
+            # so in-flight files don't hold their contents in memory
+            scanned = ()
+            if os.path.isdir(project_path):
+                scanned = (
+                    member for member in _scan_files(project_path)
+                    if member[2].st_size <= MAX_SNAPSHOT_FILE_BYTES
+                )
+            
+            manifest: Dict[str, str] = {}
+            fresh: Dict[str, list] = {}
+            total_size = 0
+            with ThreadPoolExecutor(max_workers=STORE_WORKERS, thread_name_prefix="snapshot") as pool:
+                for rel_path, st, blob in pool.map(store, scanned):
+                    if blob is None:
+                        continue
+                    manifest[rel_path], size = blob
+                    total_size += size
+                    # A file changed within the mtime granularity could look unchanged later
+                    if st.st_mtime_ns < started_ns - RACY_WINDOW_NS:
+                        fresh[rel_path] = [st.st_mtime_ns, st.st_size, manifest[rel_path]]
+            self._file_cache[cache_key] = fresh
+            self._save_file_cache()
+            
+            with zipfile.ZipFile(meta.archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+                # Store engine state as JSON inside the ZIP
+                state_data = {
+                    "engine_state": meta.engine_state,
+                    "token_summary": token_summary or {},
+                    "snapshot_time": datetime.utcnow().isoformat(),
+                }
+                zf.writestr("state.json", _dumps(state_data))
+            
+            meta.manifest = manifest
+            meta.file_count = len(manifest)
+            meta.total_size_bytes = total_size
+            meta.status = "ready"
+            
+            # Save metadata
+            with open(self._meta_paths[meta.id], 'wb') as f:
+                f.write(_dumps({**meta.to_dict(), "manifest": manifest}))
+        except Exception as e:
+            meta.status = "failed"
+            self._emit_event("SNAPSHOT_FAILED", {
+                "snapshot_id": meta.id,
+                "error": str(e),
+            })
+            raise
+        finally:
+            self._ready.pop(meta.id).set()
         
         # Enforce limit
         self._prune_old_snapshots()
         
         self._emit_event("SNAPSHOT_CREATED", {
-            "snapshot_id": snapshot_id,
+            "snapshot_id": meta.id,
             "label": meta.label,
-            "file_count": file_count,
+            "file_count": meta.file_count,
         })
+    
+    def _get_file_cache(self) -> Dict[str, Dict[str, list]]:
+        if self._file_cache is None:
+            try:
+                with open(os.path.join(self.storage_path, FILE_CACHE_NAME), 'rb') as f:
+                    self._file_cache = _loads(f.read())
+            except Exception:
+                self._file_cache = {}
+        return self._file_cache
+    
+    def _save_file_cache(self) -> None:
+        """Persist the mtime/size cache; losing it only costs re-hashing."""
+        cache_path = os.path.join(self.storage_path, FILE_CACHE_NAME)
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self._file_cache))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.objects_path, digest[:2], digest)
+    
+    def _store_blob(self, filepath: str) -> Optional[tuple]:
+        """
+        Add a file to the object store.
         
-        return snapshot_id
+        Returns:
+            (hash, size), or None if the file couldn't be read
+        """
+        try:
+            digest = _hash_file(filepath)
+            blob_path = self._blob_path(digest)
+            if os.path.exists(blob_path):
+                return digest, os.path.getsize(blob_path)
+            
+            # Copy first, then re-hash the copy: the source may change under us,
+            # and a blob must never be stored under a hash it doesn't match.
+            tmp_path = os.path.join(self.objects_path, f".tmp_{uuid.uuid4().hex}")
+            try:
+                shutil.copyfile(filepath, tmp_path)
+                digest = _hash_file(tmp_path)
+                blob_path = self._blob_path(digest)
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                size = os.path.getsize(tmp_path)
+                os.chmod(tmp_path, 0o444)  # Blobs are immutable; linked restores share them
+                os.replace(tmp_path, blob_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            return digest, size
+        except OSError:
+            return None
     
-    def restore_snapshot(self, snapshot_id: str, target_path: str) -> Dict[str, Any]:
+    def restore_snapshot(self, snapshot_id: str, target_path: str, link: bool = False) -> Dict[str, Any]:
         """
         Restore a snapshot to the target path.
         
         Args:
             snapshot_id: ID of snapshot to restore
             target_path: Where to restore files
+            link: Hard-link files to their blobs instead of copying them
+                (copies anyway across filesystems). Linked files are
+                read-only, since an in-place edit would change the snapshot.
             
         Returns:
             Dict with restore details
         """
-        meta = self._snapshots.get(snapshot_id)
+        self.wait_ready(snapshot_id)
+        meta = self._load_meta(snapshot_id)
         if not meta:
             raise ValueError(f"Snapshot '{snapshot_id}' not found")
+        if meta.status == "failed":
+            raise RuntimeError(f"Snapshot '{snapshot_id}' failed to write")
         
         if not os.path.exists(meta.archive_path):
             raise FileNotFoundError(f"Snapshot archive not found: {meta.archive_path}")
         
         restored_count = 0
         state_data = {}
+        created_dirs: set = set()
         
+        for rel_path, digest in meta.manifest.items():
+            target = os.path.join(target_path, rel_path)
+            target_dir = os.path.dirname(target)
+            if target_dir not in created_dirs:
+                os.makedirs(target_dir, exist_ok=True)
+                created_dirs.add(target_dir)
+            
+            link = _place_file(self._blob_path(digest), target, link)
+            restored_count += 1
+        
+        # Older snapshots keep their files inside the archive
         with zipfile.ZipFile(meta.archive_path, 'r') as zf:
             for info in zf.infolist():
                 if info.filename.startswith("files/"):
@@ -209,14 +445,18 @@ class SnapshotManager:
                         continue
                     
                     target = os.path.join(target_path, rel_path)
-                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    target_dir = os.path.dirname(target)
+                    if target_dir not in created_dirs:
+                        os.makedirs(target_dir, exist_ok=True)
+                        created_dirs.add(target_dir)
                     
+                    # Stream in 1MB chunks so large members never sit in memory whole
                     with zf.open(info) as src, open(target, 'wb') as dst:
-                        dst.write(src.read())
+                        shutil.copyfileobj(src, dst, RESTORE_CHUNK_SIZE)
                     restored_count += 1
                 
                 elif info.filename == "state.json":
-                    state_data = json.loads(zf.read(info))
+                    state_data = _loads(zf.read(info))
         
         self._emit_event("SNAPSHOT_RESTORED", {
             "snapshot_id": snapshot_id,
@@ -233,19 +473,28 @@ class SnapshotManager:
     def list_snapshots(self) -> List[dict]:
         """List all available snapshots (newest first)."""
         return sorted(
-            [m.to_dict() for m in self._snapshots.values()],
+            [m.to_dict() for m in self._all_metas()],
             key=lambda x: x["created_at"],
             reverse=True,
         )
     
     def get_snapshot(self, snapshot_id: str) -> Optional[dict]:
         """Get metadata for a specific snapshot."""
-        meta = self._snapshots.get(snapshot_id)
+        meta = self._load_meta(snapshot_id)
         return meta.to_dict() if meta else None
     
     def delete_snapshot(self, snapshot_id: str) -> bool:
-        """Delete a snapshot."""
-        meta = self._snapshots.get(snapshot_id)
+        """Delete a snapshot. Its unused blobs are collected by the writer."""
+        self.wait_ready(snapshot_id)
+        if not self._remove_snapshot(snapshot_id):
+            return False
+        
+        self._writer_pool.submit(self._collect_garbage)
+        return True
+    
+    def _remove_snapshot(self, snapshot_id: str) -> bool:
+        """Remove a snapshot's archive and metadata, leaving its blobs."""
+        meta = self._load_meta(snapshot_id)
         if not meta:
             return False
         
@@ -253,15 +502,35 @@ class SnapshotManager:
         try:
             if os.path.exists(meta.archive_path):
                 os.remove(meta.archive_path)
-            meta_path = meta.archive_path.replace('.zip', '.json')
+            meta_path = self._meta_paths[snapshot_id]
             if os.path.exists(meta_path):
                 os.remove(meta_path)
         except OSError:
             pass
         
-        del self._snapshots[snapshot_id]
+        self._meta_paths.pop(snapshot_id, None)
+        self._snapshots.pop(snapshot_id, None)
         return True
     
+    def _collect_garbage(self) -> int:
+        """Delete blobs no remaining snapshot refers to."""
+        referenced = set()
+        for meta in self._all_metas():
+            referenced.update(meta.manifest.values())
+        
+        removed = 0
+        for bucket in os.scandir(self.objects_path):
+            if not bucket.is_dir():
+                continue
+            for blob in os.scandir(bucket.path):
+                if blob.name not in referenced:
+                    try:
+                        os.remove(blob.path)
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
+    
     def diff_snapshots(self, snap_a: str, snap_b: str) -> Dict[str, Any]:
         """
         Compare two snapshots.
@@ -269,8 +538,10 @@ class SnapshotManager:
         Returns:
             Dict with added, removed, and modified files
         """
-        files_a = self._list_archive_files(snap_a)
-        files_b = self._list_archive_files(snap_b)
+        self.wait_ready(snap_a)
+        self.wait_ready(snap_b)
+        files_a = self._list_files(snap_a)
+        files_b = self._list_files(snap_b)
         
         set_a = set(files_a.keys())
         set_b = set(files_b.keys())
@@ -292,10 +563,20 @@ class SnapshotManager:
             "unchanged": len(set_a & set_b) - len(modified),
         }
     
-    def _list_archive_files(self, snapshot_id: str) -> Dict[str, int]:
-        """List files in a snapshot archive with sizes."""
-        meta = self._snapshots.get(snapshot_id)
-        if not meta or not os.path.exists(meta.archive_path):
+    def _list_files(self, snapshot_id: str) -> Dict[str, Any]:
+        """
+        List files in a snapshot with a value that changes with their content.
+        
+        Manifest hashes for snapshots in the object store; for older
+        snapshots that keep their files inside the ZIP, the (size, CRC32)
+        pair already stored in the archive's central directory.
+        """
+        meta = self._load_meta(snapshot_id)
+        if not meta:
+            return {}
+        if meta.manifest:
+            return meta.manifest
+        if not os.path.exists(meta.archive_path):
             return {}
         
         files = {}
@@ -304,52 +585,77 @@ class SnapshotManager:
                 if info.filename.startswith("files/"):
                     rel = info.filename[6:]
                     if rel:
-                        files[rel] = info.file_size
+                        files[rel] = (info.file_size, info.CRC)
         return files
     
     def _prune_old_snapshots(self) -> None:
         """Remove oldest snapshots if exceeding limit."""
-        if len(self._snapshots) <= MAX_SNAPSHOTS:
+        if len(self._meta_paths) <= MAX_SNAPSHOTS:
             return
         
         # Sort by creation time, remove oldest
-        sorted_snaps = sorted(
-            self._snapshots.items(),
-            key=lambda x: x[1].created_at,
-        )
+        sorted_snaps = sorted(self._all_metas(), key=lambda m: m.created_at)
         
-        while len(self._snapshots) > MAX_SNAPSHOTS:
-            snap_id, _ = sorted_snaps.pop(0)
-            self.delete_snapshot(snap_id)
+        while len(self._meta_paths) > MAX_SNAPSHOTS:
+            self._remove_snapshot(sorted_snaps.pop(0).id)
+        self._collect_garbage()
     
     def _load_index(self) -> None:
-        """Load snapshot index from disk."""
+        """
+        Index snapshots on disk without reading their metadata.
+        
+        A snapshot counts only if both its metadata and its archive exist;
+        metadata is parsed on first access by _load_meta.
+        """
         if not os.path.isdir(self.storage_path):
             return
         
-        for filename in os.listdir(self.storage_path):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.storage_path, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    
-                    snap_id = data.get("id", filename.replace('.json', ''))
-                    archive_path = os.path.join(self.storage_path, f"{snap_id}.zip")
-                    
-                    if os.path.exists(archive_path):
-                        self._snapshots[snap_id] = SnapshotMeta(
-                            id=snap_id,
-                            label=data.get("label", ""),
-                            created_at=data.get("created_at", ""),
-                            file_count=data.get("file_count", 0),
-                            total_size_bytes=data.get("total_size_bytes", 0),
-                            engine_state=data.get("engine_state", "idle"),
-                            token_cost=data.get("token_cost", 0),
-                            archive_path=archive_path,
-                        )
-                except Exception:
-                    pass
+        archives = set()
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json'):
+                    self._meta_paths[entry.name[:-5]] = entry.path
+                elif entry.name.endswith('.zip'):
+                    archives.add(entry.name[:-4])
+        
+        for snap_id in self._meta_paths.keys() - archives:
+            del self._meta_paths[snap_id]
+    
+    def _load_meta(self, snapshot_id: str) -> Optional[SnapshotMeta]:
+        """Return a snapshot's metadata, reading it from disk on first access."""
+        meta = self._snapshots.get(snapshot_id)
+        if meta is not None:
+            return meta
+        meta_path = self._meta_paths.get(snapshot_id)
+        if meta_path is None:
+            return None
+        
+        try:
+            with open(meta_path, 'rb') as f:
+                data = _loads(f.read())
+        except Exception:
+            # Unreadable metadata: treat the snapshot as missing
+            del self._meta_paths[snapshot_id]
+            return None
+        
+        meta = SnapshotMeta(
+            id=snapshot_id,
+            label=data.get("label", ""),
+            created_at=data.get("created_at", ""),
+            file_count=data.get("file_count", 0),
+            total_size_bytes=data.get("total_size_bytes", 0),
+            engine_state=data.get("engine_state", "idle"),
+            token_cost=data.get("token_cost", 0),
+            archive_path=os.path.join(self.storage_path, f"{snapshot_id}.zip"),
+            manifest=data.get("manifest", {}),
+        )
+        self._snapshots[snapshot_id] = meta
+        return meta
+    
+    def _all_metas(self) -> List[SnapshotMeta]:
+        """Metadata for every snapshot, loading any not yet read."""
+        metas = (self._load_meta(snap_id) for snap_id in list(self._meta_paths))
+        return [meta for meta in metas if meta is not None]
     
     def _emit_event(self, event_type: str, payload: Dict[str, Any]) -> None:
         """Emit snapshot event."""
@@ -8,6 +8,8 @@ then one of COMPLETED | PARTIAL_SUCCESS | FAILED | CANCELLED | TIMEOUT.
 
 from __future__ import annotations
 
+import sys
+from collections import deque
 from enum import Enum
 from typing import Set
 
@@ -59,6 +61,18 @@ ALLOWED_AGENTS: dict[EngineState, Set[str]] = {
     EngineState.COMPLETED: set(),
 }
 
+# Flat form of ALLOWED_AGENTS for the per-call guard: each agent name gets a
+# bit, each state a mask of its allowed agents (no set probe on the hot path).
+# Keys are interned so names interned at registration match by identity.
+AGENT_BIT: dict[str, int] = {
+    sys.intern(name): bit
+    for bit, name in enumerate(sorted(set().union(*ALLOWED_AGENTS.values())))
+}
+STATE_BITS: dict[EngineState, int] = {
+    state: sum(1 << AGENT_BIT[name] for name in names)
+    for state, names in ALLOWED_AGENTS.items()
+}
+
 
 VALID_TRANSITIONS: dict[EngineState, Set[EngineState]] = {
     EngineState.IDLE: {
@@ -124,6 +138,17 @@ VALID_TRANSITIONS: dict[EngineState, Set[EngineState]] = {
     EngineState.COMPLETED: {EngineState.IDLE},
 }
 
+# Flat form of VALID_TRANSITIONS: bit j of _TRANSITION_MASK[i] is set when
+# the state with ordinal i may move to the state with ordinal j
+_STATE_ORD: dict[EngineState, int] = {state: i for i, state in enumerate(EngineState)}
+_TRANSITION_MASK: list[int] = [
+    sum(1 << _STATE_ORD[target] for target in VALID_TRANSITIONS[state])
+    for state in EngineState
+]
+
+
+MAX_STATE_HISTORY = 256  # Most recent states kept by each state machine
+
 
 class EngineStateError(Exception):
     """Raised when an invalid state transition or agent call is attempted."""
@@ -134,7 +159,7 @@ class EngineStateMachine:
 
     def __init__(self):
         self._state = EngineState.IDLE
-        self._history: list[EngineState] = [EngineState.IDLE]
+        self._history: deque[EngineState] = deque([EngineState.IDLE], maxlen=MAX_STATE_HISTORY)
 
     @property
     def state(self) -> EngineState:
@@ -142,10 +167,10 @@ class EngineStateMachine:
 
     @property
     def history(self) -> list[EngineState]:
-        return self._history.copy()
+        return list(self._history)
 
     def transition(self, new_state: EngineState) -> None:
-        if new_state not in VALID_TRANSITIONS[self._state]:
+        if not (_TRANSITION_MASK[_STATE_ORD[self._state]] >> _STATE_ORD[new_state]) & 1:
             raise EngineStateError(
                 f"Invalid transition: {self._state.value} -> {new_state.value}. "
                 f"Valid targets: {[state.value for state in VALID_TRANSITIONS[self._state]]}"
@@ -155,19 +180,22 @@ class EngineStateMachine:
         self._history.append(new_state)
 
     def validate_agent(self, agent_name: str) -> None:
-        allowed = ALLOWED_AGENTS[self._state]
-        if agent_name not in allowed:
+        bit = AGENT_BIT.get(agent_name, -1)
+        if bit < 0 or not (STATE_BITS[self._state] >> bit) & 1:
+            allowed = ALLOWED_AGENTS[self._state]
             raise EngineStateError(
                 f"Agent '{agent_name}' cannot run in state '{self._state.value}'. "
                 f"Allowed agents: {list(allowed) or 'none'}"
             )
 
     def can_agent_run(self, agent_name: str) -> bool:
-        return agent_name in ALLOWED_AGENTS[self._state]
+        bit = AGENT_BIT.get(agent_name, -1)
+        return bit >= 0 and bool((STATE_BITS[self._state] >> bit) & 1)
 
     def reset(self) -> None:
         self._state = EngineState.IDLE
-        self._history = [EngineState.IDLE]
+        self._history.clear()
+        self._history.append(EngineState.IDLE)
 
     def __repr__(self) -> str:
         return f"EngineStateMachine(state={self._state.value})"
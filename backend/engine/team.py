@@ -15,11 +15,15 @@ from typing import Any, Dict, List, Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
+import logging
+import sys
 import uuid
 
 from backend.engine.role import Role, Message, RoleState
 from backend.engine.environment import Environment
 
+logger = logging.getLogger("team")
+
 
 @dataclass
 class TeamConfig:
@@ -45,30 +49,30 @@ class Team:
         self.idea: str = ""
         self.round: int = 0
         self.is_running: bool = False
-        self._event_callbacks: List[Callable] = []
+        self._safe_callbacks: List[Callable] = []  # Trusted; called unguarded
+        self._user_callbacks: List[Callable] = []  # Failures are logged, not raised
         
     # ─── Team Management ──────────────────────────────────────────────────────
     
     def hire(self, roles: List[Role]) -> None:
         """Add roles to the team."""
         for role in roles:
+            # Interned once here so later dict/set lookups by name compare by identity
+            role.name = sys.intern(role.name)
             role.set_env(self.env)
             role.on_event(self._forward_event)
             self.roles[role.name] = role
             self.env.add_role(role)
         
-        self._emit("team_updated", {
-            "roles": [r.to_dict() for r in self.roles.values()]
-        })
+        # One update for the whole batch
+        self._emit_team_updated()
     
     def fire(self, role_name: str) -> None:
         """Remove a role from the team."""
         if role_name in self.roles:
             role = self.roles.pop(role_name)
             self.env.remove_role(role)
-            self._emit("team_updated", {
-                "roles": [r.to_dict() for r in self.roles.values()]
-            })
+            self._emit_team_updated()
     
     def get_role(self, name: str) -> Optional[Role]:
         """Get a role by name."""
@@ -76,12 +80,25 @@ class Team:
     
     # ─── Event System ─────────────────────────────────────────────────────────
     
-    def on_event(self, callback: Callable) -> None:
-        """Register event callback."""
-        self._event_callbacks.append(callback)
+    def on_event(self, callback: Callable, safe: bool = False) -> None:
+        """
+        Register event callback.
+        
+        Args:
+            callback: Called with each event dict
+            safe: Trusted internal callback. It runs without an exception
+                guard, so anything it raises propagates to the emitter.
+        """
+        if safe:
+            self._safe_callbacks.append(callback)
+        else:
+            self._user_callbacks.append(callback)
     
     def _emit(self, event_type: str, payload: Dict[str, Any]) -> None:
         """Emit event to all callbacks."""
+        if not (self._safe_callbacks or self._user_callbacks):
+            return  # Nobody listening: skip building the event and timestamp
+        
         event = {
             "type": event_type,
             "team_id": self.id,
@@ -89,11 +106,21 @@ class Team:
             "timestamp": datetime.now().isoformat(),
             **payload
         }
-        for cb in self._event_callbacks:
+        for cb in self._safe_callbacks:
+            cb(event)
+        for cb in self._user_callbacks:
             try:
                 cb(event)
             except Exception:
-                pass
+                logger.exception("Team event callback failed on %s", event_type)
+    
+    def _emit_team_updated(self) -> None:
+        """Emit the roster, serializing roles only if someone is listening."""
+        if not (self._safe_callbacks or self._user_callbacks):
+            return
+        self._emit("team_updated", {
+            "roles": [r.to_dict() for r in self.roles.values()]
+        })
     
     def _forward_event(self, event_type: str, payload: Dict[str, Any]) -> None:
         """Forward role events to team callbacks."""
@@ -130,6 +157,7 @@ class Team:
         try:
             while self.round < max_rounds and self.is_running:
                 self.round += 1
+                self.env.advance_round()
                 self._emit("round_started", {"round": self.round})
                 
                 # Run all roles that have work to do
@@ -178,8 +206,9 @@ class Team:
             if role_name in self.roles:
                 role = self.roles[role_name]
                 
-                # Check if role has messages to process
-                if self.env.get_messages_for_role(role):
+                # Check if role has messages to process (fetching dequeues them)
+                messages = self.env.get_messages_for_role(role)
+                if messages:
                     self._emit("role_started", {
                         "role": role.name,
                         "profile": role.profile,
@@ -187,7 +216,7 @@ class Team:
                     })
                     
                     # Deliver messages
-                    for msg in self.env.get_messages_for_role(role):
+                    for msg in messages:
                         role.put_message(msg)
                     
                     # Run role
@@ -206,8 +235,9 @@ class Team:
         """Run independent roles in parallel."""
         tasks = []
         for role in self.roles.values():
-            if self.env.get_messages_for_role(role):
-                for msg in self.env.get_messages_for_role(role):
+            messages = self.env.get_messages_for_role(role)
+            if messages:
+                for msg in messages:
                     role.put_message(msg)
                 tasks.append(role.run())
         
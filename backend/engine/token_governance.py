@@ -7,8 +7,11 @@ Uses Decimal for precise financial calculations.
 
 from __future__ import annotations
 
+import atexit
 import json
 import threading
+import weakref
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date
 from enum import Enum
@@ -17,6 +20,12 @@ from typing import Dict, Optional, Union
 from decimal import Decimal, ROUND_HALF_UP
 import os
 
+# fcntl is POSIX-only; used to serialize flushes from several processes
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 class TokenTier(str, Enum):
     FREE = "free"
@@ -36,13 +45,44 @@ DEFAULT_TIERS: Dict[TokenTier, TierBudget] = {
 }
 
 
+FLUSH_DELAY_SECONDS = 0.5  # Spend is written to disk at most this long after it's applied
+FLUSH_EVERY = 20  # Unwritten spends that force an immediate write
+_USD_PLACES = Decimal("0.000001")  # Spend is stored to the micro-dollar
+
+_INSTANCES: "weakref.WeakSet[TokenGovernance]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    """Write unsaved spend of every live instance before the interpreter exits."""
+    for governance in list(_INSTANCES):
+        governance.flush()
+
+
 class TokenGovernance:
-    """Persists daily spend and enforces per-tier caps."""
+    """
+    Persists daily spend and enforces per-tier caps.
+
+    Spend is kept in memory and written back on a short debounce, so reads
+    never touch the disk and bursts of spends share one write.
+
+    Several processes may share the file (e.g. multiple API workers). Each
+    flush re-reads it under an exclusive lock and adds only this process's
+    unsaved spend, so workers never overwrite each other. Spend recorded by
+    other processes shows up here after this instance's next flush. On
+    platforms without fcntl the lock is skipped; run a single process there.
+    """
 
     def __init__(self, path: Path | None = None):
         self.path = path or Path("run_logs") / "token_governance.json"
         self._lock = threading.Lock()
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._data = self._read()
+        # Spend applied since the last flush: {day: {user_id: (tier, amount)}}
+        self._pending: Dict[str, Dict[str, tuple[str, Decimal]]] = {}
+        self._dirty = 0
+        self._flush_timer: threading.Timer | None = None
+        _INSTANCES.add(self)
 
     def _today(self) -> str:
         return date.today().isoformat()
@@ -57,7 +97,48 @@ class TokenGovernance:
             return {}
 
     def _write(self, payload: Dict[str, Dict[str, Dict[str, float | str]]]) -> None:
-        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Write-then-rename so a crash mid-write never leaves a truncated file
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold an exclusive lock on the spend file across processes (POSIX only)."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.path.with_suffix(".lock"), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def flush(self) -> None:
+        """Write any unsaved spend to disk now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        with self._file_lock():
+            data = self._read()  # Picks up spend flushed by other processes
+            for key_date, users in self._pending.items():
+                day_bucket = data.setdefault(key_date, {})
+                for user_id, (tier, amount) in users.items():
+                    entry = day_bucket.setdefault(user_id, {"tier": tier, "spent_usd": "0"})
+                    entry["tier"] = tier
+                    total = Decimal(str(entry.get("spent_usd", "0"))) + amount
+                    entry["spent_usd"] = str(total.quantize(_USD_PLACES, rounding=ROUND_HALF_UP))
+            self._write(data)
+        self._data = data
+        self._pending = {}
+        self._dirty = 0
 
     def _normalize_tier(self, tier: str | TokenTier | None) -> TokenTier:
         if isinstance(tier, TokenTier):
@@ -79,8 +160,7 @@ class TokenGovernance:
 
         key_date = day or self._today()
         with self._lock:
-            data = self._read()
-            spent_raw = data.get(key_date, {}).get(user_id, {}).get("spent_usd", 0.0)
+            spent_raw = self._data.get(key_date, {}).get(user_id, {}).get("spent_usd", 0.0)
             spent = Decimal(str(spent_raw))
 
         remaining = max(Decimal("0"), cap - spent)
@@ -98,8 +178,7 @@ class TokenGovernance:
         key_date = day or self._today()
 
         with self._lock:
-            data = self._read()
-            day_bucket = data.setdefault(key_date, {})
+            day_bucket = self._data.setdefault(key_date, {})
             entry = day_bucket.setdefault(
                 user_id,
                 {"tier": normalized_tier.value, "spent_usd": "0"},
@@ -108,9 +187,20 @@ class TokenGovernance:
             # Use Decimal for precision
             current = Decimal(str(entry.get("spent_usd", "0")))
             spend_decimal = Decimal(str(spend_usd)) if isinstance(spend_usd, (int, float)) else spend_usd
-            new_total = current + max(Decimal("0"), spend_decimal)
-            entry["spent_usd"] = str(new_total.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP))
-            self._write(data)
+            spend_decimal = max(Decimal("0"), spend_decimal).quantize(_USD_PLACES, rounding=ROUND_HALF_UP)
+            entry["spent_usd"] = str(current + spend_decimal)
+
+            users = self._pending.setdefault(key_date, {})
+            _, pending = users.get(user_id, (None, Decimal("0")))
+            users[user_id] = (normalized_tier.value, pending + spend_decimal)
+
+            self._dirty += 1
+            if self._dirty >= FLUSH_EVERY:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_DELAY_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
     def get_summary(
         self,
@@ -122,8 +212,7 @@ class TokenGovernance:
         cap = DEFAULT_TIERS[normalized_tier].daily_cap_usd
         key_date = day or self._today()
         with self._lock:
-            data = self._read()
-            spent_str = data.get(key_date, {}).get(user_id, {}).get("spent_usd", "0")
+            spent_str = self._data.get(key_date, {}).get(user_id, {}).get("spent_usd", "0")
             spent = Decimal(str(spent_str))
 
         remaining = None if cap is None else max(Decimal("0"), cap - spent)
@@ -81,6 +81,9 @@ class TokenLedger:
         self._agents: Dict[str, AgentUsage] = defaultdict(AgentUsage)
         self._run_id: str | None = None
         self._budget: Optional[Decimal] = None  # None = unlimited
+        # Running totals, updated with each record so budget checks don't re-sum agents
+        self._total_cost = Decimal("0")
+        self._total_tokens = 0
 
     def set_budget(self, max_usd: Union[float, Decimal]) -> None:
         """
@@ -154,18 +157,15 @@ class TokenLedger:
             cost = Decimal("0")
 
         with self._lock:
-            # CRITICAL FIX: Calculate total_cost INSIDE the lock to prevent race conditions
-            # The race condition occurred because total_cost was calculated outside the lock
-            # in some contexts, allowing other threads to modify costs between check and record
-            current_total = sum((a.cost_usd for a in self._agents.values()), Decimal("0"))
-            
-            # Check budget before recording
+            # Check and record under the same lock so concurrent calls can't both pass the check
             if self._budget is not None and cost > 0:
-                projected = current_total + cost
+                projected = self._total_cost + cost
                 if projected > self._budget:
-                    raise BudgetExceededError(self._budget, current_total, cost)
+                    raise BudgetExceededError(self._budget, self._total_cost, cost)
 
             self._agents[agent_name].add(input_tokens, output_tokens, cost)
+            self._total_cost += cost
+            self._total_tokens += input_tokens + output_tokens
 
     def record_simple(self, agent_name: str, tokens: int, cost: Union[float, Decimal]) -> None:
         """
@@ -179,24 +179,29 @@ class TokenLedger:
         Raises:
             BudgetExceededError: If recording would exceed the budget
         """
+        if isinstance(cost, float):
+            cost = Decimal(str(cost))
+
         with self._lock:
             # Check budget before recording (same enforcement as record())
             if self._budget is not None and cost > 0:
-                projected = self.total_cost + cost
+                projected = self._total_cost + cost
                 if projected > self._budget:
-                    raise BudgetExceededError(self._budget, self.total_cost, cost)
+                    raise BudgetExceededError(self._budget, self._total_cost, cost)
             
             self._agents[agent_name].add(0, tokens, cost)
+            self._total_cost += cost
+            self._total_tokens += tokens
     
     @property
     def total_tokens(self) -> int:
         """Total tokens across all agents."""
-        return sum(a.total_tokens for a in self._agents.values())
+        return self._total_tokens
 
     @property
     def total_cost(self) -> Decimal:
         """Total cost in USD across all agents (as Decimal for precision)."""
-        return sum((a.cost_usd for a in self._agents.values()), Decimal("0"))
+        return self._total_cost
 
     @property
     def by_agent(self) -> Dict[str, dict]:
@@ -230,7 +235,10 @@ class TokenLedger:
     
     def reset(self) -> None:
         """Reset all tracking for a new run. Budget is preserved."""
-        self._agents.clear()
+        with self._lock:
+            self._agents.clear()
+            self._total_cost = Decimal("0")
+            self._total_tokens = 0
         self._run_id = None
         # Note: budget is intentionally NOT reset here
     
@@ -28,6 +28,16 @@ class TestTokenLedger:
         self.ledger.reset()
         assert self.ledger.total_cost == 0.0
         assert self.ledger.total_tokens == 0
+    
+    def test_totals_include_simple_records(self):
+        self.ledger.set_budget(1.0)
+        self.ledger.record("pm", input_tokens=10, output_tokens=5, cost=0.25)
+        self.ledger.record_simple("engineer", tokens=20, cost=0.5)
+        assert self.ledger.total_tokens == 35
+        assert self.ledger.total_cost == Decimal("0.75")
+        with pytest.raises(BudgetExceededError):
+            self.ledger.record_simple("engineer", tokens=20, cost=0.5)
+        assert self.ledger.total_cost == Decimal("0.75")
 
 
 class TestBudgetEnforcement:
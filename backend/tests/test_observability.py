@@ -0,0 +1,41 @@
+"""Tests for agent observability stats."""
+
+import json
+import threading
+from backend.engine import observability
+from backend.engine.observability import AgentMetrics
+
+
+def _metrics(agent: str, status: str = "success") -> AgentMetrics:
+    return AgentMetrics(
+        agent=agent, status=status, attempt=1, retries=0, duration_ms=10.0,
+        input_tokens=1, output_tokens=1, total_tokens=2, cost_usd=0.0,
+    )
+
+
+class TestAgentStats:
+    """Concurrent updates stay consistent in memory and on disk."""
+    
+    def test_concurrent_updates(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(observability, "LOG_DIR", tmp_path)
+        monkeypatch.setattr(observability, "AGENT_STATS_FILE", tmp_path / "agent_stats.json")
+        monkeypatch.setattr(observability, "_STATS", None)
+        
+        def worker(agent):
+            for i in range(50):
+                observability._update_agent_stats(_metrics(agent, "success" if i % 5 else "failed"))
+        
+        threads = [threading.Thread(target=worker, args=(f"agent_{n % 2}",)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        on_disk = json.loads(observability.AGENT_STATS_FILE.read_text(encoding="utf-8"))
+        for stats in (observability.get_agent_stats(), on_disk):
+            for name in ("agent_0", "agent_1"):
+                entry = stats["agents"][name]
+                assert entry["runs"] == 200
+                assert entry["failures"] == 40
+                assert entry["failure_rate"] == 0.2
+                assert entry["avg_duration_ms"] == 10.0
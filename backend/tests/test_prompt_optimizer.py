@@ -0,0 +1,133 @@
+"""Tests for Prompt Optimizer persistence."""
+
+import json
+import os
+from backend.engine.prompt_optimizer import (
+    PromptOptimizer, LOG_FILE, STATE_FILE, MAX_OUTCOMES_PER_AGENT, RECENT_OUTCOMES_WINDOW,
+)
+
+
+def _outcome_line(agent: str, quality: float) -> bytes:
+    data = {
+        "agent_name": agent, "prompt_hash": "abc", "prompt_summary": "p",
+        "quality_score": quality, "token_cost": 0.01, "qa_passed": True,
+        "judge_score": None, "hitl_feedback": "", "timestamp": "2026-01-01T00:00:00",
+    }
+    return json.dumps({"kind": "outcome", "data": data}).encode() + b"\n"
+
+
+class TestOptimizerPersistence:
+    """Snapshot + append-only log round trips."""
+    
+    def test_compaction_keeps_last_outcomes_per_agent(self, tmp_path):
+        optimizer = PromptOptimizer(data_path=str(tmp_path))
+        for i in range(MAX_OUTCOMES_PER_AGENT + 50):
+            optimizer.record_outcome("engineer", "prompt", quality_score=i / 1000)
+        for _ in range(10):
+            optimizer.record_outcome("qa", "prompt", quality_score=0.5)
+        optimizer.close()
+        
+        # close() compacts everything into the snapshot and empties the log
+        assert os.path.getsize(tmp_path / LOG_FILE) == 0
+        snapshot = json.loads((tmp_path / STATE_FILE).read_bytes())
+        assert len(snapshot["outcomes"]["engineer"]) == MAX_OUTCOMES_PER_AGENT
+        
+        reloaded = PromptOptimizer(data_path=str(tmp_path))
+        try:
+            engineer = list(reloaded._outcomes["engineer"])
+            assert len(engineer) == MAX_OUTCOMES_PER_AGENT
+            assert engineer[0].quality_score == 50 / 1000
+            assert engineer[-1].quality_score == (MAX_OUTCOMES_PER_AGENT + 49) / 1000
+            assert len(reloaded._outcomes["qa"]) == 10
+            assert reloaded.get_stats("engineer")["samples"] == MAX_OUTCOMES_PER_AGENT
+        finally:
+            reloaded.close()
+    
+    def test_torn_final_log_line_is_skipped(self, tmp_path):
+        torn = _outcome_line("engineer", 0.3)
+        (tmp_path / LOG_FILE).write_bytes(
+            _outcome_line("engineer", 0.1) + _outcome_line("engineer", 0.2) + torn[: len(torn) // 2]
+        )
+        
+        optimizer = PromptOptimizer(data_path=str(tmp_path))
+        try:
+            assert [o.quality_score for o in optimizer._outcomes["engineer"]] == [0.1, 0.2]
+        finally:
+            optimizer.close()
+    
+    def test_writer_thread_records_survive_reload(self, tmp_path):
+        import time
+        
+        optimizer = PromptOptimizer(data_path=str(tmp_path))
+        for i in range(5):
+            optimizer.record_outcome("engineer", "prompt", quality_score=i / 10)
+        
+        # No close(): only what the writer thread has already appended is on disk
+        log_path = tmp_path / LOG_FILE
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            if log_path.exists() and log_path.read_bytes().count(b"\n") == 5:
+                break
+            time.sleep(0.01)
+        
+        reloaded = PromptOptimizer(data_path=str(tmp_path))
+        try:
+            assert [o.quality_score for o in reloaded._outcomes["engineer"]] == [0.0, 0.1, 0.2, 0.3, 0.4]
+        finally:
+            reloaded.close()
+            optimizer.close()
+
+
+class TestSuggestImprovement:
+    """Analysis reads a consistent snapshot and calls the LLM unlocked."""
+    
+    def test_llm_call_runs_outside_the_lock(self, tmp_path, monkeypatch):
+        import threading
+        from backend.engine import prompt_optimizer as optimizer_module
+        
+        optimizer = PromptOptimizer(data_path=str(tmp_path))
+        for _ in range(RECENT_OUTCOMES_WINDOW + 5):
+            optimizer.record_outcome("engineer", "prompt", quality_score=0.2)
+        prompts = []
+        
+        def fake_llm(**kwargs):
+            # Recording during the call would deadlock if the lock were held
+            writer = threading.Thread(
+                target=optimizer.record_outcome, args=("engineer", "prompt"),
+            )
+            writer.start()
+            writer.join(5)
+            assert not writer.is_alive()
+            prompts.append(kwargs["user"])
+            return None
+        
+        monkeypatch.setattr(optimizer_module, "llm_call_simple", fake_llm)
+        try:
+            assert optimizer.suggest_improvement("engineer") is None
+            assert len(prompts) == 1
+            assert prompts[0].count("- Quality: 0.20") == RECENT_OUTCOMES_WINDOW
+            assert len(optimizer._outcomes["engineer"]) == RECENT_OUTCOMES_WINDOW + 6
+        finally:
+            optimizer.close()
+
+
+class TestOptimizerLifetime:
+    """Exit cleanup does not keep optimizers alive."""
+    
+    def test_closed_optimizers_are_released(self, tmp_path):
+        import gc
+        import weakref
+        from backend.engine import prompt_optimizer as optimizer_module
+        
+        optimizer = PromptOptimizer(data_path=str(tmp_path))
+        optimizer.record_outcome("engineer", "prompt", quality_score=0.5)
+        assert optimizer in optimizer_module._INSTANCES
+        
+        optimizer_module._close_all()
+        assert not optimizer._writer_thread.is_alive()
+        assert json.loads((tmp_path / STATE_FILE).read_bytes())["outcomes"]["engineer"]
+        
+        ref = weakref.ref(optimizer)
+        del optimizer
+        gc.collect()
+        assert ref() is None
@@ -0,0 +1,74 @@
+"""Tests for Race Mode."""
+
+import asyncio
+from backend.engine import race_mode
+from backend.engine.race_mode import RaceMode
+
+
+class FailingEngine:
+    """Engine stand-in that spends tokens and then fails."""
+    
+    created = 0
+    
+    def __init__(self, run_id=None):
+        FailingEngine.created += 1
+        self.run_id = run_id
+    
+    def run(self, prompt):
+        raise RuntimeError("LLM unavailable")
+    
+    def get_cost_summary(self):
+        return {"total_cost_usd": 0.25}
+
+
+class TestRaceMode:
+    """Tests for race execution."""
+    
+    def setup_method(self):
+        FailingEngine.created = 0
+    
+    def _race(self, monkeypatch, use_processes):
+        monkeypatch.setattr(race_mode, "AtomsEngine", FailingEngine)
+        race = RaceMode(num_teams=2, use_processes=use_processes)
+        try:
+            return race, asyncio.run(race.race("Build a todo API"))
+        finally:
+            race.close()
+    
+    def test_failed_teams_count_their_cost(self, monkeypatch):
+        race, result = self._race(monkeypatch, use_processes=False)
+        assert result.winner_team == "none"
+        assert result.total_cost == 0.5
+        assert FailingEngine.created == 2
+    
+    def test_failed_teams_count_their_cost_in_processes(self, monkeypatch):
+        race, result = self._race(monkeypatch, use_processes=True)
+        assert race.use_processes
+        assert result.winner_team == "none"
+        # Costs come back from the workers; the parent builds no engines
+        assert result.total_cost == 0.5
+        assert FailingEngine.created == 0
+    
+    def test_completed_event_lists_teams(self, monkeypatch):
+        from backend.engine.events import EngineEventType
+        
+        payloads = []
+        handler = lambda event: payloads.append(event.payload)
+        race = RaceMode(num_teams=2)
+        race.events.on(EngineEventType.AGENT_STATUS, handler)
+        try:
+            monkeypatch.setattr(race_mode, "AtomsEngine", FailingEngine)
+            result = asyncio.run(race.race("Build a todo API"))
+        finally:
+            race.events.off(EngineEventType.AGENT_STATUS, handler)
+            race.close()
+        
+        completed = [
+            p for p in payloads
+            if p.get("event") == "RACE_COMPLETED" and p.get("race_id") == result.race_id
+        ]
+        teams = completed[0]["teams"]
+        assert [t["team_id"] for t in teams] == ["team_A", "team_B"]
+        assert all(t["status"] == "failed" and t["error"] == "LLM unavailable" for t in teams)
+        assert all(t["started_at"] <= t["completed_at"] for t in teams)
+        assert teams[0]["started_at"].endswith("+00:00")
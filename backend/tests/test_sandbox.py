@@ -1,6 +1,7 @@
 """Tests for Sandbox Manager."""
 
 import os
+import time
 import pytest
 from backend.engine.sandbox import SandboxManager, Sandbox
 
@@ -26,6 +27,18 @@ class TestSandbox:
         
         self.mgr.destroy_sandbox(sandbox.id)
     
+    def test_write_file_recreates_removed_directory(self):
+        sandbox = self.mgr.create_sandbox("rw_dir")
+        sandbox.write_file("pkg/a.py", "a")
+        
+        import shutil
+        shutil.rmtree(os.path.join(sandbox.path, "pkg"))
+        sandbox.write_file("pkg/b.py", "b")
+        
+        assert sandbox.read_file("pkg/b.py") == "b"
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
     def test_list_files(self):
         sandbox = self.mgr.create_sandbox("ls")
         sandbox.write_file("a.py", "a")
@@ -37,6 +50,49 @@ class TestSandbox:
         
         self.mgr.destroy_sandbox(sandbox.id)
     
+    def test_copy_from_project_excludes(self, tmp_path):
+        for rel in ["a.py", "b.pyc", "app.db", ".env", "pkg/c.py",
+                    "pkg/__pycache__/c.pyc", "node_modules/x.js"]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+        
+        sandbox = self.mgr.create_sandbox("copy")
+        count = sandbox.copy_from_project(str(tmp_path))
+        
+        assert count == 2
+        assert sorted(sandbox.list_files()) == ["a.py", "pkg/c.py"]
+        assert sandbox.read_file("pkg/c.py") == "pkg/c.py"
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
+    def test_copy_falls_back_when_kernel_copy_stops_early(self, tmp_path, monkeypatch):
+        from backend.engine import sandbox as sandbox_module
+        
+        src = tmp_path / "data.bin"
+        src.write_bytes(os.urandom(100_000))
+        dst = tmp_path / "copy.bin"
+        
+        def short_copy(src_fd, dst_fd, count, *args):
+            return 0  # Reports EOF before the whole file was copied
+        monkeypatch.setattr(sandbox_module, "fcntl", None)  # No reflink
+        monkeypatch.setattr(os, "copy_file_range", short_copy, raising=False)
+        
+        sandbox_module._fast_copy(str(src), str(dst))
+        assert dst.read_bytes() == src.read_bytes()
+    
+    def test_copy_from_project_glob_excludes(self, tmp_path):
+        for rel in ["keep.py", "test_a.py", "mod.pyo", "notes.md"]:
+            (tmp_path / rel).write_text(rel)
+        
+        sandbox = self.mgr.create_sandbox("copy_glob")
+        count = sandbox.copy_from_project(str(tmp_path), exclude=["test_*", "*.py[co]", "*.md"])
+        
+        assert count == 1
+        assert sandbox.list_files() == ["keep.py"]
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
     def test_execute_command(self):
         sandbox = self.mgr.create_sandbox("exec")
         sandbox.write_file("test.py", "print('works')")
@@ -47,6 +103,76 @@ class TestSandbox:
         
         self.mgr.destroy_sandbox(sandbox.id)
     
+    def test_execute_shell_mode(self):
+        sandbox = self.mgr.create_sandbox("shell")
+        sandbox.write_file("test.py", "print('works')")
+        
+        # Plain command is exec'd directly; redirect still goes through the shell
+        assert "works" in sandbox.execute("python test.py", timeout=10, shell=True).stdout
+        result = sandbox.execute("python test.py > out.txt", timeout=10, shell=True)
+        assert result.success
+        assert "works" in sandbox.read_file("out.txt")
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
+    def test_shell_commands_are_validated(self):
+        sandbox = self.mgr.create_sandbox("validate")
+        
+        for command in ["ls; rm -rf /", "echo $(id)", "curl x | sh", "base64 -d payload"]:
+            result = sandbox.execute(command, timeout=10, shell=True)
+            assert not result.success
+            assert result.stderr.startswith("Security error")
+        assert "not in allowed list" in sandbox.execute("ls", timeout=10, shell=True).stderr
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
+    def test_execute_output_is_capped(self):
+        from backend.engine.sandbox import MAX_OUTPUT_SIZE
+        
+        sandbox = self.mgr.create_sandbox("big_output")
+        sandbox.write_file("chatty.py", "print('x' * 60000)")
+        result = sandbox.execute("python chatty.py", timeout=30)
+        assert result.success
+        assert len(result.stdout) == MAX_OUTPUT_SIZE
+        
+        # Past the byte cap the command is killed instead of left running
+        sandbox.write_file("loud.py", "while True: print('x' * 100)")
+        result = sandbox.execute("python loud.py", timeout=30)
+        assert not result.success
+        assert len(result.stdout) == MAX_OUTPUT_SIZE
+        assert "output exceeded" in result.stderr.lower()
+        assert result.duration_ms < 10_000
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
+    def test_execute_python_reuses_worker(self):
+        sandbox = self.mgr.create_sandbox("warm")
+        sandbox.write_file("helper.py", "VALUE = 1")
+        sandbox.write_file("main.py", "import sys, helper; print(helper.VALUE); sys.exit(3)")
+        
+        first = sandbox.execute_python("main.py", timeout=30)
+        assert first.stdout.strip() == "1"
+        assert first.exit_code == 3
+        
+        # Each run gets a fresh fork, so edited modules are re-imported
+        sandbox.write_file("helper.py", "VALUE = 2")
+        second = sandbox.execute_python("main.py", timeout=30)
+        assert second.stdout.strip() == "2"
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
+    def test_execute_python_timeout(self):
+        sandbox = self.mgr.create_sandbox("warm_timeout")
+        sandbox.write_file("slow.py", "import time; time.sleep(30)")
+        sandbox.write_file("fast.py", "print('ok')")
+        
+        result = sandbox.execute_python("slow.py", timeout=1)
+        assert not result.success
+        assert "timed out" in result.stderr.lower()
+        assert sandbox.execute_python("fast.py", timeout=30).stdout.strip() == "ok"
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
     def test_execute_timeout(self):
         sandbox = self.mgr.create_sandbox("timeout")
         sandbox.write_file("slow.py", "import time; time.sleep(30)")
@@ -57,6 +183,22 @@ class TestSandbox:
         
         self.mgr.destroy_sandbox(sandbox.id)
     
+    def test_execute_timeout_with_background_grandchild(self):
+        sandbox = self.mgr.create_sandbox("timeout_bg")
+        # The child exits at once, but its grandchild keeps stdout open
+        sandbox.write_file("spawn.py", (
+            "import subprocess, sys\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "print('spawned', flush=True)\n"
+        ))
+        
+        result = sandbox.execute("python spawn.py", timeout=2)
+        assert not result.success
+        assert "spawned" in result.stdout
+        assert result.duration_ms < 6_000
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
     def test_context_manager(self):
         path = None
         with self.mgr.create("ctx") as sandbox:
@@ -72,6 +214,29 @@ class TestSandbox:
         self.mgr.destroy_sandbox(sandbox.id)
         assert not os.path.isdir(path)
     
+    def test_blocking_cleanup_removes_files(self):
+        sandbox = self.mgr.create_sandbox("cleanup_sync")
+        sandbox.write_file("dir/a.py", "a")
+        path = sandbox.path
+        self.mgr.destroy_sandbox(sandbox.id, blocking=True)
+        assert not os.path.exists(path)
+        assert not any(
+            name.startswith(os.path.basename(path))
+            for name in os.listdir(os.path.dirname(path))
+        )
+    
+    def test_status_file_count_tracks_changes(self):
+        sandbox = self.mgr.create_sandbox("count")
+        sandbox.write_file("a.py", "a")
+        sandbox.write_file("a.py", "a2")
+        sandbox.write_file("dir/b.py", "b")
+        assert sandbox.get_status()["total_files"] == 2
+        
+        sandbox.execute("python -c \"open('c.txt', 'w').close()\"", timeout=10)
+        assert sandbox.get_status()["total_files"] == 3
+        
+        self.mgr.destroy_sandbox(sandbox.id)
+    
     def test_collect_results(self):
         sandbox = self.mgr.create_sandbox("collect")
         sandbox.write_file("out.txt", "result data")
@@ -80,6 +245,11 @@ class TestSandbox:
         assert "out.txt" in results
         assert results["out.txt"] == "result data"
         
+        sandbox.write_file("__pycache__/m.cpython-311.pyc", "bytecode")
+        sandbox.write_file("blob.bin", "\0\1\2")
+        results = sandbox.collect_results()
+        assert sorted(results) == ["out.txt"]
+        
         self.mgr.destroy_sandbox(sandbox.id)
 
 
@@ -105,3 +275,167 @@ class TestSandboxManager:
         count = self.mgr.cleanup_all()
         assert count >= 2
         assert len(self.mgr.list_active()) == 0
+    
+    def test_base_dir_env_override(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("VIBECODER_SANDBOX_BASE", str(tmp_path))
+        mgr = SandboxManager()
+        sandbox = mgr.create_sandbox("override")
+        assert sandbox.path.startswith(str(tmp_path))
+        mgr.destroy_sandbox(sandbox.id)
+    
+    def test_create_uses_prewarmed_dirs(self, tmp_path):
+        import time
+        from backend.engine.sandbox import PREWARM_POOL_SIZE
+        
+        mgr = SandboxManager(base_dir=str(tmp_path))
+        mgr.destroy_sandbox(mgr.create_sandbox("first").id)
+        deadline = time.time() + 5
+        while len(mgr._prewarm) < PREWARM_POOL_SIZE and time.time() < deadline:
+            time.sleep(0.01)
+        
+        spare = mgr._prewarm[0]
+        sandbox = mgr.create_sandbox("second")
+        assert os.path.isdir(sandbox.path)
+        assert not os.path.exists(spare)
+        mgr.destroy_sandbox(sandbox.id)
+        mgr._discard_prewarm()
+    
+    def test_async_create_and_destroy(self):
+        import asyncio
+        
+        async def scenario():
+            async with self.mgr.acreate("async_ctx") as sandbox:
+                assert os.path.isdir(sandbox.path)
+                assert self.mgr.get_sandbox(sandbox.id) is sandbox
+            return sandbox
+        
+        sandbox = asyncio.run(scenario())
+        assert self.mgr.get_sandbox(sandbox.id) is None
+        assert not os.path.isdir(sandbox.path)
+    
+    def test_managers_are_not_kept_alive_for_exit_cleanup(self):
+        import gc
+        import weakref
+        
+        ref = weakref.ref(SandboxManager())
+        gc.collect()
+        assert ref() is None
+    
+    def test_events_are_batched(self, monkeypatch):
+        from backend.engine import sandbox as sandbox_module
+        from backend.engine.events import EngineEventType
+        
+        # Keep the timer out of the way; the flush below is the only one
+        monkeypatch.setattr(sandbox_module, "EVENT_FLUSH_INTERVAL", 60)
+        batches = []
+        handler = lambda event: batches.append(event.payload)
+        self.mgr.events.on(EngineEventType.AGENT_STATUS, handler)
+        try:
+            ids = {self.mgr.create_sandbox("e1").id, self.mgr.create_sandbox("e2").id}
+            self.mgr._flush_events()
+        finally:
+            self.mgr.events.off(EngineEventType.AGENT_STATUS, handler)
+            self.mgr.cleanup_all()
+        
+        # The emitter is global, so other managers' timers may flush in here too
+        ours = [
+            p for p in batches
+            if p.get("agent") == "sandbox_manager"
+            and any(e.get("sandbox_id") in ids for e in p["batch"])
+        ]
+        assert len(ours) == 1 and ours[0]["event"] == "SANDBOX_BATCH"
+        events = [e["event"] for e in ours[0]["batch"]]
+        assert events == ["SANDBOX_CREATED", "SANDBOX_CREATED"]
+    
+    def test_destroyed_dirs_are_recycled_empty(self, tmp_path):
+        from backend.engine.sandbox import _drain_cleanups
+        
+        mgr = SandboxManager(base_dir=str(tmp_path))
+        sandbox = mgr.create_sandbox("recycle")
+        sandbox.write_file("pkg/a.py", "a")
+        mgr.destroy_sandbox(sandbox.id)
+        _drain_cleanups()
+        
+        reused = mgr.create_sandbox("next")
+        assert reused.list_files() == []
+        mgr.destroy_sandbox(reused.id, blocking=True)
+        mgr._discard_prewarm()
+        assert os.listdir(tmp_path) == []
+    
+    def test_pending_cleanups_are_not_dropped(self):
+        import threading
+        from backend.engine import sandbox as sandbox_module
+        
+        release = threading.Event()
+        done = []
+        
+        def job(i):
+            release.wait(10)
+            done.append(i)
+        
+        for i in range(300):  # More than the old 256-entry window
+            sandbox_module._submit_cleanup(job, i)
+        assert len(sandbox_module._PENDING_CLEANUPS) >= 300
+        
+        release.set()
+        sandbox_module._drain_cleanups()
+        assert sorted(done) == list(range(300))
+        deadline = time.monotonic() + 5  # Done callbacks run just after result()
+        while sandbox_module._PENDING_CLEANUPS and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not sandbox_module._PENDING_CLEANUPS
+    
+    def test_recycled_dirs_respect_pool_size(self, tmp_path):
+        from backend.engine.sandbox import PREWARM_POOL_SIZE, _drain_cleanups
+        
+        mgr = SandboxManager(base_dir=str(tmp_path))
+        mgr.destroy_sandbox(mgr.create_sandbox("fill").id, blocking=True)
+        _drain_cleanups()
+        assert len(mgr._prewarm) == PREWARM_POOL_SIZE
+        
+        spare = tmp_path / "spare"
+        spare.mkdir()
+        (spare / "leftover.txt").write_text("x")
+        mgr._recycle_dir(str(spare))
+        
+        assert not spare.exists()
+        assert len(mgr._prewarm) == PREWARM_POOL_SIZE
+        mgr._discard_prewarm()
+    
+    @pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+    def test_dirs_with_running_processes_are_not_recycled(self, tmp_path, monkeypatch):
+        import signal
+        from backend.engine.sandbox import _drain_cleanups
+        
+        mgr = SandboxManager(base_dir=str(tmp_path))
+        recycled = []
+        monkeypatch.setattr(mgr, "_recycle_dir", recycled.append)
+        
+        sandbox = mgr.create_sandbox("finished")
+        assert sandbox.execute("python -c \"print(1)\"", timeout=10).success
+        assert sandbox.processes_exited()
+        
+        straggler = mgr.create_sandbox("straggler")
+        straggler.write_file("spawn.py", (
+            "import subprocess, sys\n"
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'],\n"
+            "                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)\n"
+            "print(child.pid)\n"
+        ))
+        result = straggler.execute("python spawn.py", timeout=10)
+        _drain_cleanups()
+        mgr._discard_prewarm()  # Leave room in the pool for both sandboxes
+        try:
+            assert not straggler.processes_exited()
+            path = straggler.path
+            mgr.destroy_sandbox(straggler.id)
+            _drain_cleanups()
+            assert recycled == []
+            assert not os.path.exists(path)
+        finally:
+            os.kill(int(result.stdout), signal.SIGKILL)
+        
+        mgr.destroy_sandbox(sandbox.id)
+        _drain_cleanups()
+        assert len(recycled) == 1
+        mgr._discard_prewarm()
@@ -0,0 +1,167 @@
+"""Tests for Self-Healer."""
+
+import time
+from backend.engine import self_healer
+from backend.engine.self_healer import SelfHealer, HealerState, MAX_RETRIES
+
+
+class TestSelfHealerMonitor:
+    """Tests for the adaptive monitor loop."""
+    
+    def setup_method(self):
+        self.probes = 0
+    
+    def _healer(self, tmp_path, healthy=False):
+        healer = SelfHealer(
+            engine=None,
+            health_url="http://127.0.0.1:9/health",
+            project_path=str(tmp_path),
+            log_path=str(tmp_path / "production.log"),
+        )
+        
+        def check_health():
+            self.probes += 1
+            return {"healthy": healthy, "status_code": 200 if healthy else 503, "error": None}
+        healer.check_health = check_health
+        return healer
+    
+    def _run(self, healer, seconds):
+        healer.start()
+        time.sleep(seconds)
+        healer.stop()
+        healer._monitor_thread.join(timeout=5)
+    
+    def test_single_failure_is_only_reprobed(self, tmp_path):
+        healer = self._healer(tmp_path)
+        healer._failure_streak = 1
+        healer._healthy_streak = 0
+        assert not healer._should_heal()
+        assert healer._next_interval() == self_healer.FAILURE_RECHECK_INTERVAL
+        
+        healer._failure_streak = self_healer.FAILURES_TO_CONFIRM
+        assert healer._should_heal()
+        assert healer._next_interval() > self_healer.FAILURE_RECHECK_INTERVAL
+    
+    def test_sustained_outage_heals_once(self, tmp_path):
+        healer = self._healer(tmp_path)
+        heals = []
+        healer._handle_failure = heals.append
+        
+        self._run(healer, 1.5)
+        assert self.probes >= 3
+        assert len(heals) == 1
+    
+    def test_sustained_outage_escalates_once(self, tmp_path):
+        healer = self._healer(tmp_path)
+        healer.retry_count = MAX_RETRIES  # Fix attempts already used up
+        escalations = []
+        healer.on_escalate(escalations.append)
+        
+        self._run(healer, 1.5)
+        assert self.probes >= 3
+        assert len(escalations) == 1
+        assert healer.state == HealerState.STOPPED
+    
+    def test_healthy_checks_back_off(self, tmp_path):
+        healer = self._healer(tmp_path, healthy=True)
+        
+        self._run(healer, 1.0)
+        assert healer._failure_streak == 0
+        assert healer._next_interval() >= 2 * self_healer.RECOVERY_INTERVAL
+
+    
+    def test_stop_releases_worker_threads(self, tmp_path):
+        import threading
+        
+        def healer_threads():
+            return {t for t in threading.enumerate() if t.name.startswith("self_healer")} - before
+        
+        before = {t for t in threading.enumerate() if t.name.startswith("self_healer")}
+        healer = self._healer(tmp_path, healthy=True)
+        for _ in range(2):  # Restarting after stop() brings the workers back
+            healer.start()
+            assert healer._pool.submit(lambda: 1).result(timeout=1) == 1
+            assert healer._log_pool.submit(lambda: 2).result(timeout=1) == 2
+            assert len(healer_threads()) == 4  # Monitor, emitter, one worker per pool
+            
+            healer.stop()
+            deadline = time.time() + 5
+            while healer_threads() and time.time() < deadline:
+                time.sleep(0.01)
+            assert healer_threads() == set()
+
+
+class TestFailureContext:
+    """Tests for the log context handed to the fix agent."""
+    
+    def test_extract_anomalies_keeps_errors_and_tracebacks(self):
+        from backend.engine.self_healer import _extract_anomalies
+        
+        tail = "\n".join([
+            "INFO started",
+            "INFO request ok",
+            "Traceback (most recent call last):",
+            '  File "app.py", line 3, in handler',
+            "    1 / 0",
+            "ZeroDivisionError: division by zero",
+            "INFO request ok",
+            "ERROR db down",
+            "retrying",
+            "giving up",
+            "INFO idle",
+        ])
+        assert _extract_anomalies(tail).splitlines() == [
+            "Traceback (most recent call last):",
+            '  File "app.py", line 3, in handler',
+            "    1 / 0",
+            "ZeroDivisionError: division by zero",
+            "ERROR db down",
+            "retrying",
+            "giving up",
+        ]
+    
+    def test_extract_anomalies_falls_back_to_full_tail(self):
+        from backend.engine.self_healer import _extract_anomalies
+        
+        tail = "INFO a\nINFO b"
+        assert _extract_anomalies(tail) == tail
+    
+    def test_collect_logs_reads_only_the_tail(self, tmp_path):
+        from backend.engine.self_healer import LOG_TAIL_SIZE
+        
+        log = tmp_path / "production.log"
+        # Multi-byte characters straddle the seek point; CRLF is normalized
+        log.write_bytes(("é" * LOG_TAIL_SIZE * 3 + "\r\nlast line").encode("utf-8"))
+        healer = SelfHealer(None, "http://127.0.0.1:9/health", str(tmp_path), log_path=str(log))
+        
+        tail = healer._collect_logs()
+        assert len(tail) == LOG_TAIL_SIZE
+        assert tail.endswith("é\nlast line")
+        assert "�" not in tail
+        
+        healer.log_path = str(tmp_path / "missing.log")
+        assert healer._collect_logs() == "No logs found"
+    
+    def test_hung_log_read_does_not_take_fix_workers(self, tmp_path, monkeypatch):
+        import threading
+        
+        healer = SelfHealer(None, "http://127.0.0.1:9/health", str(tmp_path))
+        monkeypatch.setattr(self_healer, "LOG_COLLECT_TIMEOUT", 0.05)
+        release = threading.Event()
+        reads = []
+        
+        def hung_read():
+            reads.append(1)
+            release.wait(5)
+            return ""
+        healer._collect_logs = hung_read
+        monkeypatch.setattr(healer._circuit_breaker, "call", lambda fn, record: None)
+        
+        try:
+            for _ in range(3):
+                healer._handle_failure({"healthy": False, "status_code": 503, "error": None})
+            assert len(reads) == 1  # Later failures wait on the stuck read
+            assert healer.failures[-1].stack_trace == "Log collection timed out"
+            assert healer._pool.submit(lambda: "free").result(timeout=1) == "free"
+        finally:
+            release.set()
@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import stat
 import tempfile
 import pytest
 from backend.engine.snapshot_manager import SnapshotManager
@@ -24,6 +25,7 @@ class TestSnapshotManager:
             f.write("class App: pass")
     
     def teardown_method(self):
+        self.mgr.close()
         shutil.rmtree(self.snap_dir, ignore_errors=True)
         shutil.rmtree(self.project_dir, ignore_errors=True)
         shutil.rmtree(self.restore_dir, ignore_errors=True)
@@ -98,3 +100,106 @@ class TestSnapshotManager:
     def test_restore_nonexistent_raises(self):
         with pytest.raises(ValueError):
             self.mgr.restore_snapshot("nonexistent", self.restore_dir)
+    
+    def test_unchanged_files_are_stored_once(self):
+        snap_a = self.mgr.create_snapshot(self.project_dir, label="a")
+        snap_b = self.mgr.create_snapshot(self.project_dir, label="b")
+        
+        objects = os.path.join(self.snap_dir, "objects")
+        blobs = [name for _, _, names in os.walk(objects) for name in names]
+        assert len(blobs) == 2
+        
+        # Blobs outlive the first snapshot while the second still uses them
+        self.mgr.delete_snapshot(snap_a)
+        assert self.mgr.restore_snapshot(snap_b, self.restore_dir)["files_restored"] == 2
+        self.mgr.delete_snapshot(snap_b)
+        self.mgr.close()  # Blobs are collected on the writer thread
+        assert [name for _, _, names in os.walk(objects) for name in names] == []
+    
+    def test_diff_detects_same_size_edits_in_archived_snapshots(self):
+        import zipfile
+        
+        # Older snapshots kept their files inside the ZIP instead of the object store
+        snap_a = self.mgr.create_snapshot(self.project_dir, label="before")
+        snap_b = self.mgr.create_snapshot(self.project_dir, label="after")
+        for snap_id, body in ((snap_a, "print('hello')"), (snap_b, "print('HELLO')")):
+            meta = self.mgr._snapshots[snap_id]
+            meta.manifest = {}
+            with zipfile.ZipFile(meta.archive_path, "a") as zf:
+                zf.writestr("files/main.py", body)
+        
+        assert self.mgr.diff_snapshots(snap_a, snap_b)["modified"] == ["main.py"]
+    
+    def test_index_loads_metadata_lazily(self):
+        snap_id = self.mgr.create_snapshot(self.project_dir, label="lazy")
+        
+        reopened = SnapshotManager(storage_path=self.snap_dir)
+        assert reopened._snapshots == {}
+        assert reopened.get_snapshot(snap_id)["label"] == "lazy"
+        assert reopened.restore_snapshot(snap_id, self.restore_dir)["files_restored"] == 2
+    
+    def test_background_snapshot(self):
+        snap_id = self.mgr.create_snapshot(self.project_dir, label="bg", background=True)
+        assert self.mgr.get_snapshot(snap_id)["status"] in ("pending", "ready")
+        
+        assert self.mgr.wait_ready(snap_id, timeout=10)
+        assert self.mgr.get_snapshot(snap_id)["status"] == "ready"
+        assert self.mgr.get_snapshot(snap_id)["file_count"] == 2
+        assert self.mgr.restore_snapshot(snap_id, self.restore_dir)["files_restored"] == 2
+    
+    def test_api_snapshot_captures_state_at_request(self, monkeypatch):
+        from backend.api import snapshot as snapshot_api
+        
+        monkeypatch.setattr(snapshot_api, "get_snapshot_manager", lambda: self.mgr)
+        monkeypatch.setattr(snapshot_api, "get_current_cost", lambda: {})
+        monkeypatch.chdir(os.path.dirname(self.project_dir))
+        
+        resp = snapshot_api.create_snapshot(snapshot_api.CreateSnapshotRequest(
+            project_path=os.path.basename(self.project_dir),
+        ))
+        # Edits right after the response must not leak into the snapshot
+        with open(os.path.join(self.project_dir, "main.py"), "w") as f:
+            f.write("print('edited')")
+        
+        self.mgr.restore_snapshot(resp["snapshot_id"], self.restore_dir)
+        with open(os.path.join(self.restore_dir, "main.py")) as f:
+            assert f.read() == "print('hello')"
+    
+    def test_restore_with_links(self):
+        snap_id = self.mgr.create_snapshot(self.project_dir, label="link")
+        
+        result = self.mgr.restore_snapshot(snap_id, self.restore_dir, link=True)
+        assert result["files_restored"] == 2
+        restored = os.path.join(self.restore_dir, "main.py")
+        with open(restored) as f:
+            assert f.read() == "print('hello')"
+        # Linked files share the read-only blob
+        assert os.stat(restored).st_nlink > 1
+        assert stat.S_IMODE(os.stat(restored).st_mode) == 0o444
+        
+        # Restoring again replaces the linked files instead of writing into the blobs
+        self.mgr.restore_snapshot(snap_id, self.restore_dir)
+        assert os.stat(restored).st_nlink == 1
+        assert os.stat(restored).st_mode & stat.S_IWUSR  # Copies stay editable
+    
+    def test_database_files_are_excluded(self):
+        for name in ("app.db", ".db", ".sqlite", "data.sqlite3", "mod.pyc"):
+            with open(os.path.join(self.project_dir, name), "w") as f:
+                f.write("skip")
+        
+        snap_id = self.mgr.create_snapshot(self.project_dir, label="exclude")
+        assert self.mgr.get_snapshot(snap_id)["file_count"] == 2
+    
+    def test_unchanged_files_skip_hashing(self, monkeypatch):
+        from backend.engine import snapshot_manager
+        
+        for rel in ("main.py", "src/app.py"):
+            os.utime(os.path.join(self.project_dir, rel), (1_000_000_000, 1_000_000_000))
+        snap_a = self.mgr.create_snapshot(self.project_dir, label="a")
+        
+        def fail(path):
+            raise AssertionError(f"re-hashed {path}")
+        monkeypatch.setattr(snapshot_manager, "_hash_file", fail)
+        snap_b = self.mgr.create_snapshot(self.project_dir, label="b")
+        
+        assert self.mgr.diff_snapshots(snap_a, snap_b)["unchanged"] == 2
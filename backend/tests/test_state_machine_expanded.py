@@ -40,3 +40,17 @@ def test_terminal_state_can_reset_to_idle():
     machine.transition(EngineState.FAILED)
     machine.transition(EngineState.IDLE)
     assert machine.state == EngineState.IDLE
+
+
+def test_agent_guard_follows_state():
+    machine = EngineStateMachine()
+    assert not machine.can_agent_run("planner")
+    machine.transition(EngineState.PLANNING)
+    assert machine.can_agent_run("planner")
+    assert not machine.can_agent_run("code_reviewer")
+    assert not machine.can_agent_run("unknown_agent")
+    try:
+        machine.validate_agent("engineer")
+        assert False, "Expected EngineStateError"
+    except EngineStateError as e:
+        assert "planner" in str(e)
@@ -0,0 +1,138 @@
+"""Tests for Team message routing."""
+
+import asyncio
+import pytest
+from backend.engine.environment import BROADCAST_TTL_ROUNDS
+from backend.engine.role import Role, Action, Message
+from backend.engine.team import Team, TeamConfig
+
+
+class RecordAction(Action):
+    """Records the messages its role observed."""
+    name = "record"
+    handled: list = []
+    
+    async def run(self, *args, **kwargs):
+        self.handled.extend(m.id for m in self.context.working_memory)
+        return "recorded"
+
+
+def _watcher(role_name: str) -> Role:
+    role = type(f"{role_name}_role", (Role,), {"name": role_name})()
+    role.handled = []
+    role.set_actions([type("RecordAction", (RecordAction,), {"handled": role.handled})])
+    role.rc.set_watch({"write_prd"})
+    return role
+
+
+def _team(parallel: bool):
+    team = Team(TeamConfig(parallel_execution=parallel))
+    team.hire([_watcher("architect"), _watcher("project_manager")])
+    return team
+
+
+def _prd() -> Message:
+    return Message(content="PRD", role="product_manager", cause_by="write_prd")
+
+
+class TestTeamRounds:
+    """Messages are delivered once to every role that watches them."""
+    
+    def _handled(self, team):
+        return {name: role.handled for name, role in team.roles.items()}
+    
+    def _run_rounds(self, parallel: bool):
+        team = _team(parallel)
+        prd = _prd()
+        team.env.publish_message(prd)
+        
+        run_round = team._run_parallel if parallel else team._run_sequential
+        asyncio.run(run_round())
+        asyncio.run(run_round())  # Nothing left for either role
+        return team, prd
+    
+    def test_shared_watch_sequential(self):
+        team, prd = self._run_rounds(parallel=False)
+        assert self._handled(team) == {"architect": [prd.id], "project_manager": [prd.id]}
+        assert prd not in team.env.message_queue
+    
+    def test_shared_watch_parallel(self):
+        team, prd = self._run_rounds(parallel=True)
+        assert self._handled(team) == {"architect": [prd.id], "project_manager": [prd.id]}
+        assert prd not in team.env.message_queue
+
+
+class TestBroadcastRetention:
+    """Broadcasts do not outlive the roles that could fetch them."""
+    
+    def test_unaccepted_broadcast_is_not_queued(self):
+        team = _team(parallel=False)
+        note = Message(content="deploy", role="devops", cause_by="deploy")
+        team.env.publish_message(note)
+        
+        assert note in team.env.memory
+        assert not team.env.has_pending_messages()
+        assert not team.env._awaiting
+    
+    def test_unfetched_broadcast_expires(self):
+        team = _team(parallel=False)
+        env = team.env
+        prd = _prd()
+        env.publish_message(prd)
+        assert env.get_messages_for_role(team.roles["architect"]) == [prd]
+        
+        # project_manager never fetches; the broadcast waits a bounded time
+        for _ in range(BROADCAST_TTL_ROUNDS - 1):
+            env.advance_round()
+            assert env.message_queue == [prd]
+        env.advance_round()
+        
+        assert not env.has_pending_messages()
+        assert not env._awaiting
+        assert env.get_messages_for_role(team.roles["project_manager"]) == []
+
+
+
+class TestMessage:
+    """Serialized messages are independent of the message and each other."""
+    
+    def test_to_dict_returns_a_copy(self):
+        msg = Message(content="PRD", role="product_manager", metadata={"v": 1})
+        first = msg.to_dict()
+        first["content"] = "changed"
+        first["metadata"]["v"] = 2
+        
+        second = msg.to_dict()
+        assert second["content"] == "PRD"
+        assert second["metadata"] == {"v": 1}
+        assert msg.metadata == {"v": 1}
+        assert second is not first
+
+
+class TestTeamEvents:
+    """Trusted callbacks run unguarded; user callbacks are isolated."""
+    
+    def test_safe_and_user_callbacks(self, caplog):
+        team = Team()
+        safe, user = [], []
+        team.on_event(lambda e: safe.append(e["type"]), safe=True)
+        team.on_event(lambda e: 1 / 0)
+        team.on_event(lambda e: user.append(e["type"]))
+        
+        with caplog.at_level("ERROR", logger="team"):
+            team.stop()
+        
+        assert safe == ["run_stopped"]
+        assert user == ["run_stopped"]  # Still called after the failing callback
+        assert "Team event callback failed on run_stopped" in caplog.text
+        assert team._safe_callbacks and len(team._user_callbacks) == 2
+    
+    def test_safe_callback_errors_propagate(self):
+        team = Team()
+        
+        def broken(event):
+            raise RuntimeError("trusted callback bug")
+        team.on_event(broken, safe=True)
+        
+        with pytest.raises(RuntimeError, match="trusted callback bug"):
+            team.stop()
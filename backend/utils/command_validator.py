@@ -74,6 +74,7 @@ DANGEROUS_PATTERNS = [
     r">\s*~/\.",        # Writing to user config
     r">\s*/etc",        # Writing to system config
 ]
+_DANGEROUS_RES = tuple((p, re.compile(p, re.IGNORECASE)) for p in DANGEROUS_PATTERNS)
 
 
 def validate_command(command: str) -> Tuple[bool, Optional[str]]:
@@ -91,8 +92,8 @@ def validate_command(command: str) -> Tuple[bool, Optional[str]]:
     command = command.strip()
 
     # Check for dangerous patterns first
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
+    for pattern, regex in _DANGEROUS_RES:
+        if regex.search(command):
             return False, f"Command contains dangerous pattern: {pattern}"
 
     # Check for command chaining (allow only &&, but inspect each part)
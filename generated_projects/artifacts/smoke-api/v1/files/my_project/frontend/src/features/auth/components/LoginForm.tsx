@@ -0,0 +1,75 @@
+/**
+ * Login form — pure UI. Business logic in useAuthStore.
+ */
+import { useState, type FormEvent } from "react";
+import { useAuth } from "../hooks/useAuth";
+import { Button } from "@shared/ui/Button";
+import { Input } from "@shared/ui/Input";
+import { toast } from "sonner";
+import { loginSchema, type LoginInput } from "@shared/utils/validators";
+
+interface LoginFormProps {
+  onSuccess?: () => void;
+}
+
+export function LoginForm({ onSuccess }: LoginFormProps) {
+  const { login, isLoading } = useAuth();
+  const [errors, setErrors] = useState<Record<string, string>>({});
+
+  const handleSubmit = async (e: FormEvent<HTMLFormElement>) => {
+    e.preventDefault();
+    setErrors({});
+
+    const formData = new FormData(e.currentTarget);
+    const raw = {
+      email: formData.get("email") as string,
+      password: formData.get("password") as string,
+    };
+
+    // Validate
+    const result = loginSchema.safeParse(raw);
+    if (!result.success) {
+      const fieldErrors: Record<string, string> = {};
+      for (const issue of result.error.issues) {
+        const field = issue.path[0] as string;
+        fieldErrors[field] = issue.message;
+      }
+      setErrors(fieldErrors);
+      return;
+    }
+
+    try {
+      await login(result.data);
+      toast.success("Welcome back!");
+      onSuccess?.();
+    } catch {
+      toast.error("Login failed. Please check your credentials.");
+    }
+  };
+
+  return (
+    <form onSubmit={handleSubmit} className="space-y-4" noValidate>
+      <Input
+        name="email"
+        type="email"
+        label="Email"
+        placeholder="you@example.com"
+        error={errors.email}
+        autoComplete="email"
+        required
+      />
+      <Input
+        name="password"
+        type="password"
+        label="Password"
+        placeholder="Enter your password"
+        error={errors.password}
+        autoComplete="current-password"
+        required
+      />
+      <Button type="submit" className="w-full" isLoading={isLoading}>
+        Sign In
+      </Button>
+    </form>
+  );
+}
@@ -0,0 +1,23 @@
+/** Dashboard feature types */
+
+export interface DashboardStats {
+  total_users: number;
+  active_projects: number;
+  revenue: number;
+  growth_percent: number;
+}
+
+export interface Activity {
+  id: string;
+  action: string;
+  description: string;
+  timestamp: string;
+  user_name: string;
+}
+
+export interface StatCard {
+  label: string;
+  value: string | number;
+  change?: number;
+  icon: string;
+}
@@ -0,0 +1,12 @@
+"""
+API v1 router — aggregates all v1 endpoints.
+"""
+
+from fastapi import APIRouter
+
+api_router = APIRouter()
+
+# Import and include route modules here:
+# from app.api.v1 import auth, users, items
+# api_router.include_router(auth.router, prefix="/auth", tags=["Auth"])
+# api_router.include_router(users.router, prefix="/users", tags=["Users"])
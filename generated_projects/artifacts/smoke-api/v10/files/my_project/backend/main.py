@@ -0,0 +1,69 @@
+"""
+my_project — API Server
+"""
+
+import structlog
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging
+from app.api.v1.router import api_router
+from app.middleware.error_handler import register_exception_handlers
+
+# Setup structured logging
+setup_logging()
+logger = structlog.get_logger()
+
+
+def create_app() -> FastAPI:
+    """Application factory — creates and configures the FastAPI app."""
+    app = FastAPI(
+        title=settings.APP_NAME,
+        description="API for my_project",
+        version="1.0.0",
+        docs_url="/docs" if settings.DEBUG else None,
+        redoc_url="/redoc" if settings.DEBUG else None,
+        openapi_url="/openapi.json" if settings.DEBUG else None,
+    )
+
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+    )
+
+    # Exception handlers
+    register_exception_handlers(app)
+
+    # Routes
+    app.include_router(api_router, prefix=settings.API_V1_PREFIX)
+
+    @app.get("/health", tags=["System"])
+    async def health_check():
+        """Health check endpoint for load balancers and monitoring."""
+        return {
+            "status": "healthy",
+            "version": "1.0.0",
+            "app": settings.APP_NAME,
+        }
+
+    logger.info("app_created", app_name=settings.APP_NAME, debug=settings.DEBUG)
+    return app
+
+
+app = create_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        reload=settings.DEBUG,
+    )
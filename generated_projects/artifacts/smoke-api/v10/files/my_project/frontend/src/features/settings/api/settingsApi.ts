@@ -0,0 +1,8 @@
+import { api } from "@infra/http/apiClient";
+import { API_ENDPOINTS } from "@core/constants";
+import type { UserProfile, Preferences } from "../types";
+
+export const settingsApi = {
+  getProfile: () => api.get<UserProfile>(API_ENDPOINTS.SETTINGS.GET),
+  updateProfile: (data: Partial<UserProfile>) => api.put<UserProfile>(API_ENDPOINTS.SETTINGS.UPDATE, data),
+};
@@ -0,0 +1,27 @@
+/** API request/response types */
+
+export interface LoginRequest {
+  email: string;
+  password: string;
+}
+
+export interface RegisterRequest {
+  name: string;
+  email: string;
+  password: string;
+}
+
+export interface AuthResponse {
+  access_token: string;
+  token_type: string;
+  user: {
+    id: string;
+    email: string;
+    name: string;
+  };
+}
+
+export interface HealthResponse {
+  status: string;
+  version: string;
+}
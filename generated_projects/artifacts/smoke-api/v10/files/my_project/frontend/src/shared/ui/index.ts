@@ -0,0 +1,14 @@
+/**
+ * UI primitives barrel export.
+ * Import UI components from @shared/ui.
+ */
+export { Button } from "./Button";
+export type { ButtonProps } from "./Button";
+export { Input } from "./Input";
+export type { InputProps } from "./Input";
+export { Card, CardHeader, CardTitle, CardDescription, CardContent, CardFooter } from "./Card";
+export { Dialog } from "./Dialog";
+export { LoadingScreen } from "./LoadingScreen";
+export { LoadingSpinner } from "./LoadingSpinner";
+export { Badge } from "./Badge";
+export { Skeleton } from "./Skeleton";
@@ -0,0 +1,59 @@
+"""
+Custom exception classes for structured error responses.
+"""
+
+from typing import Optional
+
+
+class AppException(Exception):
+    """Base application exception."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 500,
+        detail: Optional[str] = None,
+    ):
+        self.message = message
+        self.status_code = status_code
+        self.detail = detail or message
+        super().__init__(self.message)
+
+
+class NotFoundException(AppException):
+    """Resource not found (404)."""
+
+    def __init__(self, resource: str = "Resource", id: str = ""):
+        super().__init__(
+            message=f"{resource} not found",
+            status_code=404,
+            detail=f"{resource} with id '{id}' was not found" if id else f"{resource} not found",
+        )
+
+
+class UnauthorizedException(AppException):
+    """Authentication required (401)."""
+
+    def __init__(self, message: str = "Authentication required"):
+        super().__init__(message=message, status_code=401)
+
+
+class ForbiddenException(AppException):
+    """Access denied (403)."""
+
+    def __init__(self, message: str = "Access denied"):
+        super().__init__(message=message, status_code=403)
+
+
+class ValidationException(AppException):
+    """Validation error (422)."""
+
+    def __init__(self, message: str = "Validation error"):
+        super().__init__(message=message, status_code=422)
+
+
+class ConflictException(AppException):
+    """Resource conflict (409)."""
+
+    def __init__(self, message: str = "Resource already exists"):
+        super().__init__(message=message, status_code=409)
@@ -0,0 +1,76 @@
+/**
+ * Top-level error boundary — catches unhandled React errors.
+ * Prevents entire app from crashing. Provides recovery UI.
+ */
+import React, { type ReactNode } from "react";
+import { logger } from "@core/logger";
+import { Button } from "@shared/ui/Button";
+
+interface Props {
+  children: ReactNode;
+  fallback?: ReactNode;
+}
+
+interface State {
+  hasError: boolean;
+  error: Error | null;
+}
+
+export class ErrorBoundaryProvider extends React.Component<Props, State> {
+  constructor(props: Props) {
+    super(props);
+    this.state = { hasError: false, error: null };
+  }
+
+  static getDerivedStateFromError(error: Error): State {
+    return { hasError: true, error };
+  }
+
+  componentDidCatch(error: Error, errorInfo: React.ErrorInfo) {
+    logger.error("Uncaught error in React tree", {
+      error: error.message,
+      stack: error.stack,
+      componentStack: errorInfo.componentStack,
+    });
+  }
+
+  private handleReset = () => {
+    this.setState({ hasError: false, error: null });
+  };
+
+  private handleReload = () => {
+    window.location.reload();
+  };
+
+  render() {
+    if (this.state.hasError) {
+      if (this.props.fallback) return this.props.fallback;
+
+      return (
+        <div className="flex min-h-screen flex-col items-center justify-center gap-6 p-8">
+          <div className="text-center space-y-4">
+            <h1 className="text-4xl font-bold text-destructive">Something went wrong</h1>
+            <p className="text-lg text-muted-foreground max-w-md">
+              An unexpected error occurred. Our team has been notified.
+            </p>
+            {this.state.error && (
+              <pre className="mt-4 max-w-lg overflow-auto rounded-lg bg-muted p-4 text-sm text-left">
+                {this.state.error.message}
+              </pre>
+            )}
+          </div>
+          <div className="flex gap-3">
+            <Button variant="outline" onClick={this.handleReset}>
+              Try Again
+            </Button>
+            <Button onClick={this.handleReload}>
+              Reload Page
+            </Button>
+          </div>
+        </div>
+      );
+    }
+
+    return this.props.children;
+  }
+}
@@ -0,0 +1,9 @@
+/**
+ * Convenience hook — re-exports auth store with stable API.
+ */
+import { useAuthStore } from "./useAuthStore";
+
+export function useAuth() {
+  const { user, isAuthenticated, isLoading, login, logout, register, fetchUser } = useAuthStore();
+  return { user, isAuthenticated, isLoading, login, logout, register, fetchUser };
+}
@@ -0,0 +1,4 @@
+/**
+ * Core feature — public API.
+ */
+export type { CoreItem } from "./types";
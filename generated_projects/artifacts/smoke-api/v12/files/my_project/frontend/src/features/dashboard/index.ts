@@ -0,0 +1,5 @@
+/**
+ * Dashboard feature — public API.
+ */
+export { useDashboardStats } from "./hooks/useDashboardStats";
+export type { DashboardStats, Activity } from "./types";
@@ -0,0 +1,27 @@
+import { useQuery } from "@tanstack/react-query";
+import { FeatureErrorBoundary } from "@shared/components/FeatureErrorBoundary";
+import { LoadingScreen } from "@shared/ui/LoadingScreen";
+import { QUERY_KEYS } from "@core/constants";
+import { ProfileForm } from "../components/ProfileForm";
+import { settingsApi } from "../api/settingsApi";
+
+export default function SettingsPage() {
+  const { data: profile, isLoading } = useQuery({
+    queryKey: QUERY_KEYS.SETTINGS.ALL,
+    queryFn: settingsApi.getProfile,
+  });
+
+  if (isLoading) return <LoadingScreen message="Loading settings..." />;
+
+  return (
+    <FeatureErrorBoundary feature="settings">
+      <div className="space-y-8">
+        <div>
+          <h1 className="text-3xl font-bold">Settings</h1>
+          <p className="text-muted-foreground">Manage your account preferences</p>
+        </div>
+        {profile && <ProfileForm profile={profile} />}
+      </div>
+    </FeatureErrorBoundary>
+  );
+}
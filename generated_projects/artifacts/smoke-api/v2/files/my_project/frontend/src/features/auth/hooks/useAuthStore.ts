@@ -0,0 +1,74 @@
+/**
+ * Auth store — Zustand for client auth state.
+ * Business logic lives HERE, not in components.
+ */
+import { create } from "zustand";
+import { logger } from "@core/logger";
+import { STORAGE_KEYS } from "@core/constants";
+import { handleError } from "@core/error";
+import { authApi } from "../api/authApi";
+import type { AuthUser, AuthState, LoginCredentials, RegisterData } from "../types";
+
+interface AuthActions {
+  login: (credentials: LoginCredentials) => Promise<void>;
+  register: (data: RegisterData) => Promise<void>;
+  logout: () => void;
+  fetchUser: () => Promise<void>;
+  reset: () => void;
+}
+
+const initialState: AuthState = {
+  user: null,
+  isAuthenticated: !!localStorage.getItem(STORAGE_KEYS.AUTH_TOKEN),
+  isLoading: false,
+};
+
+export const useAuthStore = create<AuthState & AuthActions>((set) => ({
+  ...initialState,
+
+  login: async (credentials) => {
+    set({ isLoading: true });
+    try {
+      const response = await authApi.login(credentials);
+      localStorage.setItem(STORAGE_KEYS.AUTH_TOKEN, response.access_token);
+      set({ user: response.user, isAuthenticated: true });
+      logger.info("User logged in", { feature: "auth", action: "login" });
+    } catch (error) {
+      handleError(error, { feature: "auth", action: "login" });
+      throw error;
+    } finally {
+      set({ isLoading: false });
+    }
+  },
+
+  register: async (data) => {
+    set({ isLoading: true });
+    try {
+      await authApi.register(data);
+      logger.info("User registered", { feature: "auth", action: "register" });
+    } catch (error) {
+      handleError(error, { feature: "auth", action: "register" });
+      throw error;
+    } finally {
+      set({ isLoading: false });
+    }
+  },
+
+  logout: () => {
+    localStorage.removeItem(STORAGE_KEYS.AUTH_TOKEN);
+    set({ user: null, isAuthenticated: false });
+    logger.info("User logged out", { feature: "auth", action: "logout" });
+  },
+
+  fetchUser: async () => {
+    try {
+      const user = await authApi.getMe();
+      set({ user, isAuthenticated: true });
+    } catch {
+      set({ user: null, isAuthenticated: false });
+      localStorage.removeItem(STORAGE_KEYS.AUTH_TOKEN);
+    }
+  },
+
+  reset: () => set(initialState),
+}));
@@ -0,0 +1,34 @@
+/**
+ * Environment configuration — config-driven, no magic strings.
+ * Single source of truth for all environment variables.
+ */
+import { z } from "zod";
+
+const envSchema = z.object({
+  VITE_API_URL: z.string().default(""),
+  VITE_APP_NAME: z.string().default("My Project"),
+  VITE_APP_ENV: z.enum(["development", "staging", "production"]).default("development"),
+  VITE_ENABLE_LOGGING: z
+    .string()
+    .transform((v) => v === "true")
+    .default("true"),
+  VITE_SENTRY_DSN: z.string().optional(),
+});
+
+// Validate at startup — fail fast if misconfigured
+const parsed = envSchema.safeParse(import.meta.env);
+if (!parsed.success) {
+  console.error("Invalid environment configuration:", parsed.error.flatten());
+}
+
+const env = parsed.success ? parsed.data : envSchema.parse({});
+
+export const config = {
+  apiUrl: env.VITE_API_URL,
+  appName: env.VITE_APP_NAME,
+  appEnv: env.VITE_APP_ENV,
+  isDevelopment: env.VITE_APP_ENV === "development",
+  isProduction: env.VITE_APP_ENV === "production",
+  enableLogging: env.VITE_ENABLE_LOGGING,
+  sentryDsn: env.VITE_SENTRY_DSN,
+} as const;
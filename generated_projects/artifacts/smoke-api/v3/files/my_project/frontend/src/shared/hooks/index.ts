@@ -0,0 +1,3 @@
+export { useDebounce } from "./useDebounce";
+export { useLocalStorage } from "./useLocalStorage";
+export { useMediaQuery } from "./useMediaQuery";
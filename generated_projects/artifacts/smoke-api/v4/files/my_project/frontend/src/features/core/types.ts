@@ -0,0 +1,8 @@
+/** Core feature types */
+
+export interface CoreItem {
+  id: string;
+  name: string;
+  created_at: string;
+  updated_at?: string;
+}
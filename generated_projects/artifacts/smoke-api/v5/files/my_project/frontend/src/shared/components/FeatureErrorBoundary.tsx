@@ -0,0 +1,61 @@
+/**
+ * Feature-level error boundary — isolates feature failures.
+ *
+ * Unlike the app-level ErrorBoundaryProvider, this wraps
+ * individual features so one crashing feature doesn't
+ * take down the entire app.
+ */
+import React, { type ReactNode } from "react";
+import { logger } from "@core/logger";
+import { Button } from "@shared/ui/Button";
+
+interface Props {
+  feature: string;
+  children: ReactNode;
+  fallback?: ReactNode;
+}
+
+interface State {
+  hasError: boolean;
+  error: Error | null;
+}
+
+export class FeatureErrorBoundary extends React.Component<Props, State> {
+  state: State = { hasError: false, error: null };
+
+  static getDerivedStateFromError(error: Error): State {
+    return { hasError: true, error };
+  }
+
+  componentDidCatch(error: Error, info: React.ErrorInfo) {
+    logger.error(`Feature "${this.props.feature}" crashed`, {
+      feature: this.props.feature,
+      error: error.message,
+      stack: error.stack,
+    });
+  }
+
+  private handleRetry = () => {
+    this.setState({ hasError: false, error: null });
+  };
+
+  render() {
+    if (this.state.hasError) {
+      if (this.props.fallback) return this.props.fallback;
+      return (
+        <div className="flex flex-col items-center justify-center gap-4 p-8 text-center">
+          <h3 className="text-lg font-semibold text-destructive">
+            This section encountered an error
+          </h3>
+          <p className="text-sm text-muted-foreground max-w-md">
+            The {this.props.feature} feature had a problem. You can try again or continue using other parts of the app.
+          </p>
+          <Button variant="outline" size="sm" onClick={this.handleRetry}>
+            Try Again
+          </Button>
+        </div>
+      );
+    }
+    return this.props.children;
+  }
+}
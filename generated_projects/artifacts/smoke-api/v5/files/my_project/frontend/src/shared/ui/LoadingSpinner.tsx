@@ -0,0 +1,20 @@
+import { cn } from "@shared/utils/cn";
+
+interface LoadingSpinnerProps {
+  className?: string;
+  size?: "sm" | "md" | "lg";
+}
+
+const sizeClasses = { sm: "h-4 w-4", md: "h-8 w-8", lg: "h-12 w-12" };
+
+export function LoadingSpinner({ className, size = "md" }: LoadingSpinnerProps) {
+  return (
+    <div className={cn("flex items-center justify-center", className)} role="status">
+      <svg className={cn("animate-spin text-primary", sizeClasses[size])} viewBox="0 0 24 24" aria-hidden="true">
+        <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4" fill="none" />
+        <path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4z" />
+      </svg>
+      <span className="sr-only">Loading...</span>
+    </div>
+  );
+}
@@ -0,0 +1,80 @@
+/**
+ * Centralized error handling — typed errors, recovery strategies.
+ *
+ * All API/domain errors go through this module.
+ * Components never construct errors directly.
+ */
+import { logger } from "@core/logger";
+
+export class AppError extends Error {
+  constructor(
+    message: string,
+    public readonly code: string,
+    public readonly statusCode: number = 500,
+    public readonly recoverable: boolean = true,
+    public readonly context?: Record<string, unknown>,
+  ) {
+    super(message);
+    this.name = "AppError";
+  }
+}
+
+export class NetworkError extends AppError {
+  constructor(message = "Network error — please check your connection") {
+    super(message, "NETWORK_ERROR", 0, true);
+    this.name = "NetworkError";
+  }
+}
+
+export class ApiError extends AppError {
+  constructor(
+    public readonly status: number,
+    public readonly statusText: string,
+    public readonly data?: unknown,
+  ) {
+    super(`API Error ${status}: ${statusText}`, "API_ERROR", status, status < 500);
+    this.name = "ApiError";
+  }
+}
+
+export class AuthError extends AppError {
+  constructor(message = "Authentication required") {
+    super(message, "AUTH_ERROR", 401, true);
+    this.name = "AuthError";
+  }
+}
+
+export class ValidationError extends AppError {
+  constructor(
+    message: string,
+    public readonly fieldErrors?: Record<string, string[]>,
+  ) {
+    super(message, "VALIDATION_ERROR", 422, true);
+    this.name = "ValidationError";
+  }
+}
+
+export class NotFoundError extends AppError {
+  constructor(resource = "Resource") {
+    super(`${resource} not found`, "NOT_FOUND", 404, false);
+    this.name = "NotFoundError";
+  }
+}
+
+/**
+ * Global error handler — logs and optionally reports errors.
+ */
+export function handleError(error: unknown, context?: { feature?: string; action?: string }) {
+  if (error instanceof AppError) {
+    logger.error(error.message, {
+      code: error.code,
+      statusCode: error.statusCode,
+      recoverable: error.recoverable,
+      ...context,
+    });
+  } else if (error instanceof Error) {
+    logger.error(error.message, { stack: error.stack, ...context });
+  } else {
+    logger.error("Unknown error", { error, ...context });
+  }
+}
@@ -0,0 +1,31 @@
+import js from "@eslint/js";
+import tseslint from "typescript-eslint";
+
+export default tseslint.config(
+  js.configs.recommended,
+  ...tseslint.configs.recommended,
+  {
+    rules: {
+      // Strict typing
+      "@typescript-eslint/no-unused-vars": ["warn", { argsIgnorePattern: "^_" }],
+      "@typescript-eslint/no-explicit-any": "error",
+      "@typescript-eslint/no-non-null-assertion": "warn",
+      "@typescript-eslint/explicit-function-return-type": "off",
+      "@typescript-eslint/consistent-type-imports": ["error", { prefer: "type-imports" }],
+
+      // Engineering constitution
+      "no-console": ["warn", { allow: ["warn", "error"] }],
+      "no-restricted-imports": ["error", {
+        patterns: [
+          {
+            group: ["@features/*/components/*", "@features/*/hooks/*", "@features/*/api/*"],
+            message: "Import features through their public index.ts barrel only. No cross-feature deep imports.",
+          },
+        ],
+      }],
+    },
+  },
+  {
+    ignores: ["dist/", "node_modules/", "*.config.js", "*.config.ts"],
+  }
+);
@@ -0,0 +1,25 @@
+/**
+ * React Query client configuration — shared query defaults.
+ *
+ * This file is the single place to configure caching, retries,
+ * and error handling for all server state.
+ */
+export { QueryClient } from "@tanstack/react-query";
+
+// Query client is created in QueryProvider.tsx to keep it
+// colocated with the provider component. This file exists
+// for any shared query utilities.
+
+import { useQueryClient } from "@tanstack/react-query";
+
+/**
+ * Invalidate all queries matching a key prefix.
+ * Useful after mutations that affect multiple queries.
+ */
+export function useInvalidateQueries() {
+  const queryClient = useQueryClient();
+
+  return (keyPrefix: string[]) => {
+    queryClient.invalidateQueries({ queryKey: keyPrefix });
+  };
+}
@@ -0,0 +1,25 @@
+import { cn } from "@shared/utils/cn";
+
+interface LoadingScreenProps {
+  className?: string;
+  message?: string;
+}
+
+export function LoadingScreen({ className, message }: LoadingScreenProps) {
+  return (
+    <div className={cn("flex min-h-[60vh] flex-col items-center justify-center gap-4", className)} role="status">
+      <svg
+        className="h-10 w-10 animate-spin text-primary"
+        xmlns="http://www.w3.org/2000/svg"
+        fill="none"
+        viewBox="0 0 24 24"
+        aria-hidden="true"
+      >
+        <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4" />
+        <path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4z" />
+      </svg>
+      <span className="sr-only">{message || "Loading..."}</span>
+      {message && <p className="text-sm text-muted-foreground">{message}</p>}
+    </div>
+  );
+}
@@ -0,0 +1,91 @@
+/**
+ * Application constants — NO magic strings anywhere.
+ * Every string literal used across features is defined here.
+ */
+
+export const APP_NAME = "My Project";
+
+/** Route paths — single source of truth */
+export const ROUTES = {
+  HOME: "/",
+  LOGIN: "/login",
+  REGISTER: "/register",
+  DASHBOARD: "/dashboard",
+  SETTINGS: "/settings",
+  PROFILE: "/profile",
+  CORE: "/core",
+} as const;
+
+/** API endpoint prefixes */
+export const API_ENDPOINTS = {
+  AUTH: {
+    LOGIN: "/api/v1/auth/login",
+    REGISTER: "/api/v1/auth/register",
+    ME: "/api/v1/auth/me",
+    REFRESH: "/api/v1/auth/refresh",
+  },
+  DASHBOARD: {
+    STATS: "/api/v1/dashboard/stats",
+    ACTIVITY: "/api/v1/dashboard/activity",
+  },
+  USERS: {
+    LIST: "/api/v1/users",
+    PROFILE: "/api/v1/users/profile",
+  },
+  SETTINGS: {
+    GET: "/api/v1/settings",
+    UPDATE: "/api/v1/settings",
+  },
+  CORE: {
+    LIST: "/api/v1/core",
+    DETAIL: (id: string) => `/api/v1/core/${id}`,
+    CREATE: "/api/v1/core",
+    UPDATE: (id: string) => `/api/v1/core/${id}`,
+    DELETE: (id: string) => `/api/v1/core/${id}`,
+  },
+} as const;
+
+/** Query cache keys for React Query */
+export const QUERY_KEYS = {
+  AUTH: {
+    ME: ["auth", "me"],
+    SESSION: ["auth", "session"],
+  },
+  DASHBOARD: {
+    STATS: ["dashboard", "stats"],
+    ACTIVITY: ["dashboard", "activity"],
+  },
+  USERS: {
+    LIST: ["users", "list"],
+    DETAIL: (id: string) => ["users", "detail", id],
+  },
+  SETTINGS: {
+    ALL: ["settings"],
+  },
+  CORE: {
+    LIST: ["core", "list"],
+    DETAIL: (id: string) => ["core", "detail", id],
+  },
+} as const;
+
+/** Storage keys for localStorage/sessionStorage */
+export const STORAGE_KEYS = {
+  AUTH_TOKEN: "auth_token",
+  REFRESH_TOKEN: "refresh_token",
+  THEME: "app-theme",
+  SIDEBAR_COLLAPSED: "sidebar-collapsed",
+} as const;
+
+/** HTTP status codes */
+export const HTTP_STATUS = {
+  OK: 200,
+  CREATED: 201,
+  NO_CONTENT: 204,
+  BAD_REQUEST: 400,
+  UNAUTHORIZED: 401,
+  FORBIDDEN: 403,
+  NOT_FOUND: 404,
+  CONFLICT: 409,
+  UNPROCESSABLE: 422,
+  INTERNAL_ERROR: 500,
+} as const;
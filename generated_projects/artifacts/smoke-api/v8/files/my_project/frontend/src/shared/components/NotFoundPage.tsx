@@ -0,0 +1,18 @@
+import { Link } from "react-router-dom";
+import { Button } from "@shared/ui/Button";
+import { ROUTES } from "@core/constants";
+
+export default function NotFoundPage() {
+  return (
+    <div className="flex min-h-[60vh] flex-col items-center justify-center gap-4 text-center">
+      <h1 className="text-7xl font-bold text-primary">404</h1>
+      <h2 className="text-2xl font-semibold">Page Not Found</h2>
+      <p className="max-w-md text-muted-foreground">
+        The page you&#39;re looking for doesn&#39;t exist or has been moved.
+      </p>
+      <Link to={ROUTES.HOME}>
+        <Button>Back to Home</Button>
+      </Link>
+    </div>
+  );
+}
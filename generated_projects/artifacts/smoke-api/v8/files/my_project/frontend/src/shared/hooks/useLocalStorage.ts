@@ -0,0 +1,30 @@
+import { useState, useEffect, useCallback } from "react";
+
+/** Persist state in localStorage with type safety */
+export function useLocalStorage<T>(key: string, initialValue: T) {
+  const [storedValue, setStoredValue] = useState<T>(() => {
+    try {
+      const item = window.localStorage.getItem(key);
+      return item ? (JSON.parse(item) as T) : initialValue;
+    } catch {
+      return initialValue;
+    }
+  });
+
+  const setValue = useCallback(
+    (value: T | ((prev: T) => T)) => {
+      setStoredValue((prev) => {
+        const nextValue = value instanceof Function ? value(prev) : value;
+        try {
+          window.localStorage.setItem(key, JSON.stringify(nextValue));
+        } catch {
+          console.warn(`Failed to save ${key} to localStorage`);
+        }
+        return nextValue;
+      });
+    },
+    [key],
+  );
+
+  return [storedValue, setValue] as const;
+}
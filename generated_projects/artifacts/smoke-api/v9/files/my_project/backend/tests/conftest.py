@@ -0,0 +1,20 @@
+"""
+Test fixtures and configuration.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+
+# Override settings for testing
+settings.DATABASE_URL = "sqlite:///./test.db"
+settings.DEBUG = True
+
+from main import app
+
+
+@pytest.fixture
+def client():
+    """FastAPI test client."""
+    with TestClient(app) as c:
+        yield c
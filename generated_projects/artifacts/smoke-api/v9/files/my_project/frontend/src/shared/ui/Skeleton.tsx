@@ -0,0 +1,11 @@
+import { cn } from "@shared/utils/cn";
+
+interface SkeletonProps {
+  className?: string;
+}
+
+export function Skeleton({ className }: SkeletonProps) {
+  return (
+    <div className={cn("animate-pulse rounded-md bg-muted", className)} aria-hidden="true" />
+  );
+}
@@ -0,0 +1,21 @@
+/**
+ * Auth API calls — all auth HTTP requests live here.
+ * Components never call api.post() directly for auth.
+ */
+import { api } from "@infra/http/apiClient";
+import { API_ENDPOINTS } from "@core/constants";
+import type { AuthResponse, AuthUser, LoginCredentials, RegisterData } from "../types";
+
+export const authApi = {
+  login: (credentials: LoginCredentials) =>
+    api.post<AuthResponse>(API_ENDPOINTS.AUTH.LOGIN, credentials),
+
+  register: (data: RegisterData) =>
+    api.post<{ message: string }>(API_ENDPOINTS.AUTH.REGISTER, data),
+
+  getMe: () =>
+    api.get<AuthUser>(API_ENDPOINTS.AUTH.ME),
+
+  refreshToken: () =>
+    api.post<AuthResponse>(API_ENDPOINTS.AUTH.REFRESH),
+};
@@ -0,0 +1,50 @@
+import { Card, CardHeader, CardTitle, CardContent } from "@shared/ui/Card";
+import { Skeleton } from "@shared/ui/Skeleton";
+import { formatNumber } from "@shared/utils/format";
+import type { DashboardStats } from "../types";
+
+interface StatsGridProps {
+  stats: DashboardStats | undefined;
+  isLoading: boolean;
+}
+
+export function StatsGrid({ stats, isLoading }: StatsGridProps) {
+  const items = stats
+    ? [
+        { label: "Total Users", value: formatNumber(stats.total_users) },
+        { label: "Active Projects", value: formatNumber(stats.active_projects) },
+        { label: "Revenue", value: `$${formatNumber(stats.revenue)}` },
+        { label: "Growth", value: `${stats.growth_percent}%` },
+      ]
+    : [];
+
+  if (isLoading) {
+    return (
+      <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-4">
+        {Array.from({ length: 4 }).map((_, i) => (
+          <Card key={i}>
+            <CardHeader><Skeleton className="h-4 w-24" /></CardHeader>
+            <CardContent><Skeleton className="h-8 w-16" /></CardContent>
+          </Card>
+        ))}
+      </div>
+    );
+  }
+
+  return (
+    <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-4">
+      {items.map((item) => (
+        <Card key={item.label}>
+          <CardHeader>
+            <CardTitle className="text-sm font-medium text-muted-foreground">
+              {item.label}
+            </CardTitle>
+          </CardHeader>
+          <CardContent>
+            <p className="text-2xl font-bold">{item.value}</p>
+          </CardContent>
+        </Card>
+      ))}
+    </div>
+  );
+}
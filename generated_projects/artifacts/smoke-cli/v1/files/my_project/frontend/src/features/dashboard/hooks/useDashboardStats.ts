@@ -0,0 +1,17 @@
+import { useQuery } from "@tanstack/react-query";
+import { QUERY_KEYS } from "@core/constants";
+import { dashboardApi } from "../api/dashboardApi";
+
+export function useDashboardStats() {
+  return useQuery({
+    queryKey: QUERY_KEYS.DASHBOARD.STATS,
+    queryFn: dashboardApi.getStats,
+  });
+}
+
+export function useDashboardActivity() {
+  return useQuery({
+    queryKey: QUERY_KEYS.DASHBOARD.ACTIVITY,
+    queryFn: dashboardApi.getActivity,
+  });
+}
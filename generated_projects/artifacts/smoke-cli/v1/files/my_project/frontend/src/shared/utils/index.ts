@@ -0,0 +1,2 @@
+export { cn } from "./cn";
+export { formatDate, formatDateTime, formatNumber, formatBytes, truncate } from "./format";
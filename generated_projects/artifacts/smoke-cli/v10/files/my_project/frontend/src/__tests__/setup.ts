@@ -0,0 +1,4 @@
+import "@testing-library/jest-dom/vitest";
+
+// Global test setup
+// Add any test utilities or mocks here
@@ -0,0 +1,79 @@
+/**
+ * Structured logger — consistent logging across the application.
+ *
+ * Features:
+ * - Log levels (debug, info, warn, error)
+ * - Structured context (user, feature, action)
+ * - Sensitive data redaction
+ * - Environment-aware (no debug in production)
+ */
+import { config } from "@core/config";
+
+type LogLevel = "debug" | "info" | "warn" | "error";
+
+interface LogContext {
+  feature?: string;
+  action?: string;
+  userId?: string;
+  [key: string]: unknown;
+}
+
+const REDACTED_KEYS = new Set(["password", "token", "secret", "authorization", "cookie"]);
+
+function redact(obj: Record<string, unknown>): Record<string, unknown> {
+  const result: Record<string, unknown> = {};
+  for (const [key, value] of Object.entries(obj)) {
+    if (REDACTED_KEYS.has(key.toLowerCase())) {
+      result[key] = "[REDACTED]";
+    } else if (typeof value === "object" && value !== null) {
+      result[key] = redact(value as Record<string, unknown>);
+    } else {
+      result[key] = value;
+    }
+  }
+  return result;
+}
+
+function createLogger() {
+  const shouldLog = (level: LogLevel): boolean => {
+    if (!config.enableLogging) return false;
+    if (config.isProduction && level === "debug") return false;
+    return true;
+  };
+
+  const formatMessage = (level: LogLevel, message: string, context?: LogContext) => {
+    const timestamp = new Date().toISOString();
+    const ctx = context ? redact(context as Record<string, unknown>) : {};
+    return { timestamp, level, message, ...ctx };
+  };
+
+  return {
+    debug: (message: string, context?: LogContext) => {
+      if (shouldLog("debug")) {
+        // eslint-disable-next-line no-console
+        console.debug(JSON.stringify(formatMessage("debug", message, context)));
+      }
+    },
+
+    info: (message: string, context?: LogContext) => {
+      if (shouldLog("info")) {
+        // eslint-disable-next-line no-console
+        console.info(JSON.stringify(formatMessage("info", message, context)));
+      }
+    },
+
+    warn: (message: string, context?: LogContext) => {
+      if (shouldLog("warn")) {
+        console.warn(JSON.stringify(formatMessage("warn", message, context)));
+      }
+    },
+
+    error: (message: string, context?: LogContext) => {
+      if (shouldLog("error")) {
+        console.error(JSON.stringify(formatMessage("error", message, context)));
+      }
+    },
+  };
+}
+
+export const logger = createLogger();
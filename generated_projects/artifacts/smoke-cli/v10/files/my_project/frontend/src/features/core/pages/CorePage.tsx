@@ -0,0 +1,30 @@
+import { FeatureErrorBoundary } from "@shared/components/FeatureErrorBoundary";
+import { LoadingScreen } from "@shared/ui/LoadingScreen";
+import { useCoreList } from "../hooks/useCore";
+
+export default function CorePage() {
+  const { data, isLoading } = useCoreList();
+
+  if (isLoading) return <LoadingScreen message="Loading core..." />;
+
+  return (
+    <FeatureErrorBoundary feature="core">
+      <div className="space-y-8">
+        <div>
+          <h1 className="text-3xl font-bold">Core</h1>
+          <p className="text-muted-foreground">Manage your core</p>
+        </div>
+        <div className="grid gap-4">
+          {data?.map((item) => (
+            <div key={item.id} className="rounded-lg border p-4">
+              <h3 className="font-medium">{item.name}</h3>
+            </div>
+          ))}
+          {(!data || data.length === 0) && (
+            <p className="text-sm text-muted-foreground">No core yet</p>
+          )}
+        </div>
+      </div>
+    </FeatureErrorBoundary>
+  );
+}
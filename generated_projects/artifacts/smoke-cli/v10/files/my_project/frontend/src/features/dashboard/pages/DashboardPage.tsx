@@ -0,0 +1,24 @@
+import { FeatureErrorBoundary } from "@shared/components/FeatureErrorBoundary";
+import { StatsGrid } from "../components/StatsGrid";
+import { ActivityFeed } from "../components/ActivityFeed";
+import { useDashboardStats, useDashboardActivity } from "../hooks/useDashboardStats";
+
+export default function DashboardPage() {
+  const { data: stats, isLoading: statsLoading } = useDashboardStats();
+  const { data: activities, isLoading: activityLoading } = useDashboardActivity();
+
+  return (
+    <FeatureErrorBoundary feature="dashboard">
+      <div className="space-y-8">
+        <div>
+          <h1 className="text-3xl font-bold">Dashboard</h1>
+          <p className="text-muted-foreground">Overview of your platform</p>
+        </div>
+        <StatsGrid stats={stats} isLoading={statsLoading} />
+        <div className="grid gap-6 lg:grid-cols-2">
+          <ActivityFeed activities={activities} isLoading={activityLoading} />
+        </div>
+      </div>
+    </FeatureErrorBoundary>
+  );
+}
@@ -0,0 +1,30 @@
+import { Link, useNavigate } from "react-router-dom";
+import { RegisterForm } from "../components/RegisterForm";
+import { Card, CardHeader, CardTitle, CardDescription, CardContent, CardFooter } from "@shared/ui/Card";
+import { ROUTES } from "@core/constants";
+
+export default function RegisterPage() {
+  const navigate = useNavigate();
+
+  return (
+    <div className="flex min-h-[80vh] items-center justify-center">
+      <Card className="w-full max-w-md">
+        <CardHeader className="text-center">
+          <CardTitle>Create Account</CardTitle>
+          <CardDescription>Get started with My Project</CardDescription>
+        </CardHeader>
+        <CardContent>
+          <RegisterForm onSuccess={() => navigate(ROUTES.LOGIN)} />
+        </CardContent>
+        <CardFooter className="justify-center">
+          <p className="text-sm text-muted-foreground">
+            Already have an account?{" "}
+            <Link to={ROUTES.LOGIN} className="text-primary hover:underline">
+              Sign in
+            </Link>
+          </p>
+        </CardFooter>
+      </Card>
+    </div>
+  );
+}
@@ -0,0 +1,140 @@
+/**
+ * WebSocket client — for real-time features.
+ *
+ * Features:
+ * - Auto-reconnect with exponential backoff
+ * - Event-based message handling
+ * - Connection state tracking
+ * - Heartbeat/ping support
+ */
+import { logger } from "@core/logger";
+import { config } from "@core/config";
+
+type MessageHandler = (data: unknown) => void;
+type ConnectionState = "connecting" | "connected" | "disconnecting" | "disconnected";
+
+interface WebSocketClientOptions {
+  url: string;
+  reconnect?: boolean;
+  maxRetries?: number;
+  heartbeatInterval?: number;
+}
+
+export class WebSocketClient {
+  private ws: WebSocket | null = null;
+  private handlers = new Map<string, Set<MessageHandler>>();
+  private retryCount = 0;
+  private heartbeatTimer: ReturnType<typeof setInterval> | null = null;
+  private state: ConnectionState = "disconnected";
+
+  constructor(private options: WebSocketClientOptions) {}
+
+  get connectionState(): ConnectionState {
+    return this.state;
+  }
+
+  connect(): void {
+    if (this.ws?.readyState === WebSocket.OPEN) return;
+
+    this.state = "connecting";
+    this.ws = new WebSocket(this.options.url);
+
+    this.ws.onopen = () => {
+      this.state = "connected";
+      this.retryCount = 0;
+      logger.info("WebSocket connected", { feature: "websocket" });
+      this.startHeartbeat();
+    };
+
+    this.ws.onmessage = (event) => {
+      try {
+        const data = JSON.parse(event.data) as { type: string; payload: unknown };
+        const handlers = this.handlers.get(data.type);
+        if (handlers) {
+          handlers.forEach((handler) => handler(data.payload));
+        }
+      } catch {
+        logger.warn("Failed to parse WebSocket message", { feature: "websocket" });
+      }
+    };
+
+    this.ws.onclose = () => {
+      this.state = "disconnected";
+      this.stopHeartbeat();
+
+      if (
+        this.options.reconnect !== false &&
+        this.retryCount < (this.options.maxRetries ?? 5)
+      ) {
+        const delay = Math.min(1000 * Math.pow(2, this.retryCount), 30_000);
+        this.retryCount++;
+        logger.info(`WebSocket reconnecting in ${delay}ms (attempt ${this.retryCount})`, {
+          feature: "websocket",
+        });
+        setTimeout(() => this.connect(), delay);
+      }
+    };
+
+    this.ws.onerror = () => {
+      logger.error("WebSocket error", { feature: "websocket" });
+    };
+  }
+
+  disconnect(): void {
+    this.state = "disconnecting";
+    this.options.reconnect = false;
+    this.ws?.close();
+    this.stopHeartbeat();
+  }
+
+  on(event: string, handler: MessageHandler): () => void {
+    if (!this.handlers.has(event)) {
+      this.handlers.set(event, new Set());
+    }
+    this.handlers.get(event)!.add(handler);
+
+    // Return unsubscribe function
+    return () => {
+      this.handlers.get(event)?.delete(handler);
+    };
+  }
+
+  send(type: string, payload: unknown): void {
+    if (this.ws?.readyState === WebSocket.OPEN) {
+      this.ws.send(JSON.stringify({ type, payload }));
+    } else {
+      logger.warn("Cannot send — WebSocket not connected", { feature: "websocket" });
+    }
+  }
+
+  private startHeartbeat(): void {
+    const interval = this.options.heartbeatInterval ?? 30_000;
+    this.heartbeatTimer = setInterval(() => {
+      this.send("ping", { timestamp: Date.now() });
+    }, interval);
+  }
+
+  private stopHeartbeat(): void {
+    if (this.heartbeatTimer) {
+      clearInterval(this.heartbeatTimer);
+      this.heartbeatTimer = null;
+    }
+  }
+}
+
+/**
+ * Create a pre-configured WebSocket client.
+ */
+export function createWebSocketClient(path: string): WebSocketClient {
+  const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+  const wsUrl = config.apiUrl
+    ? config.apiUrl.replace(/^http/, "ws") + path
+    : `${protocol}//${window.location.host}${path}`;
+
+  return new WebSocketClient({
+    url: wsUrl,
+    reconnect: true,
+    maxRetries: 5,
+    heartbeatInterval: 30_000,
+  });
+}
@@ -0,0 +1,22 @@
+import { APP_NAME } from "@core/constants";
+
+interface FooterProps {
+  appName?: string;
+}
+
+export function Footer({ appName }: FooterProps) {
+  return (
+    <footer className="border-t bg-background">
+      <div className="container mx-auto flex flex-col items-center gap-4 px-4 py-8 md:flex-row md:justify-between">
+        <p className="text-sm text-muted-foreground">
+          &copy; {new Date().getFullYear()} {appName || APP_NAME}. All rights reserved.
+        </p>
+        <div className="flex gap-4">
+          <a href="#" className="text-sm text-muted-foreground hover:text-foreground">Privacy</a>
+          <a href="#" className="text-sm text-muted-foreground hover:text-foreground">Terms</a>
+          <a href="#" className="text-sm text-muted-foreground hover:text-foreground">Contact</a>
+        </div>
+      </div>
+    </footer>
+  );
+}
@@ -0,0 +1,27 @@
+import { defineConfig } from "vitest/config";
+import react from "@vitejs/plugin-react";
+import path from "path";
+
+export default defineConfig({
+  plugins: [react()],
+  test: {
+    globals: true,
+    environment: "jsdom",
+    setupFiles: ["./src/__tests__/setup.ts"],
+    css: true,
+    coverage: {
+      reporter: ["text", "html", "lcov"],
+      exclude: ["node_modules/", "src/__tests__/"],
+    },
+  },
+  resolve: {
+    alias: {
+      "@": path.resolve(__dirname, "./src"),
+      "@app": path.resolve(__dirname, "./src/app"),
+      "@core": path.resolve(__dirname, "./src/core"),
+      "@infra": path.resolve(__dirname, "./src/infrastructure"),
+      "@features": path.resolve(__dirname, "./src/features"),
+      "@shared": path.resolve(__dirname, "./src/shared"),
+    },
+  },
+});
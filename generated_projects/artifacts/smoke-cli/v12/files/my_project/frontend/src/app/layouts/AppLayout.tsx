@@ -0,0 +1,25 @@
+/**
+ * Application layout shell — header, sidebar, main content area.
+ * No business logic. Pure composition.
+ */
+import type { ReactNode } from "react";
+import { Header } from "@shared/components/Header";
+import { Footer } from "@shared/components/Footer";
+
+interface AppLayoutProps {
+  children: ReactNode;
+}
+
+export function AppLayout({ children }: AppLayoutProps) {
+  return (
+    <div className="flex min-h-screen flex-col">
+      <Header appName="My Project" />
+      <main className="flex-1">
+        <div className="container mx-auto px-4 py-8">
+          {children}
+        </div>
+      </main>
+      <Footer appName="My Project" />
+    </div>
+  );
+}
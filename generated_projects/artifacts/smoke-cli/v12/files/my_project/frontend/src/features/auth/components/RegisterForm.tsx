@@ -0,0 +1,62 @@
+/**
+ * Registration form — pure UI with Zod validation.
+ */
+import { useState, type FormEvent } from "react";
+import { useAuth } from "../hooks/useAuth";
+import { Button } from "@shared/ui/Button";
+import { Input } from "@shared/ui/Input";
+import { toast } from "sonner";
+import { registerSchema, type RegisterInput } from "@shared/utils/validators";
+
+interface RegisterFormProps {
+  onSuccess?: () => void;
+}
+
+export function RegisterForm({ onSuccess }: RegisterFormProps) {
+  const { register, isLoading } = useAuth();
+  const [errors, setErrors] = useState<Record<string, string>>({});
+
+  const handleSubmit = async (e: FormEvent<HTMLFormElement>) => {
+    e.preventDefault();
+    setErrors({});
+
+    const formData = new FormData(e.currentTarget);
+    const raw = {
+      name: formData.get("name") as string,
+      email: formData.get("email") as string,
+      password: formData.get("password") as string,
+      confirmPassword: formData.get("confirmPassword") as string,
+    };
+
+    const result = registerSchema.safeParse(raw);
+    if (!result.success) {
+      const fieldErrors: Record<string, string> = {};
+      for (const issue of result.error.issues) {
+        const field = issue.path[0] as string;
+        fieldErrors[field] = issue.message;
+      }
+      setErrors(fieldErrors);
+      return;
+    }
+
+    try {
+      await register({ name: result.data.name, email: result.data.email, password: result.data.password });
+      toast.success("Account created! Please sign in.");
+      onSuccess?.();
+    } catch {
+      toast.error("Registration failed. Please try again.");
+    }
+  };
+
+  return (
+    <form onSubmit={handleSubmit} className="space-y-4" noValidate>
+      <Input name="name" label="Name" placeholder="John Doe" error={errors.name} autoComplete="name" required />
+      <Input name="email" type="email" label="Email" placeholder="you@example.com" error={errors.email} autoComplete="email" required />
+      <Input name="password" type="password" label="Password" placeholder="Min 8 chars, 1 upper, 1 number" error={errors.password} autoComplete="new-password" required />
+      <Input name="confirmPassword" type="password" label="Confirm Password" placeholder="Repeat your password" error={errors.confirmPassword} autoComplete="new-password" required />
+      <Button type="submit" className="w-full" isLoading={isLoading}>
+        Create Account
+      </Button>
+    </form>
+  );
+}
@@ -0,0 +1,4 @@
+/**
+ * Settings feature — public API.
+ */
+export type { UserProfile, Preferences } from "./types";
@@ -0,0 +1,47 @@
+"""
+Global exception handlers for consistent error responses.
+"""
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+import structlog
+
+from app.core.exceptions import AppException
+
+logger = structlog.get_logger()
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Register all exception handlers."""
+
+    @app.exception_handler(AppException)
+    async def app_exception_handler(request: Request, exc: AppException):
+        logger.warning(
+            "app_error",
+            status_code=exc.status_code,
+            detail=exc.detail,
+            path=request.url.path,
+        )
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "detail": exc.detail,
+                "status_code": exc.status_code,
+            },
+        )
+
+    @app.exception_handler(Exception)
+    async def unhandled_exception_handler(request: Request, exc: Exception):
+        logger.error(
+            "unhandled_error",
+            error=str(exc),
+            path=request.url.path,
+            exc_info=True,
+        )
+        return JSONResponse(
+            status_code=500,
+            content={
+                "detail": "Internal server error",
+                "status_code": 500,
+            },
+        )
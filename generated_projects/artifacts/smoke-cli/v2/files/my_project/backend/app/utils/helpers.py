@@ -0,0 +1,16 @@
+"""
+Utility helpers.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+
+def generate_id() -> str:
+    """Generate a unique ID."""
+    return str(uuid.uuid4())
+
+
+def utc_now() -> datetime:
+    """Get current UTC time."""
+    return datetime.now(timezone.utc)
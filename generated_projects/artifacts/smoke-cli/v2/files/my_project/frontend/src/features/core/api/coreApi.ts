@@ -0,0 +1,11 @@
+import { api } from "@infra/http/apiClient";
+import { API_ENDPOINTS } from "@core/constants";
+import type { CoreItem } from "../types";
+
+export const coreApi = {
+  getAll: () => api.get<CoreItem[]>(API_ENDPOINTS.CORE.LIST),
+  getById: (id: string) => api.get<CoreItem>(API_ENDPOINTS.CORE.DETAIL(id)),
+  create: (data: Partial<CoreItem>) => api.post<CoreItem>(API_ENDPOINTS.CORE.CREATE, data),
+  update: (id: string, data: Partial<CoreItem>) => api.put<CoreItem>(API_ENDPOINTS.CORE.UPDATE(id), data),
+  delete: (id: string) => api.delete(API_ENDPOINTS.CORE.DELETE(id)),
+};
@@ -0,0 +1,62 @@
+import { Card, CardHeader, CardTitle, CardContent } from "@shared/ui/Card";
+import { Skeleton } from "@shared/ui/Skeleton";
+import { formatDateTime } from "@shared/utils/format";
+import type { Activity } from "../types";
+
+interface ActivityFeedProps {
+  activities: Activity[] | undefined;
+  isLoading: boolean;
+}
+
+export function ActivityFeed({ activities, isLoading }: ActivityFeedProps) {
+  if (isLoading) {
+    return (
+      <Card>
+        <CardHeader><CardTitle>Recent Activity</CardTitle></CardHeader>
+        <CardContent className="space-y-4">
+          {Array.from({ length: 5 }).map((_, i) => (
+            <div key={i} className="flex items-center gap-3">
+              <Skeleton className="h-8 w-8 rounded-full" />
+              <div className="flex-1 space-y-1">
+                <Skeleton className="h-4 w-3/4" />
+                <Skeleton className="h-3 w-1/2" />
+              </div>
+            </div>
+          ))}
+        </CardContent>
+      </Card>
+    );
+  }
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle>Recent Activity</CardTitle>
+      </CardHeader>
+      <CardContent>
+        {(!activities || activities.length === 0) ? (
+          <p className="text-sm text-muted-foreground">No recent activity</p>
+        ) : (
+          <div className="space-y-4">
+            {activities.map((activity) => (
+              <div key={activity.id} className="flex items-start gap-3">
+                <div className="h-8 w-8 rounded-full bg-primary/10 flex items-center justify-center text-xs font-medium text-primary">
+                  {activity.user_name.charAt(0).toUpperCase()}
+                </div>
+                <div className="flex-1 space-y-0.5">
+                  <p className="text-sm">
+                    <span className="font-medium">{activity.user_name}</span>{" "}
+                    {activity.description}
+                  </p>
+                  <p className="text-xs text-muted-foreground">
+                    {formatDateTime(activity.timestamp)}
+                  </p>
+                </div>
+              </div>
+            ))}
+          </div>
+        )}
+      </CardContent>
+    </Card>
+  );
+}
@@ -0,0 +1,58 @@
+import { Link } from "react-router-dom";
+import { Button } from "@shared/ui/Button";
+import { Card, CardContent, CardHeader, CardTitle } from "@shared/ui/Card";
+import { ROUTES } from "@core/constants";
+
+export default function HomePage() {
+  return (
+    <div className="space-y-16">
+      <section className="flex flex-col items-center gap-6 py-16 text-center">
+        <h1 className="text-4xl font-extrabold tracking-tight sm:text-5xl md:text-6xl text-balance">
+          Welcome to{" "}<span className="text-primary">My Project</span>
+        </h1>
+        <p className="max-w-2xl text-lg text-muted-foreground">
+          A production-ready platform built with SSS-class architecture.
+          Scalable, isolated, observable, and maintainable.
+        </p>
+        <div className="flex gap-4">
+          <Link to={ROUTES.REGISTER}>
+            <Button size="lg">Get Started</Button>
+          </Link>
+          <Link to={ROUTES.LOGIN}>
+            <Button variant="outline" size="lg">Sign In</Button>
+          </Link>
+        </div>
+      </section>
+
+      <section className="space-y-8">
+        <h2 className="text-center text-3xl font-bold">Platform Features</h2>
+        <div className="grid gap-6 md:grid-cols-3">
+          <Card>
+            <CardHeader><CardTitle className="text-lg">Scalable Architecture</CardTitle></CardHeader>
+            <CardContent>
+              <p className="text-muted-foreground">
+                Domain-driven features with full isolation. Each module scales independently.
+              </p>
+            </CardContent>
+          </Card>
+          <Card>
+            <CardHeader><CardTitle className="text-lg">Performance First</CardTitle></CardHeader>
+            <CardContent>
+              <p className="text-muted-foreground">
+                Route-based code splitting, optimized caching, Suspense boundaries, and bundle analysis.
+              </p>
+            </CardContent>
+          </Card>
+          <Card>
+            <CardHeader><CardTitle className="text-lg">Enterprise Security</CardTitle></CardHeader>
+            <CardContent>
+              <p className="text-muted-foreground">
+                JWT auth, input validation with Zod, protected routes, and security interceptors.
+              </p>
+            </CardContent>
+          </Card>
+        </div>
+      </section>
+    </div>
+  );
+}
@@ -0,0 +1,16 @@
+/** Settings feature types */
+
+export interface UserProfile {
+  id: string;
+  name: string;
+  email: string;
+  avatar_url?: string;
+  bio?: string;
+}
+
+export interface Preferences {
+  theme: "light" | "dark" | "system";
+  notifications_enabled: boolean;
+  email_digest: "daily" | "weekly" | "never";
+  language: string;
+}
@@ -0,0 +1,176 @@
+/**
+ * Centralized HTTP client — ALL API calls go through this.
+ *
+ * Engineering constitution rule #2:
+ * "All API calls through centralized client."
+ *
+ * Features:
+ * - Type-safe request/response
+ * - Automatic auth header injection
+ * - Retry with exponential backoff
+ * - Request/response interceptors
+ * - Timeout handling
+ * - Structured error conversion
+ */
+import { config } from "@core/config";
+import { logger } from "@core/logger";
+import { ApiError, NetworkError, AuthError } from "@core/error";
+import { STORAGE_KEYS, HTTP_STATUS } from "@core/constants";
+import { requestInterceptors, responseInterceptors } from "./interceptors";
+
+const DEFAULT_TIMEOUT = 30_000; // 30 seconds
+const MAX_RETRIES = 3;
+
+interface RequestOptions extends Omit<RequestInit, "body"> {
+  body?: unknown;
+  params?: Record<string, string | number | boolean | undefined>;
+  timeout?: number;
+  retries?: number;
+  skipAuth?: boolean;
+}
+
+/**
+ * Sleep with jitter for retry backoff.
+ */
+function backoffDelay(attempt: number): number {
+  const base = Math.min(1000 * Math.pow(2, attempt), 30_000);
+  const jitter = Math.random() * 500;
+  return base + jitter;
+}
+
+/**
+ * Core request function — not exported directly.
+ * Use the `api` object methods below.
+ */
+async function request<T>(
+  endpoint: string,
+  options: RequestOptions = {},
+): Promise<T> {
+  const {
+    body,
+    params,
+    headers: customHeaders,
+    timeout = DEFAULT_TIMEOUT,
+    retries = 0,
+    skipAuth = false,
+    ...rest
+  } = options;
+
+  // Build URL
+  let url = `${config.apiUrl}${endpoint}`;
+  if (params) {
+    const filtered = Object.entries(params)
+      .filter(([, v]) => v !== undefined)
+      .map(([k, v]) => [k, String(v)]);
+    if (filtered.length > 0) {
+      url += `?${new URLSearchParams(filtered).toString()}`;
+    }
+  }
+
+  // Build headers
+  const headers: Record<string, string> = {
+    "Content-Type": "application/json",
+    ...((customHeaders as Record<string, string>) || {}),
+  };
+
+  // Auth token injection
+  if (!skipAuth) {
+    const token = localStorage.getItem(STORAGE_KEYS.AUTH_TOKEN);
+    if (token) {
+      headers["Authorization"] = `Bearer ${token}`;
+    }
+  }
+
+  // Apply request interceptors
+  let finalHeaders = headers;
+  for (const interceptor of requestInterceptors) {
+    finalHeaders = interceptor(finalHeaders, endpoint);
+  }
+
+  // Timeout via AbortController
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), timeout);
+
+  const startTime = performance.now();
+
+  try {
+    const response = await fetch(url, {
+      ...rest,
+      headers: finalHeaders,
+      body: body ? JSON.stringify(body) : undefined,
+      signal: controller.signal,
+    });
+
+    clearTimeout(timeoutId);
+
+    const duration = Math.round(performance.now() - startTime);
+    logger.debug(`[HTTP] ${rest.method || "GET"} ${endpoint} → ${response.status} (${duration}ms)`, {
+      feature: "http",
+      action: endpoint,
+    });
+
+    // Apply response interceptors
+    for (const interceptor of responseInterceptors) {
+      interceptor(response, endpoint);
+    }
+
+    // Handle auth errors
+    if (response.status === HTTP_STATUS.UNAUTHORIZED) {
+      localStorage.removeItem(STORAGE_KEYS.AUTH_TOKEN);
+      throw new AuthError();
+    }
+
+    // Handle errors
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => null);
+      throw new ApiError(response.status, response.statusText, errorData);
+    }
+
+    // No content
+    if (response.status === HTTP_STATUS.NO_CONTENT) {
+      return undefined as T;
+    }
+
+    return response.json();
+  } catch (error) {
+    clearTimeout(timeoutId);
+
+    // Retry on network errors
+    if (error instanceof TypeError && retries < MAX_RETRIES) {
+      const delay = backoffDelay(retries);
+      logger.warn(`[HTTP] Retrying ${endpoint} (attempt ${retries + 1}/${MAX_RETRIES}) in ${Math.round(delay)}ms`);
+      await new Promise((r) => setTimeout(r, delay));
+      return request<T>(endpoint, { ...options, retries: retries + 1 });
+    }
+
+    // Convert abort to timeout error
+    if (error instanceof DOMException && error.name === "AbortError") {
+      throw new NetworkError(`Request timeout after ${timeout}ms`);
+    }
+
+    // Re-throw known errors
+    if (error instanceof ApiError || error instanceof AuthError) {
+      throw error;
+    }
+
+    throw new NetworkError();
+  }
+}
+
+/** Type-safe API methods — use these everywhere */
+export const api = {
+  get: <T>(endpoint: string, params?: Record<string, string | number | boolean | undefined>) =>
+    request<T>(endpoint, { method: "GET", params }),
+
+  post: <T>(endpoint: string, body?: unknown) =>
+    request<T>(endpoint, { method: "POST", body }),
+
+  put: <T>(endpoint: string, body?: unknown) =>
+    request<T>(endpoint, { method: "PUT", body }),
+
+  patch: <T>(endpoint: string, body?: unknown) =>
+    request<T>(endpoint, { method: "PATCH", body }),
+
+  delete: <T>(endpoint: string) =>
+    request<T>(endpoint, { method: "DELETE" }),
+};
@@ -0,0 +1,7 @@
+import { clsx, type ClassValue } from "clsx";
+import { twMerge } from "tailwind-merge";
+
+/** Merge Tailwind classes — the shadcn/ui pattern */
+export function cn(...inputs: ClassValue[]) {
+  return twMerge(clsx(inputs));
+}
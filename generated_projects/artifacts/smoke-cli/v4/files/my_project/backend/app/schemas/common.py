@@ -0,0 +1,30 @@
+"""
+Common schemas shared across the application.
+"""
+
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+from datetime import datetime
+
+T = TypeVar("T")
+
+
+class MessageResponse(BaseModel):
+    """Generic message response."""
+    message: str
+    status_code: int = 200
+
+
+class PaginatedResponse(BaseModel, Generic[T]):
+    """Paginated list response."""
+    items: List[T]
+    total: int
+    page: int
+    per_page: int
+    total_pages: int
+
+
+class TimestampMixin(BaseModel):
+    """Mixin for created/updated timestamps."""
+    created_at: datetime
+    updated_at: Optional[datetime] = None
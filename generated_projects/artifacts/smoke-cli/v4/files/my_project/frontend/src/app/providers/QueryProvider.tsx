@@ -0,0 +1,39 @@
+/**
+ * React Query provider with optimized defaults.
+ *
+ * Cache strategy:
+ * - staleTime: 5min (avoid refetching fresh data)
+ * - gcTime: 30min (keep unused data in cache)
+ * - retry: 3 with exponential backoff
+ * - No refetch on window focus (user-initiated only)
+ */
+import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
+import type { ReactNode } from "react";
+
+const queryClient = new QueryClient({
+  defaultOptions: {
+    queries: {
+      staleTime: 5 * 60 * 1000,       // 5 minutes
+      gcTime: 30 * 60 * 1000,         // 30 minutes
+      retry: 3,
+      retryDelay: (attempt) => Math.min(1000 * 2 ** attempt, 30_000),
+      refetchOnWindowFocus: false,
+      refetchOnReconnect: true,
+    },
+    mutations: {
+      retry: 1,
+    },
+  },
+});
+
+interface QueryProviderProps {
+  children: ReactNode;
+}
+
+export function QueryProvider({ children }: QueryProviderProps) {
+  return (
+    <QueryClientProvider client={queryClient}>
+      {children}
+    </QueryClientProvider>
+  );
+}
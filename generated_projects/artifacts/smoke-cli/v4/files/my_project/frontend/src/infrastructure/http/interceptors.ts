@@ -0,0 +1,49 @@
+/**
+ * HTTP interceptors — run before/after every API call.
+ *
+ * Request interceptors: modify headers, add correlation IDs
+ * Response interceptors: handle global responses, refresh tokens
+ */
+import { logger } from "@core/logger";
+
+type RequestInterceptor = (
+  headers: Record<string, string>,
+  endpoint: string,
+) => Record<string, string>;
+
+type ResponseInterceptor = (
+  response: Response,
+  endpoint: string,
+) => void;
+
+/** Add correlation ID for request tracing */
+const addCorrelationId: RequestInterceptor = (headers) => {
+  headers["X-Correlation-ID"] = crypto.randomUUID();
+  return headers;
+};
+
+/** Add request timestamp */
+const addTimestamp: RequestInterceptor = (headers) => {
+  headers["X-Request-Time"] = new Date().toISOString();
+  return headers;
+};
+
+/** Log slow responses */
+const logSlowResponses: ResponseInterceptor = (response, endpoint) => {
+  const serverTiming = response.headers.get("Server-Timing");
+  if (serverTiming) {
+    logger.debug(`[HTTP] Server timing for ${endpoint}: ${serverTiming}`, {
+      feature: "http",
+      action: "server-timing",
+    });
+  }
+};
+
+export const requestInterceptors: RequestInterceptor[] = [
+  addCorrelationId,
+  addTimestamp,
+];
+
+export const responseInterceptors: ResponseInterceptor[] = [
+  logSlowResponses,
+];
@@ -0,0 +1,35 @@
+import type { ReactNode } from "react";
+import { cn } from "@shared/utils/cn";
+import { X } from "lucide-react";
+
+interface DialogProps {
+  open: boolean;
+  onClose: () => void;
+  children: ReactNode;
+  className?: string;
+  title?: string;
+}
+
+export function Dialog({ open, onClose, children, className, title }: DialogProps) {
+  if (!open) return null;
+
+  return (
+    <div className="fixed inset-0 z-50 flex items-center justify-center" role="dialog" aria-modal="true" aria-label={title}>
+      <div className="fixed inset-0 bg-black/50 backdrop-blur-sm" onClick={onClose} aria-hidden="true" />
+      <div className={cn(
+        "relative z-50 w-full max-w-lg rounded-lg bg-background p-6 shadow-lg animate-fade-in",
+        className,
+      )}>
+        <button
+          onClick={onClose}
+          className="absolute right-4 top-4 rounded-sm opacity-70 hover:opacity-100 focus:outline-none focus:ring-2 focus:ring-ring"
+          aria-label="Close dialog"
+        >
+          <X className="h-4 w-4" />
+        </button>
+        {title && <h2 className="text-lg font-semibold mb-4">{title}</h2>}
+        {children}
+      </div>
+    </div>
+  );
+}
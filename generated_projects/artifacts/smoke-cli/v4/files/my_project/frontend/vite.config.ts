@@ -0,0 +1,51 @@
+import { defineConfig } from "vite";
+import react from "@vitejs/plugin-react";
+import path from "path";
+
+export default defineConfig(({ mode }) => ({
+  plugins: [react()],
+  resolve: {
+    alias: {
+      "@": path.resolve(__dirname, "./src"),
+      "@app": path.resolve(__dirname, "./src/app"),
+      "@core": path.resolve(__dirname, "./src/core"),
+      "@infra": path.resolve(__dirname, "./src/infrastructure"),
+      "@features": path.resolve(__dirname, "./src/features"),
+      "@shared": path.resolve(__dirname, "./src/shared"),
+    },
+  },
+  server: {
+    port: 3000,
+    proxy: {
+      "/api": {
+        target: "http://localhost:8000",
+        changeOrigin: true,
+      },
+    },
+  },
+  build: {
+    sourcemap: mode !== "production",
+    target: "ES2022",
+    rollupOptions: {
+      output: {
+        manualChunks: {
+          "vendor-react": ["react", "react-dom", "react-router-dom"],
+          "vendor-query": ["@tanstack/react-query", "zustand", "zod"],
+          "vendor-ui": ["lucide-react", "sonner", "clsx", "tailwind-merge"],
+        },
+      },
+    },
+    chunkSizeWarningLimit: 500,
+  },
+  // Performance budgets
+  ...(mode === "analyze" && {
+    plugins: [
+      react(),
+      // @ts-expect-error dynamic import for analysis
+      (await import("rollup-plugin-visualizer")).visualizer({
+        open: true,
+        gzipSize: true,
+      }),
+    ],
+  }),
+}));
@@ -0,0 +1,11 @@
+"""
+Health check tests.
+"""
+
+
+def test_health_endpoint(client):
+    """Health check should return healthy status."""
+    response = client.get("/health")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
@@ -0,0 +1,49 @@
+import { useState, type FormEvent } from "react";
+import { Button } from "@shared/ui/Button";
+import { Input } from "@shared/ui/Input";
+import { Card, CardHeader, CardTitle, CardContent } from "@shared/ui/Card";
+import { toast } from "sonner";
+import { settingsApi } from "../api/settingsApi";
+import type { UserProfile } from "../types";
+
+interface ProfileFormProps {
+  profile: UserProfile;
+}
+
+export function ProfileForm({ profile }: ProfileFormProps) {
+  const [isLoading, setIsLoading] = useState(false);
+
+  const handleSubmit = async (e: FormEvent<HTMLFormElement>) => {
+    e.preventDefault();
+    setIsLoading(true);
+
+    const formData = new FormData(e.currentTarget);
+    try {
+      await settingsApi.updateProfile({
+        name: formData.get("name") as string,
+        bio: formData.get("bio") as string,
+      });
+      toast.success("Profile updated");
+    } catch {
+      toast.error("Failed to update profile");
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle>Profile</CardTitle>
+      </CardHeader>
+      <CardContent>
+        <form onSubmit={handleSubmit} className="space-y-4">
+          <Input name="name" label="Name" defaultValue={profile.name} required />
+          <Input name="email" label="Email" defaultValue={profile.email} disabled />
+          <Input name="bio" label="Bio" defaultValue={profile.bio || ""} />
+          <Button type="submit" isLoading={isLoading}>Save Changes</Button>
+        </form>
+      </CardContent>
+    </Card>
+  );
+}
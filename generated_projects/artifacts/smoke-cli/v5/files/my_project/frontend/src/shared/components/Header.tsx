@@ -0,0 +1,64 @@
+import { Link, useLocation } from "react-router-dom";
+import { useAuthStore } from "@features/auth";
+import { Button } from "@shared/ui/Button";
+import { cn } from "@shared/utils/cn";
+import { ROUTES } from "@core/constants";
+
+interface HeaderProps {
+  appName: string;
+}
+
+export function Header({ appName }: HeaderProps) {
+  const { isAuthenticated, user, logout } = useAuthStore();
+  const location = useLocation();
+
+  const navLinks = [
+    { label: "Home", href: ROUTES.HOME },
+    ...(isAuthenticated ? [{ label: "Dashboard", href: ROUTES.DASHBOARD }] : []),
+  ];
+
+  return (
+    <header className="sticky top-0 z-40 border-b bg-background/95 backdrop-blur supports-[backdrop-filter]:bg-background/60">
+      <div className="container mx-auto flex h-16 items-center justify-between px-4">
+        <div className="flex items-center gap-6">
+          <Link to="/" className="text-xl font-bold text-primary">
+            {appName}
+          </Link>
+          <nav className="hidden gap-4 md:flex" aria-label="Main navigation">
+            {navLinks.map((link) => (
+              <Link
+                key={link.href}
+                to={link.href}
+                className={cn(
+                  "text-sm font-medium transition-colors hover:text-primary",
+                  location.pathname === link.href ? "text-foreground" : "text-muted-foreground",
+                )}
+              >
+                {link.label}
+              </Link>
+            ))}
+          </nav>
+        </div>
+        <div className="flex items-center gap-2">
+          {isAuthenticated ? (
+            <>
+              <span className="text-sm text-muted-foreground">{user?.name || user?.email}</span>
+              <Button variant="outline" size="sm" onClick={logout}>
+                Logout
+              </Button>
+            </>
+          ) : (
+            <>
+              <Link to={ROUTES.LOGIN}>
+                <Button variant="ghost" size="sm">Login</Button>
+              </Link>
+              <Link to={ROUTES.REGISTER}>
+                <Button size="sm">Get Started</Button>
+              </Link>
+            </>
+          )}
+        </div>
+      </div>
+    </header>
+  );
+}
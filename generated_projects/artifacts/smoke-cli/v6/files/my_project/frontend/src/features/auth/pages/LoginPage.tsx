@@ -0,0 +1,30 @@
+import { Link, useNavigate } from "react-router-dom";
+import { LoginForm } from "../components/LoginForm";
+import { Card, CardHeader, CardTitle, CardDescription, CardContent, CardFooter } from "@shared/ui/Card";
+import { ROUTES } from "@core/constants";
+
+export default function LoginPage() {
+  const navigate = useNavigate();
+
+  return (
+    <div className="flex min-h-[80vh] items-center justify-center">
+      <Card className="w-full max-w-md">
+        <CardHeader className="text-center">
+          <CardTitle>Welcome Back</CardTitle>
+          <CardDescription>Sign in to your My Project account</CardDescription>
+        </CardHeader>
+        <CardContent>
+          <LoginForm onSuccess={() => navigate(ROUTES.DASHBOARD)} />
+        </CardContent>
+        <CardFooter className="justify-center">
+          <p className="text-sm text-muted-foreground">
+            Don&apos;t have an account?{" "}
+            <Link to={ROUTES.REGISTER} className="text-primary hover:underline">
+              Sign up
+            </Link>
+          </p>
+        </CardFooter>
+      </Card>
+    </div>
+  );
+}
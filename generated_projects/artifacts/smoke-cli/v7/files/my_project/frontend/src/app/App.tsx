@@ -0,0 +1,50 @@
+/**
+ * Application shell — composes all providers and routing.
+ * No business logic belongs here.
+ */
+import { Suspense, lazy } from "react";
+import { BrowserRouter, Routes, Route } from "react-router-dom";
+import { QueryProvider } from "@app/providers/QueryProvider";
+import { ThemeProvider } from "@app/providers/ThemeProvider";
+import { ErrorBoundaryProvider } from "@app/providers/ErrorBoundaryProvider";
+import { AppLayout } from "@app/layouts/AppLayout";
+import { ProtectedRoute } from "@app/routes/ProtectedRoute";
+import { LoadingScreen } from "@shared/ui/LoadingScreen";
+import { ROUTES } from "@core/constants";
+import { Toaster } from "sonner";
+
+// ── Lazy-loaded feature pages (route-based code splitting) ──
+const HomePage = lazy(() => import("@features/dashboard/pages/HomePage"));
+const NotFoundPage = lazy(() => import("@shared/components/NotFoundPage"));
+const LoginPage = lazy(() => import("@features/auth/pages/LoginPage"));
+const RegisterPage = lazy(() => import("@features/auth/pages/RegisterPage"));
+const CorePage = lazy(() => import("@features/core/pages/CorePage"));
+const DashboardPage = lazy(() => import("@features/dashboard/pages/DashboardPage"));
+const SettingsPage = lazy(() => import("@features/settings/pages/SettingsPage"));
+
+export function App() {
+  return (
+    <ErrorBoundaryProvider>
+      <ThemeProvider>
+        <QueryProvider>
+          <BrowserRouter>
+            <AppLayout>
+              <Suspense fallback={<LoadingScreen />}>
+                <Routes>
+                  <Route path={ROUTES.HOME} element={<HomePage />} />
+            <Route path={ROUTES.LOGIN} element={<LoginPage />} />
+            <Route path={ROUTES.REGISTER} element={<RegisterPage />} />
+            <Route path={ROUTES.CORE} element={<ProtectedRoute><CorePage /></ProtectedRoute>} />
+            <Route path={ROUTES.DASHBOARD} element={<ProtectedRoute><DashboardPage /></ProtectedRoute>} />
+            <Route path={ROUTES.SETTINGS} element={<ProtectedRoute><SettingsPage /></ProtectedRoute>} />
+                  <Route path="*" element={<NotFoundPage />} />
+                </Routes>
+              </Suspense>
+            </AppLayout>
+            <Toaster richColors position="top-right" />
+          </BrowserRouter>
+        </QueryProvider>
+      </ThemeProvider>
+    </ErrorBoundaryProvider>
+  );
+}
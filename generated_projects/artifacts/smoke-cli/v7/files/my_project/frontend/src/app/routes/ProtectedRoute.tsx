@@ -0,0 +1,29 @@
+/**
+ * Route guard — redirects unauthenticated users to login.
+ * Wraps any route that requires authentication.
+ */
+import { Navigate, useLocation } from "react-router-dom";
+import { useAuthStore } from "@features/auth";
+import { ROUTES } from "@core/constants";
+import { LoadingScreen } from "@shared/ui/LoadingScreen";
+import type { ReactNode } from "react";
+
+interface ProtectedRouteProps {
+  children: ReactNode;
+  requiredRole?: string;
+}
+
+export function ProtectedRoute({ children, requiredRole }: ProtectedRouteProps) {
+  const { isAuthenticated, isLoading } = useAuthStore();
+  const location = useLocation();
+
+  if (isLoading) {
+    return <LoadingScreen />;
+  }
+
+  if (!isAuthenticated) {
+    return <Navigate to={ROUTES.LOGIN} state={{ from: location }} replace />;
+  }
+
+  return <>{children}</>;
+}
@@ -0,0 +1,16 @@
+/**
+ * Application entry point.
+ *
+ * This file does ONE thing — mount the React tree.
+ * All providers, routing, and configuration live in app/.
+ */
+import React from "react";
+import ReactDOM from "react-dom/client";
+import { App } from "@app/App";
+import "@/styles/globals.css";
+
+ReactDOM.createRoot(document.getElementById("root")!).render(
+  <React.StrictMode>
+    <App />
+  </React.StrictMode>
+);
@@ -0,0 +1,65 @@
+/**
+ * Performance monitoring utilities.
+ *
+ * Tracks component render times, API latency, and
+ * provides tools for identifying performance bottlenecks.
+ */
+import { config } from "@core/config";
+import { logger } from "@core/logger";
+
+/**
+ * Measure execution time of an async operation.
+ */
+export async function measureAsync<T>(
+  label: string,
+  fn: () => Promise<T>,
+): Promise<T> {
+  if (!config.isDevelopment) return fn();
+
+  const start = performance.now();
+  try {
+    const result = await fn();
+    const duration = Math.round(performance.now() - start);
+    logger.debug(`[Perf] ${label}: ${duration}ms`, { feature: "performance", action: label });
+    return result;
+  } catch (error) {
+    const duration = Math.round(performance.now() - start);
+    logger.warn(`[Perf] ${label} failed after ${duration}ms`, { feature: "performance" });
+    throw error;
+  }
+}
+
+/**
+ * Measure sync execution time.
+ */
+export function measureSync<T>(label: string, fn: () => T): T {
+  if (!config.isDevelopment) return fn();
+
+  const start = performance.now();
+  const result = fn();
+  const duration = Math.round(performance.now() - start);
+  logger.debug(`[Perf] ${label}: ${duration}ms`, { feature: "performance" });
+  return result;
+}
+
+/**
+ * Report Web Vitals to logging system.
+ */
+export function reportWebVitals() {
+  if (typeof window === "undefined") return;
+
+  const observer = new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      logger.info(`[WebVital] ${entry.name}: ${Math.round(entry.startTime)}ms`, {
+        feature: "performance",
+        action: entry.name,
+      });
+    }
+  });
+
+  try {
+    observer.observe({ entryTypes: ["largest-contentful-paint", "first-input", "layout-shift"] });
+  } catch {
+    // Browser may not support all entry types
+  }
+}
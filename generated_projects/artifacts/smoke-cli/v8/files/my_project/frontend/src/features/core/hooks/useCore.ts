@@ -0,0 +1,30 @@
+import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { coreApi } from "../api/coreApi";
+import { QUERY_KEYS } from "@core/constants";
+import { toast } from "sonner";
+
+export function useCoreList() {
+  return useQuery({
+    queryKey: QUERY_KEYS.CORE.LIST,
+    queryFn: coreApi.getAll,
+  });
+}
+
+export function useCoreMutations() {
+  const queryClient = useQueryClient();
+  const invalidate = () => queryClient.invalidateQueries({ queryKey: QUERY_KEYS.CORE.LIST });
+
+  const create = useMutation({
+    mutationFn: coreApi.create,
+    onSuccess: () => { toast.success("Core created"); invalidate(); },
+    onError: () => toast.error("Failed to create core"),
+  });
+
+  const remove = useMutation({
+    mutationFn: coreApi.delete,
+    onSuccess: () => { toast.success("Core deleted"); invalidate(); },
+    onError: () => toast.error("Failed to delete core"),
+  });
+
+  return { create, remove };
+}
@@ -0,0 +1,32 @@
+/** Core application types shared across all features */
+
+export interface User {
+  id: string;
+  email: string;
+  name: string;
+  avatar_url?: string;
+  created_at: string;
+}
+
+export interface ApiResponse<T> {
+  data: T;
+  message?: string;
+}
+
+export interface PaginatedResponse<T> {
+  items: T[];
+  total: number;
+  page: number;
+  per_page: number;
+  total_pages: number;
+}
+
+export interface ApiErrorResponse {
+  detail: string;
+  status_code: number;
+}
+
+export interface SelectOption {
+  label: string;
+  value: string;
+}
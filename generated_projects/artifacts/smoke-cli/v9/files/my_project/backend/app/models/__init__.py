@@ -0,0 +1 @@
+"""SQLAlchemy models."""
@@ -0,0 +1,8 @@
+/**
+ * Auth feature — public API.
+ * Other features import ONLY from this file.
+ * No deep imports into auth internals.
+ */
+export { useAuthStore } from "./hooks/useAuthStore";
+export { useAuth } from "./hooks/useAuth";
+export type { AuthState, LoginCredentials, RegisterData } from "./types";
@@ -0,0 +1,11 @@
+import { api } from "@infra/http/apiClient";
+import { API_ENDPOINTS } from "@core/constants";
+import type { DashboardStats, Activity } from "../types";
+
+export const dashboardApi = {
+  getStats: () =>
+    api.get<DashboardStats>(API_ENDPOINTS.DASHBOARD.STATS),
+
+  getActivity: () =>
+    api.get<Activity[]>(API_ENDPOINTS.DASHBOARD.ACTIVITY),
+};